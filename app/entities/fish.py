@@ -8,21 +8,27 @@
 # - (b) Primitivas: polígonos (cauda e barbatanas)
 # - (c) Preenchimento: scanline_fill_gradiente
 # - Interpolação de cores: gradiente azul → branco → azul
+#
+# No jogo o peixe é rasterizado uma vez por cor (draw_fish)
+# e carimbado a cada quadro (draw_fish_sprite).
 # ═══════════════════════════════════════════════════════════════
 
 import math
 import assets.colors as color
-from engine.framebuffer import set_pixel
-from engine.math.auxiliary import interpolar_cor
+from engine.framebuffer import fill_span, gradiente_lut_paradas, set_pixels
 from engine.fill.scanline import scanline_fill_gradiente
-from engine.raster.line import bresenham, desenhar_poligono
+from engine.raster.line import bresenham_lote, desenhar_poligono
+from engine.sprite import sprites
+
+# Maior distância de um pixel do peixe ao centro (cauda e barbatanas)
+RAIO_PEIXE = 20
 
 def draw_fish(superficie, x, y, cor=color.FISH_BLUE):
     """
     Desenha um peixe com gradiente e detalhes anatômicos.
     
     REQUISITOS:
-    - (a) set_pixel: corpo oval desenhado pixel a pixel
+    - (a) set_pixel: corpo oval desenhado linha a linha (fill_span)
     - (b) Primitivas: desenhar_poligono para cauda/barbatanas
     - (c) Preenchimento: scanline_fill_gradiente
     
@@ -45,25 +51,20 @@ def draw_fish(superficie, x, y, cor=color.FISH_BLUE):
     corpo_y = y
     
     # Desenha corpo com gradiente (azul → branco → azul)
-    for dy in range(-corpo_altura // 2, corpo_altura // 2 + 1):
-        for dx in range(-corpo_largura // 2, corpo_largura // 2 + 1):
-            # Fórmula de elipse: (dx/a)² + (dy/b)² <= 1
-            a = corpo_largura // 2
-            b = corpo_altura // 2
-            if a > 0 and b > 0:
-                if (dx * dx) / (a * a) + (dy * dy) / (b * b) <= 1:
-                    # Gradiente vertical: azul no topo, branco no meio, azul embaixo
-                    t = (dy + b) / (2 * b) if b > 0 else 0.5
-                    # Cria gradiente simétrico (azul → branco → azul)
-                    if t < 0.5:
-                        t_grad = t * 2  # 0 → 1 (topo → meio)
-                    else:
-                        t_grad = (1 - t) * 2  # 1 → 0 (meio → base)
-                    
-                    cor_interpolada = interpolar_cor(cor, color.FISH_WHITE, t_grad)
-                    set_pixel(superficie, corpo_x + dx, corpo_y + dy, cor_interpolada)
+    a = corpo_largura // 2
+    b = corpo_altura // 2
+    # Gradiente vertical com três paradas: azul no topo, branco no meio,
+    # azul embaixo. Uma cor empacotada por linha (LUT em cache).
+    paradas = ((0.0, cor), (0.5, color.FISH_WHITE), (1.0, cor))
+    cores_linha = gradiente_lut_paradas(superficie, paradas, 2 * b + 1)[:, 0].tolist()
+    for dy in range(-b, b + 1):
+        # Fórmula de elipse: (dx/a)² + (dy/b)² <= 1 (intervalo contínuo na linha)
+        dxs = [dx for dx in range(-a, a + 1) if (dx * dx) / (a * a) + (dy * dy) / (b * b) <= 1]
+        if dxs:
+            fill_span(superficie, corpo_y + dy, corpo_x + dxs[0], corpo_x + dxs[-1], cores_linha[dy + b])
     
     # Contorno do corpo
+    xs, ys = [], []
     for dy in range(-corpo_altura // 2, corpo_altura // 2 + 1):
         for dx in range(-corpo_largura // 2, corpo_largura // 2 + 1):
             a = corpo_largura // 2
@@ -72,7 +73,8 @@ def draw_fish(superficie, x, y, cor=color.FISH_BLUE):
                 dist = (dx * dx) / (a * a) + (dy * dy) / (b * b)
                 # Contorno: pixels na borda da elipse
                 if 0.85 <= dist <= 1.0:
-                    set_pixel(superficie, corpo_x + dx, corpo_y + dy,color.FISH_OUTLINE)
+                    xs.append(corpo_x + dx); ys.append(corpo_y + dy)
+    set_pixels(superficie, xs, ys, color.FISH_OUTLINE)
     
     # Cauda (barbatana traseira)
     cauda_pontos = [
@@ -104,22 +106,46 @@ def draw_fish(superficie, x, y, cor=color.FISH_BLUE):
     # Olho
     olho_x = corpo_x + 4
     olho_y = corpo_y - 2
+    xs, ys, cores = [], [], []
     for dy in range(-2, 3):
         for dx in range(-2, 3):
             if dx * dx + dy * dy <= 4:
+                xs.append(olho_x + dx); ys.append(olho_y + dy)
                 if dx * dx + dy * dy <= 1:
-                    set_pixel(superficie, olho_x + dx, olho_y + dy, (255, 255, 255))  # Branco
+                    cores.append((255, 255, 255))  # Branco
                 else:
-                    set_pixel(superficie, olho_x + dx, olho_y + dy, (0, 0, 0))  # Preto
+                    cores.append((0, 0, 0))  # Preto
+    set_pixels(superficie, xs, ys, cores)
+
+
+def draw_fish_sprite(superficie, x, y, cor=color.FISH_BLUE):
+    """
+    Desenha o peixe carimbando o sprite pré-rasterizado por draw_fish.
+
+    O sprite de cada cor é desenhado uma única vez com as primitivas
+    de set_pixel (ver engine.sprite); depois, cada quadro é só uma
+    cópia mascarada. O resultado é idêntico ao de draw_fish.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer
+        x, y: posição central do peixe (inteiros)
+        cor: cor base do peixe (padrão: azul)
+    """
+    sprites.desenhar(superficie, draw_fish, x, y, cor, raio=RAIO_PEIXE)
 
 
 def draw_waves_around_fish(superficie, x, y, offset_y):
     """
     Desenha pequenas ondas ao redor do peixe, simulando movimento na água.
     offset_y: offset vertical do peixe (para sincronizar com animação)
+
+    Os segmentos de todos os anéis são juntados e rasterizados de uma
+    vez com bresenham_lote.
     """
     # Raio das ondas
     raio_onda = 25
+    largura, altura = superficie.get_width(), superficie.get_height()
+    segmentos = []
     
     # Desenha círculos concêntricos (ondas)
     for r in range(raio_onda - 8, raio_onda + 1, 2):
@@ -134,11 +160,14 @@ def draw_waves_around_fish(superficie, x, y, offset_y):
             py = int(y + (r + variacao) * math.sin(angulo))
             pontos_onda.append((px, py))
         
-        # Desenha a onda como linhas conectadas
+        # A onda é formada por linhas conectadas
         for i in range(len(pontos_onda)):
             x0, y0 = pontos_onda[i]
             x1, y1 = pontos_onda[(i + 1) % len(pontos_onda)]
             # Só desenha se estiver dentro da tela
-            if 0 <= x0 < superficie.get_width() and 0 <= y0 < superficie.get_height():
-                bresenham(superficie, x0, y0, x1, y1, color.WAVE_COLOR)
+            if 0 <= x0 < largura and 0 <= y0 < altura:
+                segmentos.append((x0, y0, x1, y1))
+
+    if segmentos:
+        bresenham_lote(superficie, segmentos, color.WAVE_COLOR)
 
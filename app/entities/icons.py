@@ -14,7 +14,7 @@
 # ═══════════════════════════════════════════════════════════════
 
 import assets.colors as color
-from engine.math.auxiliary import interpolar_cor
+from engine.framebuffer import gradiente_lut_paradas
 from engine.fill.scanline import scanline_fill
 from engine.raster.line import desenhar_poligono
 from app.scenes.auxiliary_functions import _set_pixel_scaled
@@ -37,16 +37,14 @@ def draw_fish_icon(superficie, x, y, tamanho=8, scale=1):
     # Corpo pequeno (elipse)
     a = tamanho // 2
     b = tamanho // 3
-    for dy in range(-b, b + 1):
-        for dx in range(-a, a + 1):
-            if a > 0 and b > 0:
+    if a > 0 and b > 0:
+        # Gradiente azul → branco → azul, uma cor por linha
+        paradas = ((0.0, color.FISH_BLUE), (0.5, color.FISH_WHITE), (1.0, color.FISH_BLUE))
+        cores_linha = gradiente_lut_paradas(superficie, paradas, 2 * b + 1)[:, 0].tolist()
+        for dy in range(-b, b + 1):
+            cor = cores_linha[dy + b]
+            for dx in range(-a, a + 1):
                 if (dx * dx) / (a * a) + (dy * dy) / (b * b) <= 1:
-                    t = (dy + b) / (2 * b) if b > 0 else 0.5
-                    if t < 0.5:
-                        t_grad = t * 2
-                    else:
-                        t_grad = (1 - t) * 2
-                    cor = interpolar_cor(color.FISH_BLUE, color.FISH_WHITE, t_grad)
                     _set_pixel_scaled(superficie, x, y, dx, dy, cor, scale)
     
     # Cauda
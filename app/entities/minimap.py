@@ -4,7 +4,7 @@
 # Sistema de minimapa no canto superior direito.
 #
 # Demonstra os seguintes requisitos:
-# - (a) set_pixel: todo o desenho usa apenas set_pixel
+# - (a) set_pixel: todo o desenho usa apenas set_pixel/set_pixels
 # - (f) Viewport: mostra área visível da câmera no mundo
 # - Visualização top-down do mundo inteiro em escala reduzida
 #
@@ -15,7 +15,8 @@
 # - Pontos cinza: obstáculos
 # ═══════════════════════════════════════════════════════════════
 
-from engine.framebuffer import set_pixel
+import numpy as np
+from engine.framebuffer import set_pixel, set_pixels, clear_rect
 import assets.colors as color
 from random import randint, seed
 
@@ -56,16 +57,16 @@ def draw_minimap(
     MAP_Y = 15
 
     # ===== FUNDO ESCURO + ESTRELAS =====
-    for y in range(MAP_H):
-        for x in range(MAP_W):
-            set_pixel(superficie, MAP_X + x, MAP_Y + y, (15, 25, 40))
+    clear_rect(superficie, MAP_X, MAP_Y, MAP_W, MAP_H, (15, 25, 40))
 
     # Pequenas estrelas aleatórias
+    xs, ys, cores = [], [], []
     for _ in range(80):
         sx = randint(0, MAP_W-1)
         sy = randint(0, MAP_H-1)
         brilho = randint(180, 255)
-        set_pixel(superficie, MAP_X + sx, MAP_Y + sy, (brilho, brilho, 255))
+        xs.append(MAP_X + sx); ys.append(MAP_Y + sy); cores.append((brilho, brilho, 255))
+    set_pixels(superficie, xs, ys, cores)
 
     # Escala mundo → minimapa
     scale_x = MAP_W / WORLD_WIDTH
@@ -78,12 +79,14 @@ def draw_minimap(
     vh = int(HEIGHT * scale_y)
 
     # Contorno da câmera
+    xs, ys = [], []
     for i in range(vw):
-        set_pixel(superficie, MAP_X + vx + i, MAP_Y + vy, (255, 255, 255))
-        set_pixel(superficie, MAP_X + vx + i, MAP_Y + vy + vh, (255, 255, 255))
+        xs += [MAP_X + vx + i, MAP_X + vx + i]
+        ys += [MAP_Y + vy, MAP_Y + vy + vh]
     for i in range(vh):
-        set_pixel(superficie, MAP_X + vx, MAP_Y + vy + i, (255, 255, 255))
-        set_pixel(superficie, MAP_X + vx + vw, MAP_Y + vy + i, (255, 255, 255))
+        xs += [MAP_X + vx, MAP_X + vx + vw]
+        ys += [MAP_Y + vy + i, MAP_Y + vy + i]
+    set_pixels(superficie, xs, ys, (255, 255, 255))
 
     # ===== PEIXE =====
     px = int(fish_x * scale_x)
@@ -95,22 +98,23 @@ def draw_minimap(
             set_pixel(superficie, MAP_X + px + dx, MAP_Y + py + dy, (180, 220, 255))
 
     # ===== OBSTÁCULOS =====
+    xs, ys, cores = [], [], []
     for obs in obstaculos:
         ox = int(obs[0] * scale_x)
         oy = int(obs[1] * scale_y)
         # Obstáculo mais suave
-        set_pixel(superficie, MAP_X + ox, MAP_Y + oy, (120, 120, 120))
+        xs.append(MAP_X + ox); ys.append(MAP_Y + oy); cores.append((120, 120, 120))
         for dx in [-1, 0, 1]:
             for dy in [-1, 0, 1]:
                 if dx == 0 and dy == 0:
                     continue
-                set_pixel(superficie, MAP_X + ox + dx, MAP_Y + oy + dy, (80, 80, 80))
+                xs.append(MAP_X + ox + dx); ys.append(MAP_Y + oy + dy); cores.append((80, 80, 80))
+    set_pixels(superficie, xs, ys, cores)
 
     # ===== JANGADA =====
     rx = int(raft_x * scale_x)
     ry = int(raft_y * scale_y)
-    for dy in range(-2, 3):
-        for dx in range(-2, 3):
-            set_pixel(superficie, MAP_X + rx + dx, MAP_Y + ry + dy, (255, 255, 255))
+    jangada_y, jangada_x = np.mgrid[-2:3, -2:3]
+    set_pixels(superficie, MAP_X + rx + jangada_x.ravel(), MAP_Y + ry + jangada_y.ravel(), (255, 255, 255))
     # Pequeno triângulo para indicar direção (opcional)
     set_pixel(superficie, MAP_X + rx, MAP_Y + ry - 3, (255, 255, 255))
\ No newline at end of file
@@ -4,15 +4,21 @@
 # Obstáculos que o jogador deve desviar.
 #
 # Demonstra o seguinte requisito:
-# - (a) set_pixel: todo o desenho usa apenas set_pixel
+# - (a) set_pixel: todo o desenho usa apenas set_pixel/set_pixels
 #
 # Tipos de obstáculos:
 # 1. Rocha (cinza com gradiente radial)
 # 2. Alga marinha (verde ondulante)
 # 3. Coral (laranja ramificado)
+#
+# No jogo cada tipo/tamanho é rasterizado uma vez e
+# carimbado a cada quadro (draw_obstacle_sprite).
 # ═══════════════════════════════════════════════════════════════
 
-from engine.framebuffer import set_pixel
+import numpy as np
+from engine.framebuffer import set_pixels
+from engine.math.auxiliary import interpolar_cores
+from engine.sprite import sprites
 
 def draw_obstacle(superficie, x, y, tamanho=14, tipo=None):
     """
@@ -44,6 +50,24 @@ def draw_obstacle(superficie, x, y, tamanho=14, tipo=None):
         draw_coral(superficie, x, y, tamanho)
 
 
+def draw_obstacle_sprite(superficie, x, y, tamanho=14, tipo=None):
+    """
+    Desenha um obstáculo carimbando o sprite pré-rasterizado.
+
+    Cada combinação de tipo e tamanho é desenhada uma única vez pelas
+    funções abaixo (ver engine.sprite); depois, cada quadro é só uma
+    cópia mascarada. O resultado é idêntico ao de draw_obstacle.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer
+        x, y: posição central do obstáculo (inteiros)
+        tamanho: raio aproximado do obstáculo
+        tipo: tipo de obstáculo (0=rocha, 1=alga, 2=coral)
+    """
+    desenhar = (draw_rock, draw_seaweed, draw_coral)[min(tipo or 0, 2)]
+    sprites.desenhar(superficie, desenhar, x, y, tamanho, raio=tamanho + 2)
+
+
 def draw_rock(superficie, x, y, tamanho=14):
     """
     Desenha uma rocha com gradiente radial para volume.
@@ -52,20 +76,23 @@ def draw_rock(superficie, x, y, tamanho=14):
     
     Técnica: gradiente radial baseado em distância euclidiana.
     Efeito visual: rocha com volume (claro no centro, escuro nas bordas).
+
+    A máscara do disco e as cores são calculadas para todos os pixels
+    de uma vez (NumPy) e escritas com set_pixels.
     """
-    for dy in range(-tamanho, tamanho + 1):
-        for dx in range(-tamanho, tamanho + 1):
-            dist = dx*dx + dy*dy
-            if dist <= tamanho*tamanho:
-                # Gradiente radial para volume
-                intensidade = 1.0 - (dist / (tamanho*tamanho))
-                # Cinza claro no centro, cinza escuro nas bordas
-                base_cor = int(100 + intensidade * 30)
-                cor = (base_cor, base_cor, base_cor + 10)
-                set_pixel(superficie, x + dx, y + dy, cor)
-            elif dist <= (tamanho+2)*(tamanho+2):
-                # Contorno mais escuro
-                set_pixel(superficie, x + dx, y + dy, (40, 40, 50))
+    dy, dx = np.mgrid[-tamanho:tamanho + 1, -tamanho:tamanho + 1]
+    dist = dx*dx + dy*dy
+    dentro = dist <= tamanho*tamanho
+    contorno = ~dentro & (dist <= (tamanho+2)*(tamanho+2))
+
+    # Gradiente radial para volume
+    intensidade = 1.0 - (dist[dentro] / (tamanho*tamanho))
+    # Cinza claro no centro, cinza escuro nas bordas (todas as cores de uma vez)
+    cores = interpolar_cores((100, 100, 110), (130, 130, 140), intensidade, superficie)
+    set_pixels(superficie, x + dx[dentro], y + dy[dentro], cores)
+
+    # Contorno mais escuro
+    set_pixels(superficie, x + dx[contorno], y + dy[contorno], (40, 40, 50))
 
 
 def draw_seaweed(superficie, x, y, tamanho=14):
@@ -78,6 +105,7 @@ def draw_seaweed(superficie, x, y, tamanho=14):
     Efeito visual: alga com movimento/ondulação estática.
     """
     import math
+    xs, ys, cores = [], [], []
     for dy in range(-tamanho, tamanho + 1):
         for dx in range(-tamanho, tamanho + 1):
             # Forma ondulante (elipse horizontal com variação)
@@ -93,10 +121,12 @@ def draw_seaweed(superficie, x, y, tamanho=14):
                 if dx % 3 == 0:
                     cor = (60, verde_base + 30, 100)
                 
-                set_pixel(superficie, x + dx, y + dy, cor)
+                xs.append(x + dx); ys.append(y + dy); cores.append(cor)
             elif abs(dx) <= largura//2 and abs(dy) <= altura + 2:
                 # Contorno verde mais escuro
-                set_pixel(superficie, x + dx, y + dy, (20, 80, 50))
+                xs.append(x + dx); ys.append(y + dy); cores.append((20, 80, 50))
+
+    set_pixels(superficie, xs, ys, cores)
 
 
 def draw_coral(superficie, x, y, tamanho=14):
@@ -107,31 +137,23 @@ def draw_coral(superficie, x, y, tamanho=14):
     
     Técnica: tronco central + ramificações diagonais.
     Efeito visual: estrutura orgânica ramificada.
+
+    A máscara do coral e o gradiente dos ramos são calculados para
+    todos os pixels de uma vez (NumPy) e escritos com set_pixels.
     """
-    import math
-    for dy in range(-tamanho, tamanho + 1):
-        for dx in range(-tamanho, tamanho + 1):
-            # Tronco principal (centro)
-            if abs(dx) <= 2 and dy >= -tamanho:
-                cor = (200, 100, 40)
-                set_pixel(superficie, x + dx, y + dy, cor)
-            
-            # Ramificações diagonais (padrão coral)
-            elif abs(dy) < tamanho:
-                # Lado esquerdo
-                if dx <= -3 and dx >= -(tamanho//2) and dy >= (dx // 2) - 2:
-                    dist_ramo = abs(dx) + abs(dy)
-                    if dist_ramo < tamanho:
-                        intensidade = 1.0 - (dist_ramo / tamanho)
-                        cor_val = int(200 - intensidade * 50)
-                        cor = (cor_val, int(100 + intensidade * 30), int(40 + intensidade * 20))
-                        set_pixel(superficie, x + dx, y + dy, cor)
-                
-                # Lado direito
-                elif dx >= 3 and dx <= (tamanho//2) and dy >= (-dx // 2) - 2:
-                    dist_ramo = abs(dx) + abs(dy)
-                    if dist_ramo < tamanho:
-                        intensidade = 1.0 - (dist_ramo / tamanho)
-                        cor_val = int(200 - intensidade * 50)
-                        cor = (cor_val, int(100 + intensidade * 30), int(40 + intensidade * 20))
-                        set_pixel(superficie, x + dx, y + dy, cor)
+    dy, dx = np.mgrid[-tamanho:tamanho + 1, -tamanho:tamanho + 1]
+
+    # Tronco principal (centro)
+    tronco = np.abs(dx) <= 2
+    set_pixels(superficie, x + dx[tronco], y + dy[tronco], (200, 100, 40))
+
+    # Ramificações diagonais (padrão coral), fora do tronco
+    dist_ramo = np.abs(dx) + np.abs(dy)
+    esquerda = (dx <= -3) & (dx >= -(tamanho // 2)) & (dy >= (dx // 2) - 2)
+    direita = (dx >= 3) & (dx <= tamanho // 2) & (dy >= (-dx // 2) - 2)
+    ramos = ~tronco & (np.abs(dy) < tamanho) & (esquerda | direita) & (dist_ramo < tamanho)
+
+    # Intensidade 1 no centro → (150, 130, 60); 0 nas pontas → (200, 100, 40)
+    intensidade = 1.0 - (dist_ramo[ramos] / tamanho)
+    cores = interpolar_cores((200, 100, 40), (150, 130, 60), intensidade, superficie)
+    set_pixels(superficie, x + dx[ramos], y + dy[ramos], cores)
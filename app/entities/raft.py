@@ -8,14 +8,32 @@
 # - (c) Preenchimento: scanline_fill_gradiente
 # - (d) Transformações: rotação em torno de pivô ao colidir
 # - (e) Animação: rotação 360° em colisão
+#
+# No jogo o corpo e o chapéu são rasterizados uma vez e
+# carimbados a cada quadro (draw_raft_sprite). O corpo
+# girado é guardado em ANGULOS_JANGADA ângulos fixos,
+# calculados na primeira vez que cada um aparece.
 # ═══════════════════════════════════════════════════════════════
 
+import math
 import app.constants as constant
 import assets.colors as color
 from engine.geometry.cohen_sutherland import draw_line
 from engine.raster.line import bresenham, desenhar_poligono
 from engine.geometry.transform import rotacionar_pontos_em_torno_de
 from engine.fill.scanline import scanline_fill_gradiente, scanline_fill
+from engine.sprite import CacheSprites, sprites
+
+# Maior distância de um pixel do corpo (mesmo girado) ao canto superior esquerdo
+RAIO_JANGADA = constant.COMPRIMENTO + constant.RAFT_LARGURA // 2
+
+# Ângulos guardados para o giro da colisão: passos de 6°, os mesmos
+# dos 60 quadros da animação
+ANGULOS_JANGADA = 60
+
+# Corpos girados, em cache próprio (não disputam espaço com peixe e
+# obstáculos) e limitado a 4 MiB: um giro completo ocupa ~1,8 MiB
+quadros_jangada = CacheSprites(limite=4 * ANGULOS_JANGADA, limite_bytes=4 * 1024 * 1024)
 
 def draw_raft(superficie, x, y, viewport, angle=0):
     """
@@ -37,6 +55,39 @@ def draw_raft(superficie, x, y, viewport, angle=0):
         viewport: tupla (xmin, ymin, w, h) para clipping
         angle: ângulo de rotação em radianos (0 = sem rotação)
     """
+    draw_raft_body(superficie, x, y, angle)
+    _draw_tabuas(superficie, x, y, viewport)
+    draw_raft_hat(superficie, x, y)
+
+
+def draw_raft_sprite(superficie, x, y, viewport, angle=0):
+    """
+    Desenha a jangada carimbando sprites pré-rasterizados.
+
+    Corpo e chapéu são desenhados uma única vez com as primitivas de
+    set_pixel (ver engine.sprite) e depois só copiados com máscara. O
+    ângulo é arredondado para um de ANGULOS_JANGADA ângulos fixos
+    (quantizar_angulo), então cada quadro do giro da colisão é
+    rasterizado só na primeira colisão e reaproveitado nas seguintes.
+    As tábuas dependem do viewport e continuam sendo desenhadas a cada
+    quadro. Sem rotação, o resultado é idêntico ao de draw_raft.
+
+    Args:
+        superficie, x, y, viewport, angle: como em draw_raft
+    """
+    quadros_jangada.desenhar(superficie, draw_raft_body, x, y, quantizar_angulo(angle), raio=RAIO_JANGADA)
+    _draw_tabuas(superficie, x, y, viewport)
+    sprites.desenhar(superficie, draw_raft_hat, x, y, raio=RAIO_JANGADA)
+
+
+def quantizar_angulo(angle, passos=ANGULOS_JANGADA):
+    """Arredonda o ângulo (radianos) para o múltiplo de 2π/passos mais próximo, em [0, 2π)."""
+    k = round(angle / (2 * math.pi) * passos) % passos
+    return k / passos * 2 * math.pi
+
+
+def draw_raft_body(superficie, x, y, angle=0):
+    """Corpo da jangada (gradiente + contorno), girado em torno do centro."""
     largura_base = constant.RAFT_LARGURA
     comprimento = constant.COMPRIMENTO
 
@@ -59,11 +110,21 @@ def draw_raft(superficie, x, y, viewport, angle=0):
     scanline_fill_gradiente(superficie, corpo, color.WOOD_DARK, color.WOOD_LIGHT, direcao="vertical")
     desenhar_poligono(superficie, corpo, color.DETAIL_COLOR)
 
-    # Linhas representando tábuas
+
+def _draw_tabuas(superficie, x, y, viewport):
+    """Linhas representando tábuas (recortadas pelo viewport)."""
+    largura_base = constant.RAFT_LARGURA
+    comprimento = constant.COMPRIMENTO
     for i in range(1, 3):
         y_tabua = y + i * (comprimento // 3)
         draw_line(superficie, x + 2, y_tabua, x + largura_base - 2, y_tabua, color.DETAIL_COLOR, viewport=viewport)
 
+
+def draw_raft_hat(superficie, x, y):
+    """Jangadeiro: chapéu cônico no centro da jangada (não gira)."""
+    cx = x + constant.RAFT_LARGURA // 2
+    cy = y + constant.COMPRIMENTO // 2
+
     # Jangadeiro: chapéu cônico simples no centro do retângulo
     chapeu = [
         (cx - 6, cy - 4),
@@ -13,9 +13,11 @@
 # - Fonte 5x7 baseada em pixels
 # - Funções de texto e botões
 # - Funções auxiliares (clique, pixel escalado, randint)
+# - Painel de desempenho (tempo por etapa do quadro)
 # ═══════════════════════════════════════════════════════════════
 
-from engine.framebuffer import set_pixel
+from engine.framebuffer import clear_rect, fill_span, mapear_cor, set_pixel
+from engine.profiler import ORCAMENTO_MS
 from engine.fill.scanline import scanline_fill
 from engine.raster.line import desenhar_poligono
 
@@ -115,6 +117,7 @@ def draw_simple_text(superficie, texto, x, y, cor, scale=1):
         '/': ['  X', '  X', ' X ', 'X  ', 'X  '],  
     }
     
+    cor = mapear_cor(superficie, cor)  # uma conversão para o texto inteiro
     dx = 0
     for c in texto:
         if c in chars:
@@ -132,6 +135,7 @@ def draw_text(surf, texto, x, y, cor, scale=2):
     
     REQUISITO: (a) Acesso direto por pixel
     """
+    cor = mapear_cor(surf, cor)  # uma conversão para o texto inteiro
     dx = 0
     for c in texto:
         if c.upper() in _FONT:
@@ -195,6 +199,58 @@ def _set_pixel_scaled(superficie, base_x, base_y, local_x, local_y, cor, scale):
             )
 
 
+# ─── Painel de Desempenho ───
+def draw_profiler_overlay(superficie, perfil, x=10, y=10, memoria=None, aviso=None):
+    """
+    Desenha o painel de desempenho de um FrameProfiler.
+
+    Mostra a média móvel do quadro (ms e FPS), a média de cada etapa e
+    um gráfico com o tempo total dos últimos quadros: barras verdes
+    cabem no orçamento de 60 FPS, vermelhas estouram, e a linha amarela
+    marca os 16,7 ms.
+
+    Args:
+        superficie: FrameBuffer ou pygame.Surface
+        perfil: engine.profiler.FrameProfiler
+        x, y: canto superior esquerdo do painel
+        memoria: dict opcional nome → bytes (ex.: caches de sprites),
+            listado abaixo do gráfico em KB
+        aviso: texto opcional na última linha (ex.: confirmação do CSV)
+    """
+    medias = perfil.medias()
+    memoria = memoria or {}
+    largura_barra = 3
+    largura = max(perfil.janela * largura_barra, 6 * 22) + 16
+    altura_grafico = 50
+    altura = 8 + 10 * (len(medias) + 1) + altura_grafico + 10 + 10 * len(memoria) + (10 if aviso else 0)
+
+    clear_rect(superficie, x, y, largura, altura, (10, 10, 30))
+
+    media = perfil.media_quadro()
+    fps = 1000 / media if media else 0
+    draw_text(superficie, f"QUADRO {media:6.2f} MS {fps:5.0f} FPS", x + 8, y + 6, (255, 215, 0), scale=1)
+    linha_y = y + 16
+    for nome, ms in medias.items():
+        draw_text(superficie, f"{nome[:12]:<12} {ms:6.2f}", x + 8, linha_y, (240, 240, 240), scale=1)
+        linha_y += 10
+
+    # Gráfico: escala de 0 a 2x o orçamento
+    base = linha_y + 4 + altura_grafico
+    for i, total in enumerate(perfil.quadros):
+        h = min(int(total / (2 * ORCAMENTO_MS) * altura_grafico), altura_grafico)
+        cor = (80, 200, 120) if total <= ORCAMENTO_MS else (220, 70, 70)
+        clear_rect(superficie, x + 8 + i * largura_barra, base - h, largura_barra - 1, h, cor)
+    limite = base - altura_grafico // 2
+    fill_span(superficie, limite, x + 8, x + 8 + perfil.janela * largura_barra - 1, (255, 215, 0))
+
+    linha_y = base + 6
+    for nome, total in memoria.items():
+        draw_text(superficie, f"{nome[:12]:<12} {total / 1024:6.0f} KB", x + 8, linha_y, (160, 200, 255), scale=1)
+        linha_y += 10
+    if aviso:
+        draw_text(superficie, aviso, x + 8, linha_y, (80, 200, 120), scale=1)
+
+
 # Semente inicial interna
 _seed = 123456789  # qualquer número inicial
 
@@ -11,6 +11,7 @@
 # - (d) Transformações: rotação da jangada ao colidir
 # - (e) Animação: rotação 360°, peixe balançando, HUD pulsante
 # - (f) Viewport: câmera segue jangada em mundo grande
+#   (grafo de cena: entidades são filhas do nó da câmera)
 # - (g) Clipping: minimapa usa Cohen-Sutherland
 # - (i) Interação: controle WASD do jogador
 # - (j) Menu: transição para game over e vitória
@@ -23,11 +24,17 @@
 # - Minimapa mostra mundo inteiro
 # - Vitória: 30 pontos
 # - Game over: 0 vidas
+#
+# Desempenho:
+# - F3 mostra/oculta o painel com o tempo de cada etapa
+#   e a memória dos caches de sprites
+# - F4 exporta o tempo de cada quadro em CSV
 # ═══════════════════════════════════════════════════════════════
 
 import pygame
 import sys
 import math
+from contextlib import nullcontext
 import assets.colors as color
 import app.constants as constant
 import app.entities.fish as fish
@@ -35,11 +42,207 @@ import app.entities.obstacle as obstacle
 import app.entities.icons as icon
 import app.entities.raft as raft
 import app.entities.minimap as minimap
-from app.scenes.auxiliary_functions import draw_simple_text, randint
+from app.scenes.auxiliary_functions import draw_profiler_overlay, draw_simple_text, randint
 from engine.collision import check_collision_raft_obstacle, check_collision_raft_fish
 from app.scenes.game_over import run_game_over
 from app.scenes.victory import run_victory
 from assets.music_manager import music_manager
+from engine.framebuffer import FrameBuffer, clear_color
+from engine.geometry.scene_graph import NoCena
+from engine.profiler import FrameProfiler
+from engine.sprite import sprites
+
+# Arquivo gravado pela tecla F4
+ARQUIVO_PERFIL = "perfil_quadros.csv"
+
+# ─── Mundo ───
+def gerar_obstaculos(fish_x, fish_y_base, world_width, world_height, por_tipo=5):
+    """
+    Sorteia as posições dos obstáculos no mundo.
+
+    Gera `por_tipo` obstáculos de cada tipo (0=rocha, 1=alga, 2=coral),
+    mantendo distância mínima de 80 px do peixe e entre si.
+
+    Returns:
+        lista de [x, y, tipo] em coordenadas do mundo
+    """
+    obstaculos = []
+    for tipo in range(3):  # 0=rocha, 1=alga, 2=coral
+        for _ in range(por_tipo):
+            while True:
+                ox = randint(100, world_width - 100)
+                oy = randint(100, world_height - 100)
+                if abs(ox - fish_x) < 80 and abs(oy - fish_y_base) < 80:
+                    continue
+                if any(abs(ox - obs[0]) < 80 and abs(oy - obs[1]) < 80 for obs in obstaculos):
+                    continue
+                obstaculos.append([ox, oy, tipo])
+                break
+    return obstaculos
+
+
+def calcular_viewport(raft_x, raft_y, largura, altura, world_width, world_height):
+    """
+    Centraliza a câmera na jangada, limitada às bordas do mundo.
+
+    Returns:
+        (camera_x, camera_y, largura, altura)
+    """
+    camera_x = raft_x - largura // 2
+    camera_y = raft_y - altura // 2
+
+    camera_x = max(0, min(world_width - largura, camera_x))
+    camera_y = max(0, min(world_height - altura, camera_y))
+
+    return (camera_x, camera_y, largura, altura)
+
+
+def criar_cena(obstaculos):
+    """
+    Monta o grafo de cena do gameplay.
+
+    A câmera é a raiz e guarda o deslocamento do viewport; jangada,
+    peixe e obstáculos são filhos dela, posicionados em coordenadas do
+    mundo. O corpo do peixe é filho do peixe, deslocado só pelo
+    balanço vertical, enquanto as ondas ficam na base.
+
+    Returns:
+        dict com os nós "camera", "jangada", "peixe", "corpo_peixe" e
+        "obstaculos" (lista na mesma ordem de `obstaculos`)
+    """
+    camera = NoCena("camera")
+    peixe = NoCena("peixe", pai=camera)
+    return {
+        "camera": camera,
+        "jangada": NoCena("jangada", pai=camera),
+        "peixe": peixe,
+        "corpo_peixe": NoCena("corpo_peixe", pai=peixe),
+        "obstaculos": [NoCena(f"obstaculo{i}", obs[0], obs[1], pai=camera) for i, obs in enumerate(obstaculos)],
+    }
+
+
+# ─── Desenho do Quadro ───
+def draw_frame(
+    superficie, cores,
+    viewport, mundo,
+    raft_x, raft_y, raft_angle,
+    fish_x, fish_y_base, fish_y, fish_animation_offset,
+    obstaculos, pontos, vidas, hud_scale,
+    profiler=None, cena=None
+):
+    """
+    Desenha um quadro completo do gameplay (mundo → viewport + HUD).
+
+    Não lê eventos nem altera o estado do jogo, então pode ser usada
+    tanto pelo loop principal quanto pela renderização headless.
+
+    Args:
+        superficie: FrameBuffer (ou pygame.Surface) do tamanho da tela
+        cores: paleta empacotada (assets.colors.empacotadas)
+        viewport: (camera_x, camera_y, largura, altura) da câmera no mundo
+        mundo: (largura, altura) do mundo
+        raft_x, raft_y, raft_angle: posição no mundo e rotação da jangada
+        fish_x, fish_y_base, fish_y: posição do peixe (base e animada)
+        fish_animation_offset: fase da animação das ondas do peixe
+        obstaculos: lista de [x, y, tipo] no mundo
+        pontos, vidas: valores do HUD
+        hud_scale: escala do HUD (3 durante o efeito de reação, senão 2)
+        profiler: FrameProfiler opcional; cada entidade vira uma etapa medida
+        cena: grafo de cena de criar_cena(obstaculos), reaproveitado entre
+            quadros (se None, é criado para este quadro)
+    """
+    camera_x, camera_y, WIDTH, HEIGHT = viewport
+    WORLD_WIDTH, WORLD_HEIGHT = mundo
+    etapa = profiler.etapa if profiler is not None else (lambda nome: nullcontext())
+
+    # Posições no mundo → nós; a tela sai da matriz composta da câmera.
+    # Nós que não mudaram mantêm as matrizes em cache.
+    if cena is None:
+        cena = criar_cena(obstaculos)
+    cena["camera"].mover_para(-camera_x, -camera_y)
+    cena["jangada"].mover_para(raft_x, raft_y)
+    cena["peixe"].mover_para(fish_x, fish_y_base)
+    cena["corpo_peixe"].mover_para(0, fish_y - fish_y_base)
+    for obs, no in zip(obstaculos, cena["obstaculos"]):
+        no.mover_para(obs[0], obs[1])
+
+    with etapa("limpar"):
+        clear_color(superficie, cores.SEA_COLOR)
+
+    with etapa("ondas"):
+        onda_x, onda_y = cena["peixe"].posicao()
+        fish.draw_waves_around_fish(
+            superficie,
+            int(onda_x),
+            int(onda_y),
+            fish_animation_offset
+        )
+
+    with etapa("peixe"):
+        peixe_x, peixe_y = cena["corpo_peixe"].posicao()
+        fish.draw_fish_sprite(
+            superficie,
+            int(peixe_x),
+            int(peixe_y)
+        )
+
+    with etapa("obstaculos"):
+        for obs, no in zip(obstaculos, cena["obstaculos"]):
+            obs_x, obs_y = no.posicao()
+            obstacle.draw_obstacle_sprite(
+                superficie,
+                int(obs_x),
+                int(obs_y),
+                tipo=obs[2]
+            )
+
+    with etapa("jangada"):
+        jangada_x, jangada_y = cena["jangada"].posicao()
+        raft.draw_raft_sprite(
+            superficie,
+            int(jangada_x),
+            int(jangada_y),
+            viewport,
+            angle=raft_angle
+        )
+
+    with etapa("minimapa"):
+        minimap.draw_minimap(
+            superficie,
+            raft_x, raft_y,
+            fish_x, fish_y_base,
+            obstaculos,
+            camera_x, camera_y,
+            WORLD_WIDTH, WORLD_HEIGHT,
+            WIDTH, HEIGHT
+        )
+
+    with etapa("hud"):
+        draw_hud(superficie, WIDTH, pontos, vidas, hud_scale)
+
+
+def draw_hud(superficie, largura, pontos, vidas, hud_scale):
+    """Desenha o HUD centralizado no topo da tela: pontos e vidas com ícones."""
+    # ===== HUD CENTRALIZADO (PARTE SUPERIOR) =====
+    center_x = largura // 2
+
+    # Definir posição base alinhada
+    icon_x = center_x - 50  # Posição X dos ícones
+    text_x = center_x - 10  # Posição X do texto (mais próximo)
+
+    # Pontos com ícone (primeira linha)
+    # Peixe: desenha de y-b até y+b, com tamanho=8, b=8//3=2
+    # Centro real está em y, ajustando texto para alinhar melhor
+    hud_fish_y = 18
+    icon.draw_fish_icon(superficie, icon_x, hud_fish_y, tamanho=8, scale=hud_scale)
+    draw_simple_text(superficie, f"{pontos}/5", text_x, hud_fish_y - 3, (255, 215, 0), scale=hud_scale)
+
+    # Vidas com ícone (segunda linha, alinhado)
+    # X diminuído e movido para esquerda para alinhar com o peixe
+    heart_y = 40
+    icon.draw_heart_icon(superficie, icon_x - 5, heart_y, tamanho=4, scale=hud_scale)
+    draw_simple_text(superficie, f"{vidas}/3", text_x, heart_y + 3, (255, 100, 100), scale=hud_scale)
+
 
 def main():
     """
@@ -64,6 +267,12 @@ def main():
     WIDTH, HEIGHT = 1000, 800
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Jangadeiro: Dragão do Mar")
+
+    # Todo o quadro é desenhado em memória; só as regiões alteradas
+    # (e as que precisam ser apagadas) são copiadas para a tela
+    framebuffer = FrameBuffer(WIDTH, HEIGHT, screen)
+    # Paleta já no formato de pixel da tela (mapeada uma única vez)
+    cores = color.empacotadas(framebuffer)
     
     clock = pygame.time.Clock()
 
@@ -71,6 +280,13 @@ def main():
     WORLD_WIDTH = 3000
     WORLD_HEIGHT = 3000
 
+    # Tempo por etapa de cada quadro (painel com F3, CSV com F4)
+    perfil = FrameProfiler()
+    mostrar_perfil = False
+    aviso_perfil = None
+    aviso_perfil_frames = 0
+    AVISO_PERFIL_FRAMES = 120
+
     # Inicia música do gameplay
     music_manager.play("gameplay")
     
@@ -89,24 +305,15 @@ def main():
         fish_animation_range = 8
 
         # Spawnar obstáculos: 5 de cada tipo (0=rocha, 1=alga, 2=coral)
-        NUM_OBSTACULOS_POR_TIPO = 5
-        obstaculos = []
-        
-        for tipo in range(3):  # 0=rocha, 1=alga, 2=coral
-            for _ in range(NUM_OBSTACULOS_POR_TIPO):
-                while True:
-                    ox = randint(100, WORLD_WIDTH - 100)
-                    oy = randint(100, WORLD_HEIGHT - 100)
-                    if abs(ox - fish_x) < 80 and abs(oy - fish_y_base) < 80:
-                        continue
-                    if any(abs(ox - obs[0]) < 80 and abs(oy - obs[1]) < 80 for obs in obstaculos):
-                        continue
-                    obstaculos.append([ox, oy, tipo])
-                    break
+        obstaculos = gerar_obstaculos(fish_x, fish_y_base, WORLD_WIDTH, WORLD_HEIGHT)
+        cena = criar_cena(obstaculos)
 
         pontos = 0
         vidas = 3
 
+        # A tela final da rodada anterior desenhou direto na tela
+        framebuffer.invalidar()
+
         rotation_frames_left = 0
         ROTATION_TOTAL_FRAMES = 60
 
@@ -115,65 +322,71 @@ def main():
 
         running = True
         while running:
-            screen.fill(color.SEA_COLOR)
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-
-            # ===== INPUT (MOVE NO MUNDO) — desabilitado durante rotação =====
-            if rotation_frames_left <= 0:
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_w]:
-                    raft_y -= speed
-                if keys[pygame.K_s]:
-                    raft_y += speed
-                if keys[pygame.K_a]:
-                    raft_x -= speed
-                if keys[pygame.K_d]:
-                    raft_x += speed
+            perfil.inicio_quadro()
+
+            with perfil.etapa("entrada"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        running = False
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        mostrar_perfil = not mostrar_perfil
+                        # O painel some sem deixar rastro na tela
+                        framebuffer.invalidar()
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                        quadros = perfil.exportar_csv(ARQUIVO_PERFIL)
+                        # Confirmação no próprio painel, que abre se estiver fechado
+                        aviso_perfil = f"CSV: {quadros} QUADROS GRAVADOS"
+                        aviso_perfil_frames = AVISO_PERFIL_FRAMES
+                        mostrar_perfil = True
+
+                # ===== INPUT (MOVE NO MUNDO) — desabilitado durante rotação =====
+                if rotation_frames_left <= 0:
+                    keys = pygame.key.get_pressed()
+                    if keys[pygame.K_w]:
+                        raft_y -= speed
+                    if keys[pygame.K_s]:
+                        raft_y += speed
+                    if keys[pygame.K_a]:
+                        raft_x -= speed
+                    if keys[pygame.K_d]:
+                        raft_x += speed
 
             # Limites do MUNDO
             raft_x = max(0, min(WORLD_WIDTH - constant.RAFT_LARGURA, raft_x))
             raft_y = max(0, min(WORLD_HEIGHT - constant.RAFT_ALTURA, raft_y))
 
             # ===== CÂMERA (VIEWPORT) =====
-            camera_x = raft_x - WIDTH // 2
-            camera_y = raft_y - HEIGHT // 2
-
-            camera_x = max(0, min(WORLD_WIDTH - WIDTH, camera_x))
-            camera_y = max(0, min(WORLD_HEIGHT - HEIGHT, camera_y))
-
-            viewport = (camera_x, camera_y, WIDTH, HEIGHT)
+            viewport = calcular_viewport(raft_x, raft_y, WIDTH, HEIGHT, WORLD_WIDTH, WORLD_HEIGHT)
 
             # ===== ANIMAÇÃO DO PEIXE =====
             fish_animation_offset += fish_animation_speed
             fish_y = fish_y_base + math.sin(fish_animation_offset) * fish_animation_range
 
             # ===== COLISÕES (EM COORDENADAS DO MUNDO) =====
-            if check_collision_raft_fish(raft_x, raft_y, fish_x, fish_y_base):
-                pontos += 1
-                fish_x = randint(100, WORLD_WIDTH - 100)
-                fish_y_base = randint(100, WORLD_HEIGHT - 100)
-                fish_animation_offset = 0.0
-                hud_scale_effect_frames = HUD_SCALE_EFFECT_FRAMES  # Reação: HUD em escala maior
-
-            # Colisão jangada × pedra (engine): perde vida e inicia rotação 360°
-            if rotation_frames_left <= 0:
-                for obs in obstaculos[:]:
-                    if check_collision_raft_obstacle(
-                        raft_x, raft_y, constant.RAFT_LARGURA, constant.RAFT_ALTURA,
-                        obs[0], obs[1], constant.OBSTACLE_RADIUS
-                    ):
-                        vidas -= 1
-                        rotation_frames_left = ROTATION_TOTAL_FRAMES
-                        hud_scale_effect_frames = HUD_SCALE_EFFECT_FRAMES
-                        # bloqueia movimento até sair do obstáculo
-                        if keys[pygame.K_w]: raft_y += speed
-                        if keys[pygame.K_s]: raft_y -= speed
-                        if keys[pygame.K_a]: raft_x += speed
-                        if keys[pygame.K_d]: raft_x -= speed
-                        break
+            with perfil.etapa("colisao"):
+                if check_collision_raft_fish(raft_x, raft_y, fish_x, fish_y_base):
+                    pontos += 1
+                    fish_x = randint(100, WORLD_WIDTH - 100)
+                    fish_y_base = randint(100, WORLD_HEIGHT - 100)
+                    fish_animation_offset = 0.0
+                    hud_scale_effect_frames = HUD_SCALE_EFFECT_FRAMES  # Reação: HUD em escala maior
+
+                # Colisão jangada × pedra (engine): perde vida e inicia rotação 360°
+                if rotation_frames_left <= 0:
+                    for obs in obstaculos[:]:
+                        if check_collision_raft_obstacle(
+                            raft_x, raft_y, constant.RAFT_LARGURA, constant.RAFT_ALTURA,
+                            obs[0], obs[1], constant.OBSTACLE_RADIUS
+                        ):
+                            vidas -= 1
+                            rotation_frames_left = ROTATION_TOTAL_FRAMES
+                            hud_scale_effect_frames = HUD_SCALE_EFFECT_FRAMES
+                            # bloqueia movimento até sair do obstáculo
+                            if keys[pygame.K_w]: raft_y += speed
+                            if keys[pygame.K_s]: raft_y -= speed
+                            if keys[pygame.K_a]: raft_x += speed
+                            if keys[pygame.K_d]: raft_x -= speed
+                            break
 
             # Avanço da animação de rotação (0 → 2π)
             if rotation_frames_left > 0:
@@ -183,6 +396,12 @@ def main():
             if hud_scale_effect_frames > 0:
                 hud_scale_effect_frames -= 1
 
+            # Aviso do CSV no painel (~2 s); a linha some sem deixar rastro
+            if aviso_perfil_frames > 0:
+                aviso_perfil_frames -= 1
+                if aviso_perfil_frames == 0:
+                    framebuffer.invalidar()
+
             if vidas <= 0:
                 running = False
                 resultado = "GAME OVER"
@@ -191,71 +410,32 @@ def main():
                 resultado = "VITORIA"
 
             # ===== DESENHO (MUNDO → VIEWPORT) =====
-            fish.draw_waves_around_fish(
-                screen,
-                fish_x - camera_x,
-                fish_y_base - camera_y,
-                fish_animation_offset
-            )
-
-            fish.draw_fish(
-                screen,
-                fish_x - camera_x,
-                int(fish_y - camera_y)
-            )
-
-            for obs in obstaculos:
-                obstacle.draw_obstacle(
-                    screen,
-                    obs[0] - camera_x,
-                    obs[1] - camera_y,
-                    tipo=obs[2]
-                )
-
             # Ângulo de rotação ao colidir com pedra (0 → 2π)
             raft_angle = 0.0
             if rotation_frames_left > 0:
                 raft_angle = (ROTATION_TOTAL_FRAMES - rotation_frames_left) / ROTATION_TOTAL_FRAMES * 2 * math.pi
-            raft.draw_raft(
-                screen,
-                raft_x - camera_x,
-                raft_y - camera_y,
-                viewport,
-                angle=raft_angle
-            )
+            hud_scale = 3 if hud_scale_effect_frames > 0 else 2
 
-            minimap.draw_minimap(
-                screen,
-                raft_x, raft_y,
-                fish_x, fish_y_base,
-                obstaculos,
-                camera_x, camera_y,
-                WORLD_WIDTH, WORLD_HEIGHT,
-                WIDTH, HEIGHT
+            draw_frame(
+                framebuffer, cores,
+                viewport, (WORLD_WIDTH, WORLD_HEIGHT),
+                raft_x, raft_y, raft_angle,
+                fish_x, fish_y_base, fish_y, fish_animation_offset,
+                obstaculos, pontos, vidas, hud_scale,
+                profiler=perfil, cena=cena
             )
 
-            # ===== HUD CENTRALIZADO (PARTE SUPERIOR) =====
-            center_x = WIDTH // 2
-            hud_scale = 3 if hud_scale_effect_frames > 0 else 2
-            
-            # Definir posição base alinhada
-            icon_x = center_x - 50  # Posição X dos ícones
-            text_x = center_x - 10  # Posição X do texto (mais próximo)
-            
-            # Pontos com ícone (primeira linha)
-            # Peixe: desenha de y-b até y+b, com tamanho=8, b=8//3=2
-            # Centro real está em y, ajustando texto para alinhar melhor
-            fish_y = 18
-            icon.draw_fish_icon(screen, icon_x, fish_y, tamanho=8, scale=hud_scale)
-            draw_simple_text(screen, f"{pontos}/5", text_x, fish_y - 3, (255, 215, 0), scale=hud_scale)
-            
-            # Vidas com ícone (segunda linha, alinhado)
-            # X diminuído e movido para esquerda para alinhar com o peixe
-            heart_y = 40
-            icon.draw_heart_icon(screen, icon_x - 5, heart_y, tamanho=4, scale=hud_scale)
-            draw_simple_text(screen, f"{vidas}/3", text_x, heart_y + 3, (255, 100, 100), scale=hud_scale)
-
-            pygame.display.flip()
+            if mostrar_perfil:
+                with perfil.etapa("painel"):
+                    memoria = {"sprites": sprites.bytes, "jangada": raft.quadros_jangada.bytes}
+                    aviso = aviso_perfil if aviso_perfil_frames > 0 else None
+                    draw_profiler_overlay(framebuffer, perfil, memoria=memoria, aviso=aviso)
+
+            with perfil.etapa("apresentar"):
+                pygame.display.update(framebuffer.present_dirty(screen))
+
+            # Fecha antes do tick: a espera do relógio não entra na conta
+            perfil.fim_quadro()
             clock.tick(60)
 
         # ===== TELA FINAL: Game Over ou Vitória =====
@@ -24,9 +24,9 @@ from engine.fill.flood_fill import flood_fill_iterativo
 from engine.raster.line import bresenham
 from engine.raster.circle import draw_circle
 from engine.raster.elipse import draw_elipse
-from engine.framebuffer import set_pixel
+from engine.framebuffer import set_pixel, travar
 from app.entities.raft import draw_jangada
-from app.entities.fish import draw_fish
+from app.entities.fish import draw_fish_sprite
 from assets.music_manager import music_manager
 
 # ─── Funções Auxiliares ───
@@ -109,13 +109,13 @@ slides = [
             "Cada onda vencida era uma vitoria para a comunidade."
         ],
     "draw_extra": lambda surf, w, h: [
-        draw_fish(surf, int(w*0.3), int(h*0.55), cor=color.FISH_GOLD),
-        draw_fish(surf, int(w*0.4), int(h*0.6), cor=color.FISH_BLUE),
-        draw_fish(surf, int(w*0.5), int(h*0.5), cor=color.FISH_TURQUOISE),
-        draw_fish(surf, int(w*0.6), int(h*0.65), cor=color.FISH_GOLD),
-        draw_fish(surf, int(w*0.7), int(h*0.52), cor=color.FISH_BLUE),
-        draw_fish(surf, int(w*0.75), int(h*0.58), cor=color.FISH_TURQUOISE),
-        draw_fish(surf, int(w*0.8), int(h*0.6), cor=color.FISH_TURQUOISE),
+        draw_fish_sprite(surf, int(w*0.3), int(h*0.55), cor=color.FISH_GOLD),
+        draw_fish_sprite(surf, int(w*0.4), int(h*0.6), cor=color.FISH_BLUE),
+        draw_fish_sprite(surf, int(w*0.5), int(h*0.5), cor=color.FISH_TURQUOISE),
+        draw_fish_sprite(surf, int(w*0.6), int(h*0.65), cor=color.FISH_GOLD),
+        draw_fish_sprite(surf, int(w*0.7), int(h*0.52), cor=color.FISH_BLUE),
+        draw_fish_sprite(surf, int(w*0.75), int(h*0.58), cor=color.FISH_TURQUOISE),
+        draw_fish_sprite(surf, int(w*0.8), int(h*0.6), cor=color.FISH_TURQUOISE),
     ]
     },
     {
@@ -166,36 +166,54 @@ slides = [
     }
 ]
 
+# ─── Desenho do Slide ───
+def draw_slide(superficie, slide_index):
+    """
+    Desenha um slide completo da história (fundo, texto e extras).
+
+    Não espera eventos, então pode ser usada tanto por run_story quanto
+    pela renderização headless.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer do tamanho da tela
+        slide_index: índice em `slides`
+    """
+    w, h = superficie.get_width(), superficie.get_height()
+
+    superficie.fill(color.SKY)  # fundo inicial do céu
+
+    # Flood fill do mar
+    flood_fill_iterativo(superficie, x=w//2, y=3*h//4, 
+                        cor_preenchimento=color.SEA, 
+                        cor_borda=color.SKY) 
+
+    [draw_circle(superficie, randint(0, w-1), randint(0, int(h*0.5)), 1, (255,255,255)) for _ in range(100)],
+    [draw_elipse(superficie, randint(0, w-1), randint(int(h*0.6), h-1), randint(2,4), randint(1,3), (180,220,255)) for _ in range(50)],
+
+    slide = slides[slide_index]
+    y_text = int(h*0.1)
+    for line in slide["texto"]:
+        draw_text(superficie, line, 50, y_text, color.TEXT_COLOR, scale=2)
+        y_text += 30  # um pouco mais de espaço entre linhas
+
+    # Extras do slide
+    slide["draw_extra"](superficie, w, h)
+
+    # Indicação visual de avançar
+    draw_text(superficie, "Clique ou pressione ENTER para continuar", 50, h-50, color.TEXT_COLOR, scale=1)
+
+
 # ─── Função Principal ───
 def run_story(superficie):
-    w, h = superficie.get_width(), superficie.get_height()
     slide_index = 0
     clock = pygame.time.Clock()
 
     music_manager.play("menu")
 
     while slide_index < len(slides):
-        superficie.fill(color.SKY)  # fundo inicial do céu
-
-        # Flood fill do mar
-        flood_fill_iterativo(superficie, x=w//2, y=3*h//4, 
-                            cor_preenchimento=color.SEA, 
-                            cor_borda=color.SKY) 
-        
-        [draw_circle(superficie, randint(0, w-1), randint(0, int(h*0.5)), 1, (255,255,255)) for _ in range(100)],
-        [draw_elipse(superficie, randint(0, w-1), randint(int(h*0.6), h-1), randint(2,4), randint(1,3), (180,220,255)) for _ in range(50)],
- 
-        slide = slides[slide_index]
-        y_text = int(h*0.1)
-        for line in slide["texto"]:
-            draw_text(superficie, line, 50, y_text, color.TEXT_COLOR, scale=2)
-            y_text += 30  # um pouco mais de espaço entre linhas
-
-        # Extras do slide
-        slide["draw_extra"](superficie, w, h)
-
-        # Indicação visual de avançar
-        draw_text(superficie, "Clique ou pressione ENTER para continuar", 50, h-50, color.TEXT_COLOR, scale=1)
+        # Uma única trava da tela para todo o desenho do slide
+        with travar(superficie) as alvo:
+            draw_slide(alvo, slide_index)
 
         pygame.display.flip()
         clock.tick(60)
@@ -23,9 +23,10 @@ import pygame
 import math
 import assets.colors as color
 from app.scenes.auxiliary_functions import draw_button, ponto_em_retangulo, draw_text
-from engine.raster.line import bresenham
+from engine.raster.line import bresenham, bresenham_lote
 from engine.fill.scanline import scanline_fill, scanline_fill_gradiente
 from engine.raster.circle import draw_circle
+from engine.framebuffer import FrameBuffer
 
 
 def draw_waves_bottom(surf, altura, largura, offset=0):
@@ -37,11 +38,15 @@ def draw_waves_bottom(surf, altura, largura, offset=0):
         altura: altura total da superfície.
         largura: largura total da superfície.
         offset: deslocamento horizontal para animação.
+
+    Todos os traços são rasterizados de uma vez com bresenham_lote.
     """
+    segmentos = []
     for i in range(altura - 100, altura, 15):
         for x in range(0, largura, 30):
             y_offset = int(10 * math.sin((x + offset) * 0.05))
-            bresenham(surf, x, i + y_offset, x + 20, i + y_offset, color.WAVE_COLOR)
+            segmentos.append((x, i + y_offset, x + 20, i + y_offset))
+    bresenham_lote(surf, segmentos, color.WAVE_COLOR)
 
 
 def draw_decor_peixes(surf, largura, altura):
@@ -59,6 +64,83 @@ def draw_decor_peixes(surf, largura, altura):
         draw_circle(surf, px, py, 4, color.TEXT)
 
 
+# ─── Quadro ───
+def layout_voltar(w, h):
+    """
+    Calcula a posição do botão voltar.
+
+    Returns:
+        (bx, by, bw, bh)
+    """
+    bw, bh = 150, 50
+    bx = (w - bw) // 2
+    by_voltar = int(h * 0.85)
+    return bx, by_voltar, bw, bh
+
+
+def draw_instructions_frame(superficie, frame=0):
+    """
+    Desenha um quadro completo da tela de instruções.
+
+    Não lê eventos, então pode ser usada tanto por run_instructions
+    quanto pelos benchmarks.
+
+    Args:
+        superficie: FrameBuffer (ou pygame.Surface) do tamanho da tela
+        frame: número do quadro (anima as ondas)
+    """
+    w, h = superficie.get_size()
+    bx, by_voltar, bw, bh = layout_voltar(w, h)
+
+    # ----------------------
+    # Fundo
+    # ----------------------
+    largura = superficie.get_width()
+    altura = superficie.get_height()
+    pontos_tela = [(0,0), (largura-1,0), (largura-1,altura-1), (0,altura-1)]
+    scanline_fill_gradiente(superficie, pontos_tela, color.BG_TOP, color.BG_BOTTOM, direcao='vertical')
+    draw_waves_bottom(superficie, h, w, offset=frame)
+    draw_decor_peixes(superficie, w, h)
+
+    # ----------------------
+    # Título
+    # ----------------------
+    titulo = "COMO JOGAR"
+    tw_approx = len(titulo) * 6 * 2
+    draw_text(superficie, titulo, (w - tw_approx)//2, 40, color.TITLE_COLOR, scale=3)
+
+    # ----------------------
+    # Caixas de instruções
+    # ----------------------
+    instrucoes = [
+        ("OBJETIVO", ["- Coletar peixes e navegar", "- Evitar pedras"]),
+        ("CONTROLES", ["- W A S D: mover jangadeiro", "- ESC: sair do jogo"])
+    ]
+
+    start_y = 150
+    box_w, box_h = w - 100, 120
+    for titulo_box, linhas in instrucoes:
+        # Caixa de fundo
+        pts = [(50, start_y), (50 + box_w, start_y), (50 + box_w, start_y + box_h), (50, start_y + box_h)]
+        scanline_fill(superficie, pts, color.BOX_BG)
+        # Borda
+        bresenham(superficie, 50, start_y, 50 + box_w, start_y, color.BOX_BORDER)
+        bresenham(superficie, 50 + box_w, start_y, 50 + box_w, start_y + box_h, color.BOX_BORDER)
+        bresenham(superficie, 50 + box_w, start_y + box_h, 50, start_y + box_h, color.BOX_BORDER)
+        bresenham(superficie, 50, start_y + box_h, 50, start_y, color.BOX_BORDER)
+        # Texto
+        draw_text(superficie, titulo_box, 60, start_y + 10, color.TITLE_COLOR, scale=2)
+        for i, linha in enumerate(linhas):
+            draw_text(superficie, linha, 70, start_y + 40 + i*25, color.TEXT, scale=2)
+        start_y += box_h + 30
+
+    # ----------------------
+    # Botão voltar
+    # ----------------------
+    draw_button(superficie, bx, by_voltar, bw, bh, "VOLTAR", color.BTN_FILL, color.BTN_BORDER, color.BTN_TEXT)
+
+
+# ─── Função Principal ───
 def run_instructions(superficie):
     """
     Executa a tela de instruções do jogo.
@@ -73,9 +155,10 @@ def run_instructions(superficie):
     w, h = superficie.get_size()
 
     # Botão voltar
-    bw, bh = 150, 50
-    bx = (w - bw) // 2
-    by_voltar = int(h * 0.85)
+    bx, by_voltar, bw, bh = layout_voltar(w, h)
+
+    # Quadro em memória: a tela só recebe as regiões que mudaram
+    quadro = FrameBuffer(w, h, superficie)
 
     frame = 0
     running = True
@@ -91,53 +174,8 @@ def run_instructions(superficie):
             if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
                 return
 
-        # ----------------------
-        # Fundo
-        # ----------------------
-        largura = superficie.get_width()
-        altura = superficie.get_height()
-        pontos_tela = [(0,0), (largura-1,0), (largura-1,altura-1), (0,altura-1)]
-        scanline_fill_gradiente(superficie, pontos_tela, color.BG_TOP, color.BG_BOTTOM, direcao='vertical')
-        draw_waves_bottom(superficie, h, w, offset=frame)
-        draw_decor_peixes(superficie, w, h)
-
-        # ----------------------
-        # Título
-        # ----------------------
-        titulo = "COMO JOGAR"
-        tw_approx = len(titulo) * 6 * 2
-        draw_text(superficie, titulo, (w - tw_approx)//2, 40, color.TITLE_COLOR, scale=3)
-
-        # ----------------------
-        # Caixas de instruções
-        # ----------------------
-        instrucoes = [
-            ("OBJETIVO", ["- Coletar peixes e navegar", "- Evitar pedras"]),
-            ("CONTROLES", ["- W A S D: mover jangadeiro", "- ESC: sair do jogo"])
-        ]
-
-        start_y = 150
-        box_w, box_h = w - 100, 120
-        for titulo_box, linhas in instrucoes:
-            # Caixa de fundo
-            pts = [(50, start_y), (50 + box_w, start_y), (50 + box_w, start_y + box_h), (50, start_y + box_h)]
-            scanline_fill(superficie, pts, color.BOX_BG)
-            # Borda
-            bresenham(superficie, 50, start_y, 50 + box_w, start_y, color.BOX_BORDER)
-            bresenham(superficie, 50 + box_w, start_y, 50 + box_w, start_y + box_h, color.BOX_BORDER)
-            bresenham(superficie, 50 + box_w, start_y + box_h, 50, start_y + box_h, color.BOX_BORDER)
-            bresenham(superficie, 50, start_y + box_h, 50, start_y, color.BOX_BORDER)
-            # Texto
-            draw_text(superficie, titulo_box, 60, start_y + 10, color.TITLE_COLOR, scale=2)
-            for i, linha in enumerate(linhas):
-                draw_text(superficie, linha, 70, start_y + 40 + i*25, color.TEXT, scale=2)
-            start_y += box_h + 30
-
-        # ----------------------
-        # Botão voltar
-        # ----------------------
-        draw_button(superficie, bx, by_voltar, bw, bh, "VOLTAR", color.BTN_FILL, color.BTN_BORDER, color.BTN_TEXT)
-
-        pygame.display.flip()
+        draw_instructions_frame(quadro, frame)
+
+        pygame.display.update(quadro.present_dirty(superficie))
         frame += 1
         pygame.time.Clock().tick(60)
\ No newline at end of file
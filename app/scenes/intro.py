@@ -25,11 +25,17 @@ import assets.colors as color
 from engine.raster.circle import draw_circle
 from engine.fill.flood_fill import flood_fill_iterativo
 from engine.fill.scanline import scanline_fill, scanline_fill_gradiente
+from engine.fill.texture import scanline_fill_textura
 from engine.geometry.cohen_sutherland import draw_line_clipped
+from engine.framebuffer import travar
 from app.scenes.menu import run_menu
 from app.entities.raft import draw_jangada
 from assets.music_manager import music_manager
- 
+
+# Coordenadas de textura dos cantos de um retângulo (sup. esq., sup. dir., inf. dir., inf. esq.):
+# a imagem inteira esticada sobre o polígono
+UV_RETANGULO = [(0, 0), (1, 0), (1, 1), (0, 1)]
+
 
 # ─── Funções Auxiliares ───
 def draw_background(tela, largura, altura, textura_ceu=None, textura_areia=None):
@@ -55,7 +61,7 @@ def draw_background(tela, largura, altura, textura_ceu=None, textura_areia=None)
             (largura, altura // 2),
             (0, altura // 2)
         ]
-        scanline_texture_all(tela, ceu, textura_ceu, largura, altura // 2)
+        scanline_fill_textura(tela, ceu, textura_ceu, UV_RETANGULO)
     else:
         tela.fill(color.SKY_DUSK_BLUE)
         
@@ -76,55 +82,11 @@ def draw_background(tela, largura, altura, textura_ceu=None, textura_areia=None)
         (0, altura)
     ]
     if textura_areia:
-        scanline_texture_all(
-            tela,
-            areia,
-            textura_areia,
-            largura,
-            altura - (altura // 2 + 120),
-            altura // 2 + 120
-        )
+        scanline_fill_textura(tela, areia, textura_areia, UV_RETANGULO)
     else:
         scanline_fill(tela, areia, color.SUN_ORANGE)
 
 
-def scanline_texture_all(tela, pontos, textura, width, height, y_offset=0):
-    """Preenche polígono com textura usando scanline."""
-    tex_w, tex_h = textura.get_width(), textura.get_height()
-    n = len(pontos)
-    ys = [p[1] for p in pontos]
-    y_min = int(min(ys))
-    y_max = int(max(ys))
-
-    for y in range(y_min, y_max):
-        inter = []
-        for i in range(n):
-            x0, y0 = pontos[i]
-            x1, y1 = pontos[(i + 1) % n]
-            if y0 == y1:
-                continue
-            if y0 > y1:
-                x0, y0, x1, y1 = x1, y1, x0, y0
-            if y < y0 or y >= y1:
-                continue
-            t = (y - y0) / (y1 - y0)
-            x = x0 + t * (x1 - x0)
-            inter.append(x)
-        inter.sort()
-        for i in range(0, len(inter), 2):
-            if i + 1 >= len(inter):
-                continue
-            x_start = int(inter[i])
-            x_end = int(inter[i + 1])
-            for x in range(x_start, x_end + 1):
-                tx = int((x / width) * (tex_w - 1)) if width > 0 else 0
-                ty = int(((y - y_offset) / height) * (tex_h - 1)) if height > 0 else 0
-                tx = max(0, min(tx, tex_w - 1))
-                ty = max(0, min(ty, tex_h - 1))
-                if 0 <= x < width and 0 <= (y - y_offset) < height:
-                    tela.set_at((x, y), textura.get_at((tx, ty))[:3])
-
-
 def draw_character_clipped(tela, cx, cy, dx, dy):
     """
     Desenha um jangadeiro estilizado usando polígonos preenchidos via scanline.
@@ -186,6 +148,42 @@ def draw_raft_translated(tela, largura, altura, dx, scale=3):
     draw_jangada(tela, base_x, base_y, scale)
 
 
+# ======================================
+# QUADRO DA INTRODUÇÃO
+# ======================================
+def draw_intro_frame(tela, largura, altura, textura_ceu, textura_areia,
+                     raft_dx, cx, cy, dx, dy, mar_offset=None):
+    """
+    Desenha um quadro da introdução (sem o fade da transição).
+
+    Não lê eventos nem altera o estado da cena, então pode ser usada
+    tanto pelo loop de run_intro quanto pela renderização headless.
+
+    Args:
+        tela: pygame.Surface ou FrameBuffer
+        largura, altura: dimensões da tela
+        textura_ceu, textura_areia: texturas (ou None para cor sólida)
+        raft_dx: deslocamento horizontal da jangada (balanço)
+        cx, cy: centro da janela do mundo do jangadeiro
+        dx, dy: deslocamento do jangadeiro
+        mar_offset: altura que o mar já subiu na transição (None fora dela)
+    """
+    tela.fill(color.SKY_DUSK_BLUE)
+
+    draw_background(tela, largura, altura, textura_ceu, textura_areia)
+    draw_raft_translated(tela, largura, altura, raft_dx, scale=3)
+    draw_character_clipped(tela, cx, cy, dx, dy)
+
+    if mar_offset is not None:
+        mar = [
+            (0, altura // 2 - mar_offset),
+            (largura, altura // 2 - mar_offset),
+            (largura, altura),
+            (0, altura)
+        ]
+        scanline_fill(tela, mar, color.SEA_COLOR)
+
+
 # ======================================
 # FUNÇÃO PRINCIPAL
 # ======================================
@@ -228,10 +226,6 @@ def run_intro(tela):
             if event.type == pygame.QUIT:
                 return "sair"
 
-        tela.fill(color.SKY_DUSK_BLUE)
-
-        draw_background(tela, largura, altura, textura_ceu, textura_areia)
-
         # jangadeiro andando em direção ao mar
         if dx < 0:
             dx += 30
@@ -240,7 +234,6 @@ def run_intro(tela):
         amplitude = 6      # quanto a jangada se move (pixels)
         frequencia = 1   # quão rápido vai e volta
         raft_dx = int(amplitude * math.sin(frame * frequencia))
-        draw_raft_translated(tela, largura, altura, raft_dx, scale=3)
 
         # movimento do jangadeiro (areia -> jangada)
         vel_x = 3
@@ -254,25 +247,24 @@ def run_intro(tela):
             dy += vel_y
             dy = max(dy, 0)
 
-        draw_character_clipped(tela, cx, cy, dx, dy)
-
         # =====================
         # Transição para o menu
         # =====================
+        mar_offset = None
         if transition:
             transition_frame += 10
 
             # sobe o mar (translação vertical)
             mar_offset = min(transition_frame * 4, altura // 2)
 
-            mar = [
-                (0, altura // 2 - mar_offset),
-                (largura, altura // 2 - mar_offset),
-                (largura, altura),
-                (0, altura)
-            ]
-            scanline_fill(tela, mar, color.SEA_COLOR)
+        # Uma única trava da tela para todo o desenho pixel a pixel do quadro
+        with travar(tela) as alvo:
+            draw_intro_frame(
+                alvo, largura, altura, textura_ceu, textura_areia,
+                raft_dx, cx, cy, dx, dy, mar_offset
+            )
 
+        if transition:
             # fade escuro
             fade = pygame.Surface((largura, altura))
             fade.set_alpha(min(transition_frame * 5, 255))
@@ -21,6 +21,7 @@ from engine.raster.circle import draw_circle
 from app.scenes.auxiliary_functions import draw_text, draw_button, ponto_em_retangulo
 from app.scenes.instructions import run_instructions
 from assets.music_manager import music_manager
+from engine.framebuffer import FrameBuffer, clear_color
 
 def draw_title_scene(surf, w, h):
     """
@@ -34,6 +35,53 @@ def draw_title_scene(surf, w, h):
         h: altura da tela
     """
 
+# ─── Layout e Quadro ───
+def layout_botoes(w, h):
+    """
+    Calcula a posição dos botões do menu.
+
+    Returns:
+        (bx, bw, bh, by_iniciar, by_instrucoes, by_sair)
+    """
+    bw, bh = 180, 50
+    bx = (w - bw) // 2
+    by_iniciar = int(h * 0.45)
+    by_instrucoes = by_iniciar + 70
+    by_sair = by_instrucoes + 70
+    return bx, bw, bh, by_iniciar, by_instrucoes, by_sair
+
+
+def draw_menu_frame(superficie):
+    """
+    Desenha um quadro completo do menu (fundo, cena, título e botões).
+
+    Não lê eventos, então pode ser usada tanto por run_menu quanto
+    pela renderização headless.
+
+    Args:
+        superficie: FrameBuffer (ou pygame.Surface) do tamanho da tela
+    """
+    w = superficie.get_width()
+    h = superficie.get_height()
+    bx, bw, bh, by_iniciar, by_instrucoes, by_sair = layout_botoes(w, h)
+
+    # Fundo (usa fill para performance; os elementos são desenhados com set_pixel)
+    clear_color(superficie, color.SKY)
+
+    # Cena: sol, horizonte, ondas
+    draw_title_scene(superficie, w, h)
+
+    # Título
+    titulo = "JANGADEIRO: DRAGAO DO MAR"
+    tw_approx = len(titulo) * 6 * 2
+    draw_text(superficie, titulo, (w - tw_approx) // 2, int(h * 0.22), color.TITLE, scale=2)
+
+    # Botões
+    draw_button(superficie, bx, by_iniciar, bw, bh, "INICIAR", color.BTN_FILL, color.BTN_BORDER, color.BTN_TEXT)
+    draw_button(superficie, bx, by_instrucoes, bw, bh, "COMO JOGAR", color.BTN_FILL, color.BTN_BORDER, color.BTN_TEXT)
+    draw_button(superficie, bx, by_sair, bw, bh, "SAIR", color.BTN_FILL, color.BTN_BORDER, color.BTN_TEXT)
+
+
 # ─── Função Principal ───
 def run_menu(superficie):
     """
@@ -55,33 +103,17 @@ def run_menu(superficie):
     h = superficie.get_height()
 
     # Botões
-    bw, bh = 180, 50
-    bx = (w - bw) // 2
-    by_iniciar = int(h * 0.45)
-    by_instrucoes = by_iniciar + 70
-    by_sair = by_instrucoes + 70
+    bx, bw, bh, by_iniciar, by_instrucoes, by_sair = layout_botoes(w, h)
 
     # Garante que a música do menu está tocando
     music_manager.play("menu")
 
-    while True:
-        # Fundo (usa fill para performance; os elementos são desenhados com set_pixel)
-        superficie.fill(color.SKY)
-
-        # Cena: sol, horizonte, ondas
-        draw_title_scene(superficie, w, h)
-
-        # Título
-        titulo = "JANGADEIRO: DRAGAO DO MAR"
-        tw_approx = len(titulo) * 6 * 2
-        draw_text(superficie, titulo, (w - tw_approx) // 2, int(h * 0.22), color.TITLE, scale=2)
+    # Quadro em memória: a tela só recebe as regiões que mudaram
+    quadro = FrameBuffer(w, h, superficie)
 
-        # Botões
-        draw_button(superficie, bx, by_iniciar, bw, bh, "INICIAR", color.BTN_FILL, color.BTN_BORDER, color.BTN_TEXT)
-        draw_button(superficie, bx, by_instrucoes, bw, bh, "COMO JOGAR", color.BTN_FILL, color.BTN_BORDER, color.BTN_TEXT)
-        draw_button(superficie, bx, by_sair, bw, bh, "SAIR", color.BTN_FILL, color.BTN_BORDER, color.BTN_TEXT)
-
-        pygame.display.flip()
+    while True:
+        draw_menu_frame(quadro)
+        pygame.display.update(quadro.present_dirty(superficie))
 
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
@@ -92,6 +124,8 @@ def run_menu(superficie):
                     return "iniciar"
                 if ponto_em_retangulo(mx, my, bx, by_instrucoes, bw, bh):
                     run_instructions(superficie)
+                    # As instruções desenharam direto na tela
+                    quadro.invalidar()
                 if ponto_em_retangulo(mx, my, bx, by_sair, bw, bh):
                     return "sair"
             if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
@@ -16,6 +16,7 @@
 
 import pygame
 from app.scenes.auxiliary_functions import draw_text, draw_button, ponto_em_retangulo
+from engine.framebuffer import FrameBuffer, clear_color
 
 # Mesmo padrão do menu
 SKY = (135, 206, 235)
@@ -44,19 +45,22 @@ def run_victory(superficie):
     by_jogar = int(h * 0.52)
     by_sair = by_jogar + 70
 
+    # Quadro em memória: a tela só recebe as regiões que mudaram
+    quadro = FrameBuffer(w, h, superficie)
+
     while True:
-        superficie.fill(SKY)
+        clear_color(quadro, SKY)
 
         # Mensagem em verde (mesma fonte e renderização do menu)
         titulo = "VOCE VENCEU"
         tw_approx = len(titulo) * 6 * 2
-        draw_text(superficie, titulo, (w - tw_approx) // 2, int(h * 0.28), MESSAGE_COLOR, scale=2)
+        draw_text(quadro, titulo, (w - tw_approx) // 2, int(h * 0.28), MESSAGE_COLOR, scale=2)
 
         # Botões amarelos como no menu
-        draw_button(superficie, bx, by_jogar, bw, bh, "JOGAR NOVAMENTE", BTN_FILL, BTN_BORDER, BTN_TEXT)
-        draw_button(superficie, bx, by_sair, bw, bh, "SAIR", BTN_FILL, BTN_BORDER, BTN_TEXT)
+        draw_button(quadro, bx, by_jogar, bw, bh, "JOGAR NOVAMENTE", BTN_FILL, BTN_BORDER, BTN_TEXT)
+        draw_button(quadro, bx, by_sair, bw, bh, "SAIR", BTN_FILL, BTN_BORDER, BTN_TEXT)
 
-        pygame.display.flip()
+        pygame.display.update(quadro.present_dirty(superficie))
 
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
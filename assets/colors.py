@@ -4,8 +4,15 @@ Paleta de cores
 
 Todas as cores são no formato RGB (R, G, B). 
 Tema: Noite costeira e tropical.
+
+`empacotadas(superficie)` devolve as mesmas constantes já convertidas
+para inteiros no formato de pixel da tela (ver engine.framebuffer).
 """
 
+from types import SimpleNamespace
+
+from engine.framebuffer import mapear_paleta
+
 # ======================================
 # CÉU
 # ======================================
@@ -133,4 +140,30 @@ SEA = (25, 104, 163)
 SUN = (255, 223, 0)
 SAND = (194, 178, 128)
 TEXT_COLOR = (255, 255, 255)
-PEIXE_COLOR = (255, 100, 100)
\ No newline at end of file
+PEIXE_COLOR = (255, 100, 100)
+
+
+# ======================================
+# CORES EMPACOTADAS
+# ======================================
+def empacotadas(superficie):
+    """
+    Retorna a paleta mapeada para o formato de pixel da superfície.
+
+    Cada constante deste módulo vira um inteiro empacotado com o mesmo
+    nome. O mapeamento é feito uma vez por formato de tela (e guardado
+    em cache pela engine); os inteiros podem ser passados para qualquer
+    função de escrita no lugar das tuplas RGB.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer de destino
+
+    Exemplo:
+        cores = color.empacotadas(tela)
+        clear_color(framebuffer, cores.SEA_COLOR)
+    """
+    paleta = {
+        nome: valor for nome, valor in globals().items()
+        if nome.isupper() and isinstance(valor, tuple)
+    }
+    return SimpleNamespace(**mapear_paleta(superficie, paleta))
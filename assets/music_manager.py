@@ -2,6 +2,10 @@
 """
 Gerenciador de música para o jogo.
 Controla a reprodução de músicas de fundo em diferentes cenas.
+
+O mixer só é inicializado na primeira música tocada; se não houver
+dispositivo de áudio (servidores de build, modo headless), o jogo
+segue sem som em vez de falhar na importação.
 """
 
 import pygame
@@ -13,8 +17,8 @@ class MusicManager:
     """
     
     def __init__(self):
-        """Inicializa o mixer de áudio do pygame."""
-        pygame.mixer.init()
+        """Prepara o gerenciador (o mixer é inicializado sob demanda)."""
+        self.mixer_ok = None  # None = ainda não tentou inicializar
         self.current_music = None
         self.music_volume = 1.0  # Volume padrão (0.0 a 1.0)
         
@@ -43,6 +47,22 @@ class MusicManager:
                 return filepath
         return None
     
+    def _mixer_disponivel(self):
+        """
+        Inicializa o mixer na primeira chamada.
+
+        Returns:
+            True se o áudio está disponível, False caso contrário.
+        """
+        if self.mixer_ok is None:
+            try:
+                pygame.mixer.init()
+                self.mixer_ok = True
+            except pygame.error as e:
+                print(f"Áudio indisponível, o jogo seguirá sem música: {e}")
+                self.mixer_ok = False
+        return self.mixer_ok
+
     def play(self, music_name, loops=-1, fade_ms=1000):
         """
         Toca uma música.
@@ -55,6 +75,9 @@ class MusicManager:
         if music_name == self.current_music:
             # Já está tocando esta música
             return
+
+        if not self._mixer_disponivel():
+            return
         
         music_path = self.music_files.get(music_name)
         
@@ -84,17 +107,21 @@ class MusicManager:
         Args:
             fade_ms: tempo de fade out em milissegundos
         """
+        if not self._mixer_disponivel():
+            return
         if pygame.mixer.music.get_busy():
             pygame.mixer.music.fadeout(fade_ms)
             self.current_music = None
     
     def pause(self):
         """Pausa a música atual."""
-        pygame.mixer.music.pause()
+        if self._mixer_disponivel():
+            pygame.mixer.music.pause()
     
     def unpause(self):
         """Retoma a música pausada."""
-        pygame.mixer.music.unpause()
+        if self._mixer_disponivel():
+            pygame.mixer.music.unpause()
     
     def set_volume(self, volume):
         """
@@ -104,7 +131,8 @@ class MusicManager:
             volume: valor entre 0.0 (mudo) e 1.0 (volume máximo)
         """
         self.music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.music_volume)
+        if self._mixer_disponivel():
+            pygame.mixer.music.set_volume(self.music_volume)
 
 
 # Instância global do gerenciador de música
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# ═══════════════════════════════════════════════════════
+# BENCHMARK - COMPARAÇÃO ENTRE EXECUÇÕES
+# ═══════════════════════════════════════════════════════
+# Compara dois arquivos JSON gerados por
+# benchmarks/primitivas.py, caso a caso, e aponta as
+# regressões (casos mais lentos que a tolerância).
+#
+# Sai com código 1 se houver regressão, para uso em CI.
+#
+# Uso:
+#   python -m benchmarks.comparar base.json atual.json
+#   python -m benchmarks.comparar base.json atual.json --tolerancia 0.2
+# ═══════════════════════════════════════════════════════
+
+import argparse
+import json
+import sys
+
+
+def _chave(resultado):
+    """Identifica um caso pela primitiva e pelos parâmetros."""
+    return resultado["primitiva"], json.dumps(resultado["parametros"], sort_keys=True)
+
+
+def comparar(base, atual, tolerancia=0.1):
+    """
+    Compara dois relatórios caso a caso.
+
+    Args:
+        base, atual: relatórios (dicts) de benchmarks.primitivas.executar
+        tolerancia: fração de perda de chamadas/s aceita antes de
+            considerar regressão (0.1 = 10% mais lento)
+
+    Returns:
+        lista de dicts com primitiva, parametros, base, atual (chamadas/s),
+        razao (atual / base) e regressao (bool), para os casos presentes
+        nos dois relatórios.
+    """
+    anteriores = {_chave(r): r for r in base["resultados"]}
+    linhas = []
+    for resultado in atual["resultados"]:
+        anterior = anteriores.get(_chave(resultado))
+        if anterior is None:
+            continue
+        razao = resultado["chamadas_por_segundo"] / anterior["chamadas_por_segundo"]
+        linhas.append({
+            "primitiva": resultado["primitiva"],
+            "parametros": resultado["parametros"],
+            "base": anterior["chamadas_por_segundo"],
+            "atual": resultado["chamadas_por_segundo"],
+            "razao": razao,
+            "regressao": razao < 1 - tolerancia,
+        })
+    return linhas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara dois resultados de benchmark.")
+    parser.add_argument("base", help="JSON de referência")
+    parser.add_argument("atual", help="JSON da execução atual")
+    parser.add_argument("--tolerancia", type=float, default=0.1,
+                        help="perda de desempenho aceita antes de acusar regressão (padrão: 0.1)")
+    args = parser.parse_args()
+
+    with open(args.base, encoding="utf-8") as arquivo:
+        base = json.load(arquivo)
+    with open(args.atual, encoding="utf-8") as arquivo:
+        atual = json.load(arquivo)
+
+    linhas = comparar(base, atual, args.tolerancia)
+    print(f"base: {base['meta'].get('commit')}  atual: {atual['meta'].get('commit')}")
+    print(f"{'primitiva':<30} {'parâmetros':<32} {'base/s':>12} {'atual/s':>12} {'razão':>7}")
+    for linha in linhas:
+        texto = ", ".join(f"{k}={v}" for k, v in linha["parametros"].items())
+        marca = "  REGRESSÃO" if linha["regressao"] else ""
+        print(f"{linha['primitiva']:<30} {texto:<32} {linha['base']:>12.1f} "
+              f"{linha['atual']:>12.1f} {linha['razao']:>6.2f}x{marca}")
+
+    regressoes = sum(linha["regressao"] for linha in linhas)
+    print(f"\n{len(linhas)} casos comparados, {regressoes} regressões")
+    sys.exit(1 if regressoes else 0)
+
+
+if __name__ == "__main__":
+    main()
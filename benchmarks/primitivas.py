@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+# ═══════════════════════════════════════════════════════
+# BENCHMARK - PRIMITIVAS DA ENGINE
+# ═══════════════════════════════════════════════════════
+# Mede cada primitiva da engine variando tamanho e
+# quantidade, e informa chamadas/s e pixels/s (ou
+# pontos/s e linhas/s para transformações e recorte).
+#
+# Os resultados podem ser gravados em JSON e comparados
+# entre execuções com benchmarks/comparar.py, para
+# detectar regressões ao otimizar a engine.
+#
+# Uso:
+#   python -m benchmarks.primitivas
+#   python -m benchmarks.primitivas --saida base.json
+#   python -m benchmarks.primitivas --filtro bresenham circle
+#   python -m benchmarks.primitivas --alvo surface --rapido
+#   python -m benchmarks.primitivas --filtro cena
+# ═══════════════════════════════════════════════════════
+
+import argparse
+import datetime
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pygame
+
+import engine.headless as headless
+from engine.framebuffer import FrameBuffer, clear
+from engine.raster.line import bresenham, bresenham_lote, dda, desenhar_poligono, wu
+from engine.raster.circle import draw_circle
+from engine.raster.elipse import draw_elipse
+from engine.fill.scanline import scanline_fill, scanline_fill_gradiente
+from engine.fill.flood_fill import flood_fill_iterativo
+from engine.fill.texture import Textura, scanline_fill_textura
+from engine.sprite import carimbar, rasterizar_sprite
+from engine.geometry.cohen_sutherland import cohen_sutherland, draw_line
+from engine.geometry.transform import (
+    aplica_transformacao, multiplica_matrizes, rotacao, rotacionar_pontos_em_torno_de, translacao,
+    transformar_pontos,
+)
+from app.scenes.menu import draw_menu_frame
+from app.scenes.instructions import draw_instructions_frame
+
+LARGURA, ALTURA = 1000, 800
+COR = (255, 255, 255)
+COR_A = (200, 60, 60)
+COR_B = (60, 200, 60)
+
+
+# ─── Casos ───
+# Cada caso é (primitiva, parâmetros, preparar). `preparar(alvo)` devolve
+# (chamar, unidade, itens_por_chamada): `chamar(i)` executa a i-ésima
+# chamada e `itens_por_chamada` é o número de pixels (ou pontos/linhas)
+# que cada chamada produz. `None` deixa a contagem de pixels automática.
+
+def _direcoes(comprimento):
+    """Oito segmentos de mesmo comprimento, um por octante, a partir do centro."""
+    cx, cy = LARGURA // 2, ALTURA // 2
+    segmentos = []
+    for k in range(8):
+        angulo = k * math.pi / 4 + 0.3
+        segmentos.append((cx, cy,
+                          cx + round(comprimento * math.cos(angulo)),
+                          cy + round(comprimento * math.sin(angulo))))
+    return segmentos
+
+
+def _caso_linha(funcao, comprimento):
+    def preparar(alvo):
+        segmentos = _direcoes(comprimento)
+        # Pixels por segmento: max(|dx|, |dy|) + 1, em média nos 8 octantes
+        pixels = sum(max(abs(x1 - x0), abs(y1 - y0)) + 1 for x0, y0, x1, y1 in segmentos) / 8
+        return (lambda i: funcao(alvo, *segmentos[i % 8], COR)), "pixels", pixels
+    return preparar
+
+
+def _caso_linhas_lote(quantidade, comprimento=100):
+    def preparar(alvo):
+        # Os 8 octantes repetidos: mesmas retas de _caso_linha, N por chamada
+        segmentos = (_direcoes(comprimento) * (quantidade // 8 + 1))[:quantidade]
+        pixels = sum(max(abs(x1 - x0), abs(y1 - y0)) + 1 for x0, y0, x1, y1 in segmentos)
+        segmentos = np.array(segmentos)
+        return (lambda i: bresenham_lote(alvo, segmentos, COR)), "pixels", pixels
+    return preparar
+
+
+def _caso_linha_alinhada(funcao, comprimento, direcao):
+    def preparar(alvo):
+        # Reta horizontal ou vertical a partir do centro, nos dois sentidos
+        cx, cy = LARGURA // 2, ALTURA // 2
+        if direcao == "horizontal":
+            segmentos = [(cx, cy, cx + comprimento, cy), (cx, cy, cx - comprimento, cy)]
+        else:
+            segmentos = [(cx, cy, cx, cy + comprimento), (cx, cy, cx, cy - comprimento)]
+        return (lambda i: funcao(alvo, *segmentos[i % 2], COR)), "pixels", comprimento + 1
+    return preparar
+
+
+def _caso_linha_longa(funcao, fator):
+    def preparar(alvo):
+        # Retas que atravessam a tela e se estendem `fator` telas para os
+        # lados, como as de entidades longe da câmera no gameplay
+        cx, cy = LARGURA // 2, ALTURA // 2
+        dx, dy = fator * LARGURA, fator * ALTURA // 3
+        segmentos = [(cx - dx, cy - dy, cx + dx, cy + dy), (cx - dy, cy + dx, cx + dy, cy - dx)]
+        return (lambda i: funcao(alvo, *segmentos[i % 2], COR)), "pixels", None
+    return preparar
+
+
+def _caso_circulo(raio):
+    def preparar(alvo):
+        return (lambda i: draw_circle(alvo, LARGURA // 2, ALTURA // 2, raio, COR)), "pixels", None
+    return preparar
+
+
+def _caso_elipse(rx, ry):
+    def preparar(alvo):
+        return (lambda i: draw_elipse(alvo, LARGURA // 2, ALTURA // 2, rx, ry, COR)), "pixels", None
+    return preparar
+
+
+def _poligono(lado):
+    """Pentágono irregular com caixa envolvente lado x lado, centrado na tela."""
+    x0, y0 = (LARGURA - lado) // 2, (ALTURA - lado) // 2
+    return [(x0 + lado * 0.5, y0), (x0 + lado, y0 + lado * 0.4), (x0 + lado * 0.8, y0 + lado),
+            (x0 + lado * 0.1, y0 + lado * 0.9), (x0, y0 + lado * 0.3)]
+
+
+def _caso_contorno(lado, antialias):
+    def preparar(alvo):
+        pontos = _poligono(lado)
+        return (lambda i: desenhar_poligono(alvo, pontos, COR, antialias=antialias)), "pixels", None
+    return preparar
+
+
+def _caso_scanline(lado):
+    def preparar(alvo):
+        pontos = _poligono(lado)
+        return (lambda i: scanline_fill(alvo, pontos, COR)), "pixels", None
+    return preparar
+
+
+def _caso_gradiente(lado, direcao):
+    def preparar(alvo):
+        pontos = _poligono(lado)
+        return (lambda i: scanline_fill_gradiente(alvo, pontos, COR_A, COR_B, direcao=direcao)), "pixels", None
+    return preparar
+
+
+def _textura_xadrez(lado=64, casa=8):
+    """Textura de xadrez colorida (sem texels pretos, para a contagem de pixels)."""
+    vs, us = np.mgrid[0:lado, 0:lado]
+    xadrez = ((us // casa + vs // casa) % 2).astype(np.uint8)
+    rgb = np.stack([40 + 3 * us, 40 + 3 * vs, 80 + 120 * xadrez], axis=2).astype(np.uint8)
+    return Textura(pygame.surfarray.make_surface(rgb.transpose(1, 0, 2)))
+
+
+def _caso_textura(lado):
+    def preparar(alvo):
+        pontos = _poligono(lado)
+        # UV afim dos vértices: posição relativa na caixa envolvente
+        x0, y0 = (LARGURA - lado) // 2, (ALTURA - lado) // 2
+        uvs = [((x - x0) / lado, (y - y0) / lado) for x, y in pontos]
+        textura = _textura_xadrez()
+        return (lambda i: scanline_fill_textura(alvo, pontos, textura, uvs)), "pixels", None
+    return preparar
+
+
+def _caso_sprite(lado):
+    def preparar(alvo):
+        # O mesmo pentágono com gradiente, rasterizado uma vez e carimbado
+        cx, cy = LARGURA // 2, ALTURA // 2
+        relativos = [(x - cx, y - cy) for x, y in _poligono(lado)]
+
+        def desenhar(superficie, x, y):
+            pontos = [(x + dx, y + dy) for dx, dy in relativos]
+            scanline_fill_gradiente(superficie, pontos, COR_A, COR_B)
+        sprite = rasterizar_sprite(alvo, desenhar, lado, paridade=(cx & 1, cy & 1))
+        return (lambda i: carimbar(alvo, sprite, cx, cy)), "pixels", None
+    return preparar
+
+
+def _caso_flood(lado):
+    def preparar(alvo):
+        # Borda quadrada desenhada uma vez; cada chamada alterna a cor de
+        # preenchimento, então a região inteira é repintada em toda chamada
+        x0, y0 = (LARGURA - lado) // 2, (ALTURA - lado) // 2
+        x1, y1 = x0 + lado + 1, y0 + lado + 1
+        for ax, ay, bx, by in ((x0, y0, x1, y0), (x1, y0, x1, y1), (x1, y1, x0, y1), (x0, y1, x0, y0)):
+            bresenham(alvo, ax, ay, bx, by, COR)
+        cx, cy = x0 + lado // 2, y0 + lado // 2
+        return (lambda i: flood_fill_iterativo(alvo, cx, cy, COR_A if i % 2 else COR_B, COR)), "pixels", lado * lado
+    return preparar
+
+
+def _linhas_aleatorias(quantidade):
+    """Segmentos pseudoaleatórios (semente fixa) que cruzam, tocam ou ficam fora da janela."""
+    gerador = np.random.default_rng(1234)
+    return gerador.integers(-500, 1500, size=(quantidade, 4)).tolist()
+
+
+def _caso_cohen_sutherland(quantidade):
+    def preparar(alvo):
+        linhas = _linhas_aleatorias(quantidade)
+
+        def chamar(i):
+            for x0, y0, x1, y1 in linhas:
+                cohen_sutherland(x0, y0, x1, y1, 0, 0, LARGURA - 1, ALTURA - 1)
+        return chamar, "linhas", quantidade
+    return preparar
+
+
+def _caso_draw_line(quantidade):
+    def preparar(alvo):
+        linhas = _linhas_aleatorias(quantidade)
+        viewport = (0, 0, LARGURA - 1, ALTURA - 1)
+
+        def chamar(i):
+            for x0, y0, x1, y1 in linhas:
+                draw_line(alvo, x0, y0, x1, y1, COR, viewport)
+        return chamar, "pixels", None
+    return preparar
+
+
+def _caso_rotacao(quantidade):
+    def preparar(alvo):
+        pontos = [(x % 997, x % 791) for x in range(quantidade)]
+        return (lambda i: rotacionar_pontos_em_torno_de(pontos, 500, 400, 0.01 * i)), "pontos", quantidade
+    return preparar
+
+
+def _caso_aplica(quantidade):
+    def preparar(alvo):
+        pontos = [(x % 997, x % 791) for x in range(quantidade)]
+        m = multiplica_matrizes(translacao(10, 20), rotacao(0.5))
+        return (lambda i: aplica_transformacao(m, pontos)), "pontos", quantidade
+    return preparar
+
+
+def _caso_lote(quantidade):
+    def preparar(alvo):
+        pontos = np.array([(x % 997, x % 791) for x in range(quantidade)], dtype=np.float64)
+        m = multiplica_matrizes(translacao(10, 20), rotacao(0.5))
+        return (lambda i: transformar_pontos(m, pontos, arredondar=True)), "pontos", quantidade
+    return preparar
+
+
+def _caso_multiplica():
+    def preparar(alvo):
+        a, b = translacao(10, 20), rotacao(0.5)
+        return (lambda i: multiplica_matrizes(a, b)), "matrizes", 1
+    return preparar
+
+
+def _caso_cena(desenhar_quadro):
+    def preparar(alvo):
+        # Quadro inteiro da tela, como no laço da cena (sem eventos)
+        return (lambda i: desenhar_quadro(alvo)), "quadros", 1
+    return preparar
+
+
+CASOS = (
+    [("bresenham", {"comprimento": n}, _caso_linha(bresenham, n)) for n in (10, 100, 350)]
+    + [("bresenham", {"comprimento": n, "direcao": d}, _caso_linha_alinhada(bresenham, n, d))
+       for d in ("horizontal", "vertical") for n in (10, 350)]
+    + [("bresenham", {"fora_da_tela": f}, _caso_linha_longa(bresenham, f)) for f in (1, 10)]
+    + [("bresenham_lote", {"linhas": n, "comprimento": 100}, _caso_linhas_lote(n)) for n in (8, 160, 2000)]
+    + [("wu", {"comprimento": n}, _caso_linha(wu, n)) for n in (10, 100, 350)]
+    + [("desenhar_poligono", {"lado": n, "antialias": a}, _caso_contorno(n, a))
+       for a in (False, True) for n in (10, 100, 700)]
+    + [("dda", {"comprimento": n}, _caso_linha(dda, n)) for n in (10, 100, 350)]
+    + [("draw_circle", {"raio": r}, _caso_circulo(r)) for r in (5, 50, 350)]
+    + [("draw_elipse", {"rx": rx, "ry": ry}, _caso_elipse(rx, ry)) for rx, ry in ((6, 3), (60, 30), (450, 350))]
+    + [("scanline_fill", {"lado": n}, _caso_scanline(n)) for n in (10, 100, 700)]
+    + [("scanline_fill_gradiente", {"lado": n, "direcao": d}, _caso_gradiente(n, d))
+       for d in ("vertical", "horizontal") for n in (10, 100, 700)]
+    + [("scanline_fill_textura", {"lado": n}, _caso_textura(n)) for n in (10, 100, 700)]
+    + [("carimbar_sprite", {"lado": n}, _caso_sprite(n)) for n in (10, 100, 700)]
+    + [("flood_fill_iterativo", {"lado": n}, _caso_flood(n)) for n in (10, 50, 200)]
+    + [("cohen_sutherland", {"linhas": n}, _caso_cohen_sutherland(n)) for n in (10, 1000)]
+    + [("draw_line_recortada", {"linhas": n}, _caso_draw_line(n)) for n in (10, 100)]
+    + [("rotacionar_pontos_em_torno_de", {"pontos": n}, _caso_rotacao(n)) for n in (4, 100, 10000)]
+    + [("aplica_transformacao", {"pontos": n}, _caso_aplica(n)) for n in (4, 100, 10000)]
+    + [("transformar_pontos", {"pontos": n}, _caso_lote(n)) for n in (4, 100, 10000)]
+    + [("multiplica_matrizes", {}, _caso_multiplica())]
+    + [("cena_menu", {}, _caso_cena(draw_menu_frame)),
+       ("cena_instrucoes", {}, _caso_cena(draw_instructions_frame))]
+)
+
+
+# ─── Medição ───
+def _pixels(alvo):
+    """Array (altura, largura) com os valores empacotados do alvo (cópia)."""
+    if isinstance(alvo, FrameBuffer):
+        return alvo.pixels.copy()
+    return pygame.surfarray.array2d(alvo).T
+
+
+def contar_pixels(alvo, chamar):
+    """Número de pixels distintos que uma chamada altera, a partir do fundo preto."""
+    clear(alvo)
+    antes = _pixels(alvo)
+    chamar(0)
+    return int(np.count_nonzero(_pixels(alvo) != antes))
+
+
+def medir_caso(alvo, preparar, tempo_minimo, repeticoes):
+    """
+    Mede um caso: calibra o número de chamadas para durar pelo menos
+    `tempo_minimo` segundos e fica com a melhor de `repeticoes` medições.
+
+    Returns:
+        dict com chamadas, segundos, chamadas_por_segundo, unidade,
+        itens_por_chamada e itens_por_segundo.
+    """
+    clear(alvo)
+    chamar, unidade, itens = preparar(alvo)
+    if itens is None:
+        itens = contar_pixels(alvo, chamar)
+        clear(alvo)
+        chamar, unidade, _ = preparar(alvo)
+
+    # O índice da chamada continua entre as medições: casos que alternam
+    # a cor por índice (flood fill) nunca repetem a chamada anterior
+    feitas = 0
+
+    # Calibração: dobra o número de chamadas até atingir o tempo mínimo
+    chamadas = 1
+    while True:
+        inicio = time.perf_counter()
+        for i in range(feitas, feitas + chamadas):
+            chamar(i)
+        segundos = time.perf_counter() - inicio
+        feitas += chamadas
+        if segundos >= tempo_minimo or chamadas >= 1 << 20:
+            break
+        chamadas *= 2
+
+    melhor = segundos
+    for _ in range(repeticoes - 1):
+        inicio = time.perf_counter()
+        for i in range(feitas, feitas + chamadas):
+            chamar(i)
+        melhor = min(melhor, time.perf_counter() - inicio)
+        feitas += chamadas
+
+    por_segundo = chamadas / melhor if melhor else float("inf")
+    return {
+        "chamadas": chamadas,
+        "segundos": melhor,
+        "chamadas_por_segundo": por_segundo,
+        "unidade": unidade,
+        "itens_por_chamada": itens,
+        "itens_por_segundo": por_segundo * itens,
+    }
+
+
+def _commit():
+    """Hash curto do commit atual, ou None fora de um repositório git."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def executar(filtros=None, alvo_tipo="framebuffer", tempo_minimo=0.2, repeticoes=3, saida=sys.stdout):
+    """
+    Executa os casos selecionados e devolve o relatório completo.
+
+    Args:
+        filtros: lista de trechos de nome de primitiva (None = todas)
+        alvo_tipo: "framebuffer" (caminho do jogo) ou "surface" (pygame.Surface)
+        tempo_minimo: duração mínima de cada medição em segundos
+        repeticoes: medições por caso (fica a melhor)
+        saida: onde imprimir a tabela (None para não imprimir)
+
+    Returns:
+        dict com "meta" (ambiente) e "resultados" (um dict por caso).
+    """
+    quadro = headless.iniciar(LARGURA, ALTURA)
+    if alvo_tipo == "surface":
+        alvo = pygame.Surface((LARGURA, ALTURA), 0, pygame.display.get_surface())
+    else:
+        alvo = quadro
+
+    resultados = []
+    if saida:
+        print(f"{'primitiva':<30} {'parâmetros':<32} {'chamadas/s':>12} {'itens/s':>14}", file=saida)
+    for primitiva, parametros, preparar in CASOS:
+        if filtros and not any(f in primitiva for f in filtros):
+            continue
+        medida = medir_caso(alvo, preparar, tempo_minimo, repeticoes)
+        resultado = {"primitiva": primitiva, "parametros": parametros, **medida}
+        resultado["pixels_por_segundo"] = medida["itens_por_segundo"] if medida["unidade"] == "pixels" else None
+        resultados.append(resultado)
+        if saida:
+            texto = ", ".join(f"{k}={v}" for k, v in parametros.items())
+            print(f"{primitiva:<30} {texto:<32} {medida['chamadas_por_segundo']:>12.1f} "
+                  f"{medida['itens_por_segundo']:>14.0f} {medida['unidade']}", file=saida)
+
+    return {
+        "meta": {
+            "data": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": _commit(),
+            "alvo": alvo_tipo,
+            "tela": [LARGURA, ALTURA],
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "tempo_minimo": tempo_minimo,
+            "repeticoes": repeticoes,
+        },
+        "resultados": resultados,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark das primitivas da engine.")
+    parser.add_argument("--saida", help="arquivo JSON onde gravar os resultados")
+    parser.add_argument("--filtro", nargs="+", help="mede só primitivas cujo nome contém um destes trechos")
+    parser.add_argument("--alvo", choices=("framebuffer", "surface"), default="framebuffer",
+                        help="onde desenhar (padrão: framebuffer, como no gameplay)")
+    parser.add_argument("--tempo", type=float, default=0.2, help="duração mínima de cada medição (s)")
+    parser.add_argument("--repeticoes", type=int, default=3, help="medições por caso (fica a melhor)")
+    parser.add_argument("--rapido", action="store_true", help="atalho para --tempo 0.02 --repeticoes 1")
+    args = parser.parse_args()
+
+    if args.rapido:
+        args.tempo, args.repeticoes = 0.02, 1
+
+    relatorio = executar(args.filtro, args.alvo, args.tempo, args.repeticoes)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados gravados em {args.saida}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,26 @@
 # Implementação do algoritmo Flood Fill iterativo
 # (Requisito c - Preenchimento de Regiões: Flood Fill)
 #
-# Algoritmo baseado em pilha (DFS) que preenche áreas
-# delimitadas por uma cor de borda específica.
-# Utiliza conectividade 4-direcional (cima, baixo, esq, dir).
+# Algoritmo de sementes por intervalos (scanline seed
+# fill): a partir de cada semente, expande para a esquerda
+# e para a direita até a borda, preenche o intervalo
+# inteiro de uma vez e procura, nas linhas de cima e de
+# baixo, os trechos ainda preenchíveis.
+#
+# As leituras vêm de um array de cores empacotadas (a
+# própria memória do FrameBuffer ou da superfície
+# travada), comparadas linha a linha com NumPy. Um mapa
+# de pixels ainda livres funciona como "visitado": cada
+# pixel é preenchido e cada trecho é empilhado uma única
+# vez. Resultado idêntico ao preenchimento 4-conectado.
 # ═══════════════════════════════════════════════════════
 
-from engine.framebuffer import set_pixel
+import numpy as np
+import pygame
+
+from engine.framebuffer import FrameBuffer, fill_span, mapear_cor, travar
 
-# ─── Flood Fill (4-conectado) ───
+# ─── Flood Fill (4-conectado, por intervalos) ───
 def flood_fill_iterativo(superficie, x, y, cor_preenchimento, cor_borda):
     """
     Preenche uma área delimitada por bordas com uma cor específica.
@@ -21,14 +33,21 @@ def flood_fill_iterativo(superficie, x, y, cor_preenchimento, cor_borda):
     
     Algoritmo:
     1. Inicia em um ponto (x, y)
-    2. Preenche o pixel se não for borda ou já preenchido
-    3. Adiciona vizinhos na pilha (4-direções)
-    4. Repete até pilha vazia
+    2. Ignora a semente se for borda ou já preenchida
+    3. Expande para esquerda e direita até encontrar borda
+    4. Preenche o intervalo inteiro de uma vez (fill_span),
+       marca-o como visitado e o empilha
+    5. Para cada intervalo desempilhado, preenche (passos 3-4)
+       cada trecho livre das linhas de cima e de baixo
+    6. Repete até pilha vazia
     
     Características:
     - Iterativo (evita estouro de pilha)
     - 4-conectado (não preenche diagonais)
     - Respeita limites da superfície
+    - Uma escrita por intervalo, não por pixel
+    - Lê cores empacotadas de um array, sem get_at por pixel
+    - Cada pixel é visitado uma única vez (mapa de livres)
     
     Usado na tela de abertura para preencher figuras desenhadas.    
     """
@@ -40,31 +59,81 @@ def flood_fill_iterativo(superficie, x, y, cor_preenchimento, cor_borda):
         superficie (pygame.Surface): Superfície onde o preenchimento será feito.
         x (int): Coordenada x inicial do ponto de partida.
         y (int): Coordenada y inicial do ponto de partida.
-        cor_preenchimento (tuple): Cor RGB usada para preencher a área.
-        cor_borda (tuple): Cor RGB que delimita a área (não deve ser preenchida).
+        cor_preenchimento (tuple | int): Cor RGB (ou já empacotada) usada para preencher a área.
+        cor_borda (tuple | int): Cor RGB (ou já empacotada) que delimita a área (não deve ser preenchida).
 
     Exemplo:
         flood_fill_iterativo(tela, 100, 50, (255, 0, 0), (0, 0, 0))
     """
-    largura = superficie.get_width()
-    altura = superficie.get_height()
+    # Uma única trava para todas as leituras e escritas do preenchimento
+    with travar(superficie) as alvo:
+        largura = alvo.get_width()
+        altura = alvo.get_height()
 
-    pilha = [(x, y)]
+        if not (0 <= x < largura and 0 <= y < altura):
+            return
 
-    while pilha:
-        x, y = pilha.pop()
+        # Compara cores já empacotadas, lidas direto da memória dos pixels
+        preenchimento = mapear_cor(alvo, cor_preenchimento)
+        borda = mapear_cor(alvo, cor_borda) if cor_borda is not None else None
+        if isinstance(alvo, FrameBuffer):
+            pixels = alvo.pixels
+            alfa = alvo.formato.get_masks()[3]
+        else:
+            # Formato sem visão direta (ver travar): lê de uma cópia
+            pixels = pygame.surfarray.array2d(alvo).T
+            alfa = alvo.get_masks()[3]
 
-        if not (0 <= x < largura and 0 <= y < altura):
-            continue
+        # Só o RGB conta, como em get_at(...)[:3]: em superfícies com
+        # canal alfa os bits de alfa são ignorados na comparação
+        alfa &= 0xFFFFFFFF  # get_masks pode devolver a máscara com sinal
+        rgb = np.uint32(~alfa & 0xFFFFFFFF)
+        preenchimento_rgb = preenchimento & int(rgb)
+        borda_rgb = borda & int(rgb) if borda is not None else None
+
+        # Mapa de pixels ainda preenchíveis (nem borda nem preenchimento),
+        # calculado sob demanda só para as linhas que a região alcança.
+        # Cada trecho preenchido é zerado, então serve também de "visitado".
+        livres = [None] * altura
+
+        def linha_livre(py):
+            linha = livres[py]
+            if linha is None:
+                valores = pixels[py] & rgb if alfa else pixels[py]
+                linha = valores != preenchimento_rgb
+                if borda is not None:
+                    linha &= valores != borda_rgb
+                livres[py] = linha
+            return linha
+
+        def preencher_trecho(px, py):
+            """Expande (px, py) até as bordas da linha, preenche e marca o trecho."""
+            linha = livres[py]
+            # argmin de um vetor booleano: primeiro pixel bloqueado
+            passos = int(linha[px::-1].argmin())
+            esquerda = px - passos + 1 if not linha[px - passos] else 0
+            passos = int(linha[px:].argmin())
+            direita = px + passos - 1 if not linha[px + passos] else largura - 1
+
+            fill_span(alvo, py, esquerda, direita, preenchimento)
+            linha[esquerda:direita + 1] = False
+            return py, esquerda, direita
 
-        cor_atual = superficie.get_at((x, y))[:3]
+        if not linha_livre(y)[x]:
+            return
 
-        if cor_atual == cor_borda or cor_atual == cor_preenchimento:
-            continue
+        pilha = [preencher_trecho(x, y)]
 
-        set_pixel(superficie, x, y, cor_preenchimento)
+        while pilha:
+            y, esquerda, direita = pilha.pop()
 
-        pilha.append((x + 1, y))
-        pilha.append((x - 1, y))
-        pilha.append((x, y + 1))
-        pilha.append((x, y - 1))
\ No newline at end of file
+            # Trechos livres acima e abaixo do intervalo
+            for vizinha in (y - 1, y + 1):
+                if not 0 <= vizinha < altura:
+                    continue
+                trecho = linha_livre(vizinha)[esquerda:direita + 1]
+                inicios = np.flatnonzero(trecho[1:] & ~trecho[:-1]) + 1
+                if trecho[0]:
+                    pilha.append(preencher_trecho(esquerda, vizinha))
+                for inicio in inicios:
+                    pilha.append(preencher_trecho(esquerda + int(inicio), vizinha))
@@ -5,16 +5,101 @@
 # Implementação do algoritmo Scanline Fill
 # (Requisito c - Preenchimento de Regiões: Scanline)
 #
-# Preenche polígonos de forma eficiente linha por linha.
+# Preenche polígonos de forma eficiente linha por linha,
+# com tabela global de arestas (ordenada por y mínimo) e
+# lista de arestas ativas: cada aresta só é visitada nas
+# linhas que cruza, e seu x avança de forma incremental
+# (soma de dx por linha), sem recalcular a interseção.
 # Suporta:
 # - Preenchimento sólido
 # - Gradientes de cor (vertical/horizontal)
 # - Mapeamento de texturas
 # ═══════════════════════════════════════════════════════
 
-from engine.framebuffer import set_pixel
+import math
+from engine.framebuffer import fill_span, fill_span_gradient, gradiente_lut
 from engine.math.auxiliary import interpolar_cor
 
+# ─── Tabela de Arestas ───
+def tabela_arestas(pontos):
+    """
+    Monta a tabela global de arestas de um polígono.
+
+    Arestas horizontais são descartadas. Cada aresta vira
+    (y_inicio, y_fim, x0, numerador, dx, dy), com y_inicio a primeira
+    linha inteira que ela cruza. A interseção na linha y_inicio + k é
+    x0 + (numerador + k * dx) / dy: o numerador avança somando dx, o
+    que é exato para vértices inteiros (o x não acumula erro de
+    arredondamento ao longo da aresta). Regra Ymin ≤ y < Ymax.
+
+    Args:
+        pontos (list of tuple): vértices do polígono [(x0,y0), (x1,y1), ...]
+
+    Returns:
+        lista de arestas ordenada por y_inicio
+    """
+    arestas = []
+    n = len(pontos)
+    for i in range(n):
+        x0, y0 = pontos[i]
+        x1, y1 = pontos[(i + 1) % n]
+
+        # Ignora arestas horizontais
+        if y0 == y1:
+            continue
+
+        # Garante y0 < y1
+        if y0 > y1:
+            x0, y0, x1, y1 = x1, y1, x0, y0
+
+        y_inicio = math.ceil(y0)
+        arestas.append((y_inicio, y1, x0, (y_inicio - y0) * (x1 - x0), x1 - x0, y1 - y0))
+
+    arestas.sort(key=lambda aresta: aresta[0])
+    return arestas
+
+
+def intersecoes_scanline(pontos):
+    """
+    Percorre as linhas de um polígono com a lista de arestas ativas.
+
+    A cada linha y, entram na lista as arestas da tabela que começam em
+    y, saem as que terminaram, e as interseções são devolvidas em ordem;
+    depois o numerador de cada aresta ativa avança por dx.
+
+    Linhas percorridas: de int(min(ys)) até int(max(ys)) - 1.
+
+    Args:
+        pontos (list of tuple): vértices do polígono
+
+    Yields:
+        (y, intersecoes_x) com as interseções em ordem crescente
+        (pares consecutivos delimitam os intervalos internos)
+    """
+    ys = [p[1] for p in pontos]
+    y_fim = int(max(ys))
+    tabela = tabela_arestas(pontos)
+    if not tabela:
+        return
+
+    ativas = []  # [y_fim, x0, numerador, dx, dy]
+    proxima = 0
+    for y in range(max(int(min(ys)), tabela[0][0]), y_fim):
+        while proxima < len(tabela) and tabela[proxima][0] <= y:
+            ativas.append(list(tabela[proxima][1:]))
+            proxima += 1
+
+        ativas = [aresta for aresta in ativas if y < aresta[0]]
+        if not ativas and proxima == len(tabela):
+            return
+
+        if ativas:
+            yield y, sorted([x0 + numerador / dy for _, x0, numerador, _, dy in ativas])
+
+        for aresta in ativas:
+            aresta[2] += aresta[3]
+
+
 # ─── Scanline Fill com Cor Sólida ───
 def scanline_fill(superficie, pontos, cor_preenchimento):
     """
@@ -23,10 +108,11 @@ def scanline_fill(superficie, pontos, cor_preenchimento):
     REQUISITO: (c) Preenchimento de Regiões - Scanline
     
     Algoritmo:
-    1. Para cada linha Y do polígono
-    2. Encontra interseções das arestas com a linha
-    3. Ordena interseções
-    4. Preenche entre pares de interseções
+    1. Monta a tabela de arestas ordenada por y mínimo
+    2. Para cada linha Y, atualiza a lista de arestas ativas
+    3. Ordena as interseções (x de cada aresta ativa)
+    4. Preenche entre pares de interseções (um fill_span por intervalo)
+    5. Avança o x de cada aresta ativa (incremental)
     
     Usado no jogo para: jangada, obstáculos, interface, etc.
 
@@ -35,47 +121,13 @@ def scanline_fill(superficie, pontos, cor_preenchimento):
         pontos (list of tuple): Lista de vértices do polígono [(x0,y0), (x1,y1), ...].
         cor_preenchimento (tuple): Cor RGB usada para preencher o polígono.
     """
-    # Encontra Y mínimo e máximo
-    ys = [p[1] for p in pontos]
-    y_min = int(min(ys))
-    y_max = int(max(ys))
-
-    n = len(pontos)
-
-    for y in range(y_min, y_max):
-        intersecoes_x = []
-
-        for i in range(n):
-            x0, y0 = pontos[i]
-            x1, y1 = pontos[(i + 1) % n]
-
-            # Ignora arestas horizontais
-            if y0 == y1:
-                continue
-
-            # Garante y0 < y1
-            if y0 > y1:
-                x0, y0, x1, y1 = x1, y1, x0, y0
-
-            # Regra Ymin ≤ y < Ymax
-            if y < y0 or y >= y1:
-                continue
-
-            # Calcula interseção
-            x = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
-            intersecoes_x.append(x)
-
-        # Ordena interseções
-        intersecoes_x.sort()
-
+    for y, intersecoes_x in intersecoes_scanline(pontos):
         # Preenche entre pares
-        for i in range(0, len(intersecoes_x), 2):
-            if i + 1 < len(intersecoes_x):
-                x_inicio = int(round(intersecoes_x[i]))
-                x_fim = int(round(intersecoes_x[i + 1]))
+        for i in range(0, len(intersecoes_x) - 1, 2):
+            x_inicio = int(round(intersecoes_x[i]))
+            x_fim = int(round(intersecoes_x[i + 1]))
 
-                for x in range(x_inicio, x_fim + 1):
-                    set_pixel(superficie, x, y, cor_preenchimento)
+            fill_span(superficie, y, x_inicio, x_fim, cor_preenchimento)
 
 
 # ─── Scanline Fill com Gradiente ───
@@ -88,6 +140,8 @@ def scanline_fill_gradiente(superficie, pontos, cor_inicio, cor_fim, direcao='ve
     Características:
     - Suporta gradiente vertical ou horizontal
     - Interpola cores suavemente entre cor_inicio e cor_fim
+    - Cores vêm de uma LUT empacotada em cache (gradiente_lut):
+      uma cor por linha (vertical) ou por coluna (horizontal)
     - Usado para dar volume e profundidade aos elementos
     
     Args:
@@ -110,47 +164,29 @@ def scanline_fill_gradiente(superficie, pontos, cor_inicio, cor_fim, direcao='ve
     x_min = min(xs)
     x_max = max(xs)
     
-    n = len(pontos)
-    
-    for y in range(y_min, y_max):
-        intersecoes_x = []
-        
-        for i in range(n):
-            x0, y0 = pontos[i]
-            x1, y1 = pontos[(i + 1) % n]
-            
-            if y0 == y1:
-                continue
-            
-            if y0 > y1:
-                x0, y0, x1, y1 = x1, y1, x0, y0
-            
-            if y < y0 or y >= y1:
-                continue
-            
-            x = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
-            intersecoes_x.append(x)
-        
-        intersecoes_x.sort()
-        
-        for i in range(0, len(intersecoes_x), 2):
-            if i + 1 < len(intersecoes_x):
-                x_inicio = int(round(intersecoes_x[i]))
-                x_fim = int(round(intersecoes_x[i + 1]))
-                
-                for x in range(x_inicio, x_fim + 1):
-                    if direcao == 'vertical':
-                        # Gradiente vertical: t baseado em y
-                        if y_max != y_min:
-                            t = (y - y_min) / (y_max - y_min)
-                        else:
-                            t = 0.5
-                    else:
-                        # Gradiente horizontal: t baseado em x
-                        if x_max != x_min:
-                            t = (x - x_min) / (x_max - x_min)
-                        else:
-                            t = 0.5
-                    
-                    cor = interpolar_cor(cor_inicio, cor_fim, t)
-                    set_pixel(superficie, x, y, cor)
+    if direcao == 'vertical':
+        # Gradiente vertical: uma cor empacotada por linha, de y_min a y_max
+        cores_linha = gradiente_lut(superficie, cor_inicio, cor_fim, y_max - y_min + 1)[:, 0].tolist()
+    elif x_min == int(x_min) and x_max == int(x_max):
+        # Gradiente horizontal: a cor só depende de x, então a rampa é
+        # uma LUT de x_min a x_max (origem em x_min)
+        origem = int(x_min)
+        rampa = gradiente_lut(superficie, cor_inicio, cor_fim, int(x_max) - origem + 1, 'horizontal')[0]
+    else:
+        # Vértices fracionários: t não cai em colunas inteiras, rampa própria
+        origem = math.floor(x_min)
+        rampa = [
+            interpolar_cor(cor_inicio, cor_fim, (x - x_min) / (x_max - x_min) if x_max != x_min else 0.5)
+            for x in range(origem, math.ceil(x_max) + 1)
+        ]
+
+    for y, intersecoes_x in intersecoes_scanline(pontos):
+        for i in range(0, len(intersecoes_x) - 1, 2):
+            x_inicio = int(round(intersecoes_x[i]))
+            x_fim = int(round(intersecoes_x[i + 1]))
+
+            if direcao == 'vertical':
+                fill_span(superficie, y, x_inicio, x_fim, cores_linha[y - y_min])
+            else:
+                # Fatia da rampa correspondente ao intervalo
+                fill_span_gradient(superficie, y, x_inicio, x_fim, rampa, origem)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# ═══════════════════════════════════════════════════════
+# PREENCHIMENTO - POLÍGONO COM TEXTURA
+# ═══════════════════════════════════════════════════════
+# Mapeamento de textura em polígonos via scanline
+# (Requisito h - Textura)
+#
+# Os texels de cada imagem são convertidos uma única vez
+# para arrays NumPy (RGB e empacotados por formato de
+# pixel). Cada vértice do polígono recebe uma coordenada
+# (u, v) da textura; o mapeamento tela → textura é afim,
+# então u e v de um intervalo inteiro são calculados com
+# uma expressão vetorizada e os texels são lidos por
+# indexação NumPy, sem get_at/set_at por pixel.
+# ═══════════════════════════════════════════════════════
+
+import weakref
+
+import numpy as np
+import pygame
+
+from engine.framebuffer import FrameBuffer, fill_span_gradient, mapear_cores
+from engine.fill.scanline import intersecoes_scanline
+
+
+# ─── Textura ───
+class Textura:
+    """
+    Texels de uma imagem pré-calculados para amostragem vetorizada.
+
+    Args:
+        imagem: pygame.Surface com a textura
+
+    Atributos:
+        largura, altura: dimensões da textura em texels
+        rgb: array uint8 (altura, largura, 3) indexado como rgb[v, u]
+
+    Exemplo:
+        ceu = Textura(pygame.image.load("assets/textures/ceu.png").convert())
+        scanline_fill_textura(fb, pontos, ceu, [(0, 0), (1, 0), (1, 1), (0, 1)])
+    """
+
+    def __init__(self, imagem):
+        self.largura, self.altura = imagem.get_size()
+        self.rgb = pygame.surfarray.array3d(imagem).transpose(1, 0, 2).copy()
+        self._empacotadas = {}
+
+    def empacotada(self, superficie):
+        """
+        Texels já no formato de pixel de `superficie` (uint32, altura x largura).
+
+        Convertidos uma vez por formato e guardados na textura.
+        """
+        formato = superficie.formato if isinstance(superficie, FrameBuffer) else superficie
+        chave = (formato.get_bitsize(), formato.get_masks(), formato.get_shifts(), formato.get_losses())
+        try:
+            return self._empacotadas[chave]
+        except KeyError:
+            valores = mapear_cores(superficie, self.rgb.reshape(-1, 3)).reshape(self.altura, self.largura)
+            self._empacotadas[chave] = valores
+            return valores
+
+
+# Texturas já preparadas para cada pygame.Surface (liberadas junto com ela)
+_texturas = weakref.WeakKeyDictionary()
+
+
+def textura_de(imagem):
+    """
+    Retorna a Textura de uma pygame.Surface, preparando-a só na primeira vez.
+
+    Args:
+        imagem: pygame.Surface ou Textura (retornada como está)
+    """
+    if isinstance(imagem, Textura):
+        return imagem
+    try:
+        return _texturas[imagem]
+    except KeyError:
+        textura = Textura(imagem)
+        _texturas[imagem] = textura
+        return textura
+
+
+# ─── Scanline Fill com Textura ───
+def scanline_fill_textura(superficie, pontos, textura, uvs):
+    """
+    Preenche um polígono com textura (mapeamento afim por vértice).
+
+    REQUISITO: (h) Textura
+
+    Algoritmo:
+    1. Ajusta o mapeamento afim (x, y) → (u, v) aos vértices e seus UVs
+    2. Percorre as linhas com a tabela de arestas (intersecoes_scanline)
+    3. Para cada intervalo visível, calcula u e v de todos os pixels de
+       uma vez e converte para texel: (u * (largura - 1), v * (altura - 1))
+    4. Lê os texels empacotados por indexação NumPy e escreve o
+       intervalo inteiro com fill_span_gradient
+
+    Em triângulos o mapeamento passa exatamente pelos UVs dos vértices.
+    Em polígonos maiores ele é o ajuste afim (mínimos quadrados) dos
+    vértices: exato quando os UVs são consistentes com uma transformação
+    afim (retângulos, paralelogramos), como no céu e na areia da
+    introdução.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer onde desenhar
+        pontos: vértices do polígono [(x0, y0), (x1, y1), ...]
+        textura: Textura ou pygame.Surface (preparada uma vez e reaproveitada)
+        uvs: coordenada (u, v) de cada vértice, de 0 a 1 na textura
+
+    Exemplo:
+        ceu = [(0, 0), (largura, 0), (largura, altura // 2), (0, altura // 2)]
+        scanline_fill_textura(tela, ceu, textura_ceu, [(0, 0), (1, 0), (1, 1), (0, 1)])
+    """
+    textura = textura_de(textura)
+    texels = textura.empacotada(superficie)
+    largura, altura = superficie.get_width(), superficie.get_height()
+    ultima_coluna, ultima_linha = textura.largura - 1, textura.altura - 1
+
+    # Mapeamento afim já em texels: [tu, tv] = [x, y, 1] @ coeficientes
+    vertices = np.column_stack([np.asarray(pontos, dtype=np.float64), np.ones(len(pontos))])
+    texel_vertices = np.asarray(uvs, dtype=np.float64) * (ultima_coluna, ultima_linha)
+    coeficientes = np.linalg.lstsq(vertices, texel_vertices, rcond=None)[0]
+    (du_dx, dv_dx), (du_dy, dv_dy), (u0, v0) = coeficientes
+
+    for y, intersecoes_x in intersecoes_scanline(pontos):
+        if not 0 <= y < altura:
+            continue
+        for i in range(0, len(intersecoes_x) - 1, 2):
+            # Só a parte visível do intervalo é amostrada
+            x_inicio = max(int(round(intersecoes_x[i])), 0)
+            x_fim = min(int(round(intersecoes_x[i + 1])), largura - 1)
+            if x_inicio > x_fim:
+                continue
+
+            xs = np.arange(x_inicio, x_fim + 1)
+            tu = (du_dx * xs + (du_dy * y + u0)).astype(np.intp)
+            tv = (dv_dx * xs + (dv_dy * y + v0)).astype(np.intp)
+            np.clip(tu, 0, ultima_coluna, out=tu)
+            np.clip(tv, 0, ultima_linha, out=tv)
+            fill_span_gradient(superficie, y, x_inicio, x_fim, texels[tv, tu], x_inicio)
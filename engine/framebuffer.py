@@ -2,42 +2,867 @@
 # FRAMEBUFFER - SET PIXEL
 # ═══════════════════════════════════════════════════════
 # Implementação da primitiva básica SET PIXEL (Requisito a)
-# 
+#
 # Este módulo fornece a função fundamental para manipulação
 # de pixels individuais na superfície de desenho.
 # Todas as primitivas gráficas do projeto dependem desta função.
+#
+# Além de pygame.Surface, todas as funções aceitam um
+# FrameBuffer: um array NumPy contíguo de pixels empacotados
+# (uint32) que é copiado para a tela de uma só vez no final
+# do quadro (present), evitando Surface.set_at por pixel.
+# Para desenhar direto em uma pygame.Surface, `travar` trava a
+# superfície uma única vez e entrega um FrameBuffer que escreve
+# na própria memória dela.
 # ═══════════════════════════════════════════════════════
 
-def set_pixel(superficie, x, y, color):    
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+
+import numpy as np
+import pygame
+
+from engine.math.auxiliary import rampa_paradas
+
+
+# ─── Framebuffer em Memória (NumPy) ───
+class FrameBuffer:
+    """
+    Framebuffer em memória baseado em um array NumPy contíguo.
+
+    REQUISITO: (a) Set Pixel - acesso direto à "memória de vídeo"
+
+    Os pixels ficam em `pixels`, um array uint32 de forma
+    (altura, largura) indexado como pixels[y, x]. Cada valor é a cor
+    já empacotada no formato de pixel da superfície de destino, de modo
+    que `present` copia o quadro inteiro para a tela sem conversões.
+
+    A classe imita a interface de pygame.Surface usada pelo projeto
+    (get_width, get_height, get_size, set_at, get_at, fill), então pode
+    ser passada no lugar da tela para qualquer primitiva da engine.
+
+    Retângulos sujos: cada primitiva marca a caixa envolvente que tocou
+    em uma grade de ladrilhos de 32x32 pixels. `present_dirty` junta as
+    caixas do quadro atual com as do anterior (que precisam ser apagadas)
+    em retângulos sem sobreposição e copia só essas regiões, para que a
+    cena chame pygame.display.update(retangulos) em vez de flip().
+    Limpar o buffer inteiro com a mesma cor de fundo do quadro anterior
+    não suja a tela toda.
+
+    Args:
+        largura, altura: dimensões do framebuffer em pixels
+        formato: pygame.Surface cujo formato de pixel será usado
+            (normalmente a tela). Se None, usa 32 bits RGB.
+        pixels: array (altura, largura) C-contíguo já existente para
+            usar como memória em vez de alocar um novo (ver `travar`).
+
+    Exemplo:
+        fb = FrameBuffer(1000, 800, tela)
+        set_pixel(fb, 10, 10, (255, 0, 0))
+        pygame.display.update(fb.present_dirty(tela))
+    """
+
+    # Ladrilhos de 2**5 = 32 pixels para o rastreamento de regiões sujas
+    BITS_LADRILHO = 5
+    # Máximo de cores guardadas no cache de mapear_cor (LRU)
+    LIMITE_CORES = 256
+
+    def __init__(self, largura, altura, formato=None, pixels=None):
+        self.largura = largura
+        self.altura = altura
+        # Superfície 1x1 usada apenas para mapear/desmapear cores no formato de destino
+        self.formato = pygame.Surface((1, 1), 0, formato if formato is not None else 32)
+        if pixels is None:
+            pixels = np.zeros((altura, largura), dtype=np.uint32)
+        self.pixels = pixels
+        # Visão linear (memoryview) do mesmo array: escrita escalar mais barata
+        self._memoria = memoryview(self.pixels.reshape(-1))
+        self._cores = OrderedDict()
+
+        # Grade de ladrilhos sujos (1 = tocado no quadro atual)
+        b = self.BITS_LADRILHO
+        self._colunas = ((largura - 1) >> b) + 1
+        self._sujos = np.ones((((altura - 1) >> b) + 1, self._colunas), dtype=np.uint8)
+        self._sujos_memoria = memoryview(self._sujos.reshape(-1))
+        self._sujos_anteriores = np.zeros_like(self._sujos)
+        self._cor_fundo = None
+        self.estatisticas = {"retangulos": 0, "pixels": 0, "fracao": 0.0}
+
+    # ─── Cores ───
+    def mapear_cor(self, cor):
+        """
+        Converte uma cor (R, G, B) para o valor empacotado do formato.
+
+        O resultado é guardado em um cache LRU de até LIMITE_CORES
+        cores, então cada cor usada com frequência é mapeada apenas uma
+        vez, e cores calculadas por pixel (rampas, interpolações) não
+        fazem o cache crescer durante a sessão inteira. Inteiros são
+        tratados como cores já empacotadas e retornados sem conversão.
+        """
+        try:
+            valor = self._cores[cor]
+        except KeyError:
+            # map_rgb devolve inteiro com sinal em formatos com alfa
+            if isinstance(cor, (int, np.integer)):
+                valor = int(cor) & 0xFFFFFFFF
+            else:
+                valor = self.formato.map_rgb(cor) & 0xFFFFFFFF
+            self._cores[cor] = valor
+            if len(self._cores) > self.LIMITE_CORES:
+                self._cores.popitem(last=False)
+            return valor
+        except TypeError:
+            # pygame.Color não é hashable
+            return self.formato.map_rgb(cor) & 0xFFFFFFFF
+        self._cores.move_to_end(cor)
+        return valor
+
+    # ─── Primitivas ───
+    def set_pixel(self, x, y, cor):
+        """Define a cor de um pixel (ignora coordenadas fora do buffer)."""
+        if 0 <= x < self.largura and 0 <= y < self.altura:
+            # Acerto direto no cache, sem renovar a posição no LRU (caminho
+            # mais quente do jogo); uma cor descartada é só mapeada de novo
+            try:
+                valor = self._cores[cor]
+            except (KeyError, TypeError):
+                valor = self.mapear_cor(cor)
+            x = int(x)
+            y = int(y)
+            self._memoria[y * self.largura + x] = valor
+            b = self.BITS_LADRILHO
+            self._sujos_memoria[(y >> b) * self._colunas + (x >> b)] = 1
+
+    def getPixel(self, x, y):
+        """Retorna a cor (pygame.Color) do pixel ou None se fora do buffer."""
+        if 0 <= x < self.largura and 0 <= y < self.altura:
+            return self.formato.unmap_rgb(self._memoria[int(y) * self.largura + int(x)])
+        return None
+
+    def set_pixels(self, xs, ys, cores):
+        """
+        Escreve vários pixels de uma vez (ver `set_pixels` do módulo).
+        """
+        xs, ys, valores = _preparar_lote(self.largura, self.altura, xs, ys, cores, self.formato)
+        self.pixels[ys, xs] = valores
+        b = self.BITS_LADRILHO
+        self._sujos[ys >> b, xs >> b] = 1
+
+    def blend_pixels(self, xs, ys, cor, alfas):
+        """
+        Mistura uma cor em vários pixels com coberturas (ver `blend_pixels` do módulo).
+        """
+        xs, ys, alfas = _preparar_mistura(self.largura, self.altura, xs, ys, alfas)
+        if xs.size == 0:
+            return
+        self.pixels[ys, xs] = _misturar(self.formato, self.pixels[ys, xs], cor, alfas)
+        b = self.BITS_LADRILHO
+        self._sujos[ys >> b, xs >> b] = 1
+
+    def fill_span(self, y, x0, x1, cor):
+        """Preenche o intervalo horizontal [x0, x1] da linha y com uma cor."""
+        intervalo = _recortar_intervalo(self.largura, self.altura, y, x0, x1)
+        if intervalo is not None:
+            y, x0, x1 = intervalo
+            self.pixels[y, x0:x1 + 1] = self.mapear_cor(cor)
+            self.marcar_sujo(x0, y, x1 + 1, y + 1)
+
+    def fill_column(self, x, y0, y1, cor):
+        """Preenche o intervalo vertical [y0, y1] da coluna x com uma cor."""
+        intervalo = _recortar_intervalo(self.altura, self.largura, x, y0, y1)
+        if intervalo is not None:
+            x, y0, y1 = intervalo
+            self.pixels[y0:y1 + 1, x] = self.mapear_cor(cor)
+            self.marcar_sujo(x, y0, x + 1, y1 + 1)
+
+    def fill_span_gradient(self, y, x0, x1, rampa, origem=0):
+        """Preenche [x0, x1] da linha y com rampa[x - origem] (ver módulo)."""
+        intervalo = _recortar_intervalo(self.largura, self.altura, y, x0, x1)
+        if intervalo is not None:
+            y, xa, xb = intervalo
+            valores = _valores_linha(self.formato, rampa[xa - origem:xb - origem + 1])
+            self.pixels[y, xa:xb + 1] = valores
+            self.marcar_sujo(xa, y, xb + 1, y + 1)
+
+    def clear(self, cor=(0, 0, 0)):
+        """
+        Preenche o buffer inteiro com uma cor (preto por padrão).
+
+        Se a cor é a mesma do último clear, o fundo na tela já está
+        correto: só as regiões desenhadas no quadro anterior (já
+        registradas) precisam ser atualizadas.
+        """
+        valor = self.mapear_cor(cor)
+        self.pixels.fill(valor)
+        if valor != self._cor_fundo:
+            self._cor_fundo = valor
+            self.invalidar()
+
+    def clear_rect(self, x, y, largura, altura, cor=(0, 0, 0)):
+        """Preenche um retângulo (recortado contra o buffer) com uma cor."""
+        x0, y0 = max(int(x), 0), max(int(y), 0)
+        x1, y1 = min(int(x + largura), self.largura), min(int(y + altura), self.altura)
+        if x0 < x1 and y0 < y1:
+            self.pixels[y0:y1, x0:x1] = self.mapear_cor(cor)
+            self.marcar_sujo(x0, y0, x1, y1)
+
+    # ─── Regiões Sujas ───
+    def marcar_sujo(self, x0, y0, x1, y1):
+        """
+        Registra a caixa [x0, x1) x [y0, y1) (já recortada) como alterada.
+        """
+        b = self.BITS_LADRILHO
+        self._sujos[y0 >> b:((y1 - 1) >> b) + 1, x0 >> b:((x1 - 1) >> b) + 1] = 1
+
+    def invalidar(self):
+        """
+        Marca o buffer inteiro como sujo.
+
+        Deve ser chamado quando a tela foi alterada por fora do
+        framebuffer (por exemplo, ao voltar de outra cena), para que o
+        próximo present_dirty copie o quadro completo.
+        """
+        self._sujos.fill(1)
+
+    def retangulos_sujos(self):
+        """
+        Junta os ladrilhos sujos do quadro atual e do anterior em
+        retângulos sem sobreposição.
+
+        Ladrilhos consecutivos de uma linha da grade viram um intervalo;
+        intervalos iguais em linhas seguidas da grade são unidos em um
+        único retângulo.
+
+        Returns:
+            lista de pygame.Rect em coordenadas de pixel.
+        """
+        b = self.BITS_LADRILHO
+        mapa = self._sujos | self._sujos_anteriores
+        abertos = {}  # (coluna_inicio, coluna_fim) -> linha de início
+        caixas = []
+        for linha in range(mapa.shape[0] + 1):
+            intervalos = set()
+            if linha < mapa.shape[0]:
+                bordas = np.flatnonzero(np.diff(np.concatenate(([0], mapa[linha], [0]))))
+                intervalos = set(zip(bordas[::2].tolist(), bordas[1::2].tolist()))
+            for chave in list(abertos):
+                if chave not in intervalos:
+                    caixas.append((chave[0], abertos.pop(chave), chave[1], linha))
+            for chave in intervalos:
+                abertos.setdefault(chave, linha)
+
+        retangulos = []
+        for c0, l0, c1, l1 in caixas:
+            x0, y0 = c0 << b, l0 << b
+            x1, y1 = min(c1 << b, self.largura), min(l1 << b, self.altura)
+            retangulos.append(pygame.Rect(x0, y0, x1 - x0, y1 - y0))
+        return retangulos
+
+    def _fechar_quadro(self, retangulos):
+        """Atualiza as estatísticas e começa o rastreamento do próximo quadro."""
+        area = sum(r.w * r.h for r in retangulos)
+        self.estatisticas = {
+            "retangulos": len(retangulos),
+            "pixels": area,
+            "fracao": area / (self.largura * self.altura),
+        }
+        self._sujos, self._sujos_anteriores = self._sujos_anteriores, self._sujos
+        self._sujos.fill(0)
+        self._sujos_memoria = memoryview(self._sujos.reshape(-1))
+
+    # ─── Apresentação ───
+    def present(self, destino):
+        """
+        Copia o quadro para a superfície de destino em uma única operação.
+
+        Args:
+            destino: pygame.Surface do mesmo tamanho e do formato
+                informado no construtor (normalmente a tela).
+        """
+        pygame.surfarray.blit_array(destino, self.pixels.T)
+        self._fechar_quadro([pygame.Rect(0, 0, self.largura, self.altura)])
+
+    def present_dirty(self, destino):
+        """
+        Copia para o destino apenas as regiões alteradas desde o último quadro.
+
+        Args:
+            destino: pygame.Surface do mesmo tamanho e formato (a tela).
+
+        Returns:
+            lista de pygame.Rect copiados, para pygame.display.update().
+            `estatisticas` passa a descrever este quadro: número de
+            retângulos, pixels enviados e fração da tela.
+
+        Exemplo:
+            pygame.display.update(fb.present_dirty(tela))
+        """
+        retangulos = self.retangulos_sujos()
+        if destino.get_bytesize() in (2, 4):
+            visao = pygame.surfarray.pixels2d(destino)
+            for r in retangulos:
+                visao[r.left:r.right, r.top:r.bottom] = self.pixels[r.top:r.bottom, r.left:r.right].T
+            del visao  # libera o lock da superfície
+        elif retangulos:
+            pygame.surfarray.blit_array(destino, self.pixels.T)
+        self._fechar_quadro(retangulos)
+        return retangulos
+
+    # ─── Compatibilidade com pygame.Surface ───
+    def get_width(self):
+        return self.largura
+
+    def get_height(self):
+        return self.altura
+
+    def get_size(self):
+        return (self.largura, self.altura)
+
+    def set_at(self, pos, cor):
+        self.set_pixel(pos[0], pos[1], cor)
+
+    def get_at(self, pos):
+        x, y = pos
+        if 0 <= x < self.largura and 0 <= y < self.altura:
+            return self.formato.unmap_rgb(self._memoria[int(y) * self.largura + int(x)])
+        raise IndexError("pixel index out of range")
+
+    def get_at_mapped(self, pos):
+        x, y = pos
+        if 0 <= x < self.largura and 0 <= y < self.altura:
+            return self._memoria[int(y) * self.largura + int(x)]
+        raise IndexError("pixel index out of range")
+
+    def map_rgb(self, cor):
+        return self.mapear_cor(cor)
+
+    def fill(self, cor, rect=None):
+        if rect is None:
+            self.clear(cor)
+        else:
+            self.clear_rect(*rect, cor=cor)
+
+
+# ─── Trava da Superfície ───
+@contextmanager
+def travar(superficie):
+    """
+    Trava a superfície uma única vez para uma sequência de escritas.
+
+    Surface.set_at trava e destrava a superfície a cada pixel. Dentro
+    do bloco, as primitivas recebem um FrameBuffer montado sobre a
+    própria memória da superfície (surfarray.pixels2d), de modo que
+    set_pixel, get_at e as escritas em lote acessam os pixels direto,
+    com uma única trava para o quadro ou lote inteiro. A trava é
+    liberada ao sair do bloco.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer
+
+    Yields:
+        FrameBuffer que escreve na superfície. Se `superficie` já é um
+        FrameBuffer, ou se o formato não permite a visão direta
+        (3 bytes por pixel, linhas com preenchimento), devolve a
+        própria superfície.
+
+    Observações:
+        - Não use Surface.blit com a superfície de destino dentro do
+          bloco: o Pygame não permite blit em superfície travada.
+
+    Exemplo:
+        with travar(tela) as alvo:
+            draw_text(alvo, "OLA", 10, 10, (255, 255, 255))
+        pygame.display.flip()
+    """
+    if isinstance(superficie, FrameBuffer) or superficie.get_bytesize() not in (2, 4):
+        yield superficie
+        return
+    linhas = pygame.surfarray.pixels2d(superficie).T  # (altura, largura)
+    if not linhas.flags.c_contiguous:
+        del linhas
+        yield superficie
+        return
+    largura, altura = superficie.get_size()
+    quadro = FrameBuffer(largura, altura, superficie, pixels=linhas)
+    del linhas
+    try:
+        yield quadro
+    finally:
+        # Solta todas as referências à memória para destravar a superfície
+        quadro._memoria.release()
+        quadro._memoria = quadro.pixels = None
+
+
+def set_pixel(superficie, x, y, color):
     """
     Define a cor de um pixel específico na superfície.
-    
+
     REQUISITO: (a) Set Pixel - Função primitiva básica
-    
+
     Args:
-        superficie: pygame.Surface onde desenhar
+        superficie: pygame.Surface ou FrameBuffer onde desenhar
         x, y: coordenadas do pixel (inteiros ou float)
-        color: tupla (R, G, B) ou (R, G, B, A)
-    
+        color: tupla (R, G, B), (R, G, B, A) ou inteiro já empacotado
+            (ver `mapear_cor`)
+
     Observações:
         - Verifica limites para não gerar erro.
         - Converte as coordenadas para inteiros.
     """
-    if 0 <= x < superficie.get_width() and 0 <= y < superficie.get_height():
+    if isinstance(superficie, FrameBuffer):
+        superficie.set_pixel(x, y, color)
+    elif 0 <= x < superficie.get_width() and 0 <= y < superficie.get_height():
         superficie.set_at((int(x), int(y)), color)
 
+def set_pixels(superficie, xs, ys, cores):
+    """
+    Define a cor de vários pixels em uma única operação vetorizada.
+
+    Versão em lote de `set_pixel`: a verificação de limites é feita
+    com uma máscara sobre todos os pontos e a escrita é uma única
+    atribuição no array de pixels, sem uma chamada Python por pixel.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer onde desenhar
+        xs, ys: sequências (listas ou arrays NumPy) com as coordenadas
+        cores: uma cor compartilhada por todos os pixels (qualquer
+            sequência RGB/RGBA, pygame.Color ou inteiro já empacotado) ou
+            uma cor por pixel: array NumPy (N, 3) em RGB ou (N,)
+            empacotado, ou lista de N tuplas RGB
+
+    Observações:
+        - Pontos fora da superfície são descartados pela máscara.
+        - Coordenadas float são truncadas como em `set_pixel`.
+        - Se um ponto se repete, prevalece a última ocorrência.
+
+    Exemplo:
+        xs, ys = pontos_bresenham(0, 0, 100, 40)
+        set_pixels(tela, xs, ys, (255, 255, 255))
+    """
+    if isinstance(superficie, FrameBuffer):
+        superficie.set_pixels(xs, ys, cores)
+        return
+
+    xs, ys, valores = _preparar_lote(
+        superficie.get_width(), superficie.get_height(), xs, ys, cores, superficie
+    )
+    if superficie.get_bytesize() in (2, 4):
+        visao = pygame.surfarray.pixels2d(superficie)
+        visao[xs, ys] = valores
+        del visao  # libera o lock da superfície
+    else:
+        # Formatos sem visão 2D (8/24 bits): escreve os valores já mapeados
+        valores = np.broadcast_to(valores, xs.shape)
+        for x, y, v in zip(xs.tolist(), ys.tolist(), valores.tolist()):
+            superficie.set_at((x, y), v)
+
+
+def blend_pixels(superficie, xs, ys, cor, alfas):
+    """
+    Mistura uma cor em vários pixels, cada um com sua cobertura.
+
+    Usada por linhas com antialiasing: o pixel recebe
+    destino + (cor - destino) * alfa. Os valores atuais são lidos do
+    array de pixels, desempacotados, misturados e reescritos de uma vez,
+    sem um get_at/set_at por pixel.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer onde desenhar
+        xs, ys: arrays com as coordenadas inteiras
+        cor: tupla (R, G, B) ou inteiro empacotado
+        alfas: array com a cobertura de cada pixel, de 0 a 1
+
+    Observações:
+        - Pontos fora da superfície são descartados pela máscara.
+        - Se um ponto se repete, as coberturas se acumulam como em
+          misturas sucessivas: 1 - (1 - a1) * (1 - a2) * ...
+    """
+    if isinstance(superficie, FrameBuffer):
+        superficie.blend_pixels(xs, ys, cor, alfas)
+        return
+
+    xs, ys, alfas = _preparar_mistura(superficie.get_width(), superficie.get_height(), xs, ys, alfas)
+    if xs.size == 0:
+        return
+    if superficie.get_bytesize() in (2, 4):
+        visao = pygame.surfarray.pixels2d(superficie)
+        visao[xs, ys] = _misturar(superficie, visao[xs, ys], cor, alfas)
+        del visao  # libera o lock da superfície
+    else:
+        # Formatos sem visão 2D (8/24 bits): lê e escreve pixel a pixel
+        atuais = [superficie.get_at_mapped((x, y)) for x, y in zip(xs.tolist(), ys.tolist())]
+        valores = _misturar(superficie, atuais, cor, alfas)
+        for x, y, v in zip(xs.tolist(), ys.tolist(), valores.tolist()):
+            superficie.set_at((x, y), superficie.unmap_rgb(v))
+
+
+# ─── Intervalos Horizontais (Spans) ───
+def fill_span(superficie, y, x0, x1, cor):
+    """
+    Preenche um intervalo horizontal de pixels com uma cor sólida.
+
+    Primitiva central dos preenchimentos: em vez de um set_pixel por
+    pixel, o intervalo [x0, x1] (inclusivo) da linha y é recortado uma
+    única vez contra os limites da superfície e escrito de uma vez
+    (atribuição de fatia no FrameBuffer, Surface.fill em superfícies).
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer onde desenhar
+        y: linha do intervalo
+        x0, x1: início e fim do intervalo (inclusivos)
+        cor: tupla (R, G, B) ou inteiro empacotado
+
+    Exemplo:
+        fill_span(tela, 100, 20, 80, (0, 0, 255))  # 61 pixels na linha 100
+    """
+    if isinstance(superficie, FrameBuffer):
+        superficie.fill_span(y, x0, x1, cor)
+        return
+    intervalo = _recortar_intervalo(superficie.get_width(), superficie.get_height(), y, x0, x1)
+    if intervalo is not None:
+        y, x0, x1 = intervalo
+        superficie.fill(cor, (x0, y, x1 - x0 + 1, 1))
+
+
+def fill_span_gradient(superficie, y, x0, x1, rampa, origem=0):
+    """
+    Preenche um intervalo horizontal usando uma rampa de cores pré-calculada.
+
+    O pixel x recebe a cor rampa[x - origem]. Assim a rampa de um
+    gradiente horizontal é calculada uma vez por polígono (de x_min a
+    x_max, com origem = x_min) e cada linha apenas recorta a fatia que
+    precisa, sem interpolar cor por pixel.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer onde desenhar
+        y: linha do intervalo
+        x0, x1: início e fim do intervalo (inclusivos)
+        rampa: cores indexadas a partir de `origem` — sequência de tuplas,
+            array (N, 3) em RGB ou array (N,) empacotado
+        origem: coordenada x correspondente a rampa[0]
+    """
+    if isinstance(superficie, FrameBuffer):
+        superficie.fill_span_gradient(y, x0, x1, rampa, origem)
+        return
+    intervalo = _recortar_intervalo(superficie.get_width(), superficie.get_height(), y, x0, x1)
+    if intervalo is not None:
+        y, xa, xb = intervalo
+        _escrever_linha(superficie, y, xa, rampa[xa - origem:xb - origem + 1])
+
+
+# ─── Intervalos Verticais (Colunas) ───
+def fill_column(superficie, x, y0, y1, cor):
+    """
+    Preenche um intervalo vertical de pixels com uma cor sólida.
+
+    Equivalente de fill_span para colunas: o intervalo [y0, y1]
+    (inclusivo) da coluna x é recortado uma vez e escrito de uma vez
+    (atribuição de fatia no FrameBuffer, Surface.fill em superfícies).
+    Usado pelas retas verticais de bresenham.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer onde desenhar
+        x: coluna do intervalo
+        y0, y1: início e fim do intervalo (inclusivos)
+        cor: tupla (R, G, B) ou inteiro empacotado
+    """
+    if isinstance(superficie, FrameBuffer):
+        superficie.fill_column(x, y0, y1, cor)
+        return
+    intervalo = _recortar_intervalo(superficie.get_height(), superficie.get_width(), x, y0, y1)
+    if intervalo is not None:
+        x, y0, y1 = intervalo
+        superficie.fill(cor, (x, y0, 1, y1 - y0 + 1))
+
+
+def _recortar_intervalo(largura, altura, y, x0, x1):
+    """
+    Recorta o intervalo [x0, x1] da linha y contra a superfície.
+
+    Serve também para colunas, trocando os papéis: (altura, largura,
+    x, y0, y1).
+
+    Returns:
+        (y, x0, x1) inteiros e visíveis, ou None se nada é visível.
+    """
+    y = int(y)
+    if not 0 <= y < altura:
+        return None
+    x0 = max(int(x0), 0)
+    x1 = min(int(x1), largura - 1)
+    if x0 > x1:
+        return None
+    return y, x0, x1
+
+
+def _valores_linha(formato, cores):
+    """Converte as cores de uma linha (tuplas, RGB ou empacotadas) para uint32."""
+    cores = np.asarray(cores)
+    if cores.ndim == 1:
+        return cores.astype(np.uint32)
+    return _empacotar_cores(formato, cores)
+
+
+def _escrever_linha(superficie, y, x0, cores):
+    """Escreve uma linha contígua de cores em uma pygame.Surface a partir de (x0, y)."""
+    valores = _valores_linha(superficie, cores)
+    if superficie.get_bytesize() in (2, 4):
+        visao = pygame.surfarray.pixels2d(superficie)
+        visao[x0:x0 + len(valores), y] = valores
+        del visao  # libera o lock da superfície
+    else:
+        for i, v in enumerate(valores.tolist()):
+            superficie.set_at((x0 + i, y), v)
+
+
+def _empacotar_cores(formato, rgb):
+    """
+    Converte um array (N, 3) ou (N, 4) de cores RGB para inteiros
+    empacotados no formato de pixel de `formato` (equivale a map_rgb).
+    """
+    return _empacotar_rgb(rgb, formato.get_losses(), formato.get_shifts(), formato.get_masks()[3])
+
+
+def _empacotar_rgb(rgb, perdas, deslocamentos, alfa):
+    """Empacota um array (N, 3) RGB com as perdas/deslocamentos de um formato."""
+    rgb = np.asarray(rgb, dtype=np.uint32)
+    valores = np.full(rgb.shape[0], alfa, dtype=np.uint32)
+    for canal in range(3):
+        valores |= (rgb[:, canal] >> perdas[canal]) << deslocamentos[canal]
+    return valores
+
+
+def _desempacotar_cores(formato, valores):
+    """Inverso de _empacotar_cores: array (N,) empacotado → (N, 3) RGB."""
+    valores = np.asarray(valores, dtype=np.uint32)
+    rgb = np.empty((valores.shape[0], 3), dtype=np.uint32)
+    mascaras, deslocamentos, perdas = formato.get_masks(), formato.get_shifts(), formato.get_losses()
+    for canal in range(3):
+        rgb[:, canal] = ((valores & mascaras[canal]) >> deslocamentos[canal]) << perdas[canal]
+    return rgb
+
+
+def _misturar(formato, valores, cor, alfas):
+    """Mistura `cor` sobre os valores empacotados com as coberturas `alfas`."""
+    if isinstance(cor, (int, np.integer)):
+        cor = formato.unmap_rgb(int(cor))
+    destino = _desempacotar_cores(formato, valores).astype(np.float64)
+    origem = np.array(tuple(cor)[:3], dtype=np.float64)
+    misturado = destino + (origem - destino) * alfas[:, None]
+    return _empacotar_cores(formato, np.rint(misturado))
+
+
+def _preparar_mistura(largura, altura, xs, ys, alfas):
+    """
+    Aplica a máscara de limites a um lote de misturas e junta pontos repetidos.
+
+    Returns:
+        (xs, ys, alfas): coordenadas únicas dentro da superfície e a
+        cobertura acumulada de cada uma.
+    """
+    xs = np.asarray(xs)
+    ys = np.asarray(ys)
+    alfas = np.asarray(alfas, dtype=np.float64)
+    dentro = (xs >= 0) & (xs < largura) & (ys >= 0) & (ys < altura) & (alfas > 0)
+    indices = ys[dentro].astype(np.intp) * largura + xs[dentro].astype(np.intp)
+    unicos, inverso = np.unique(indices, return_inverse=True)
+    transparencia = np.ones(unicos.size)
+    np.multiply.at(transparencia, inverso, 1.0 - np.minimum(alfas[dentro], 1.0))
+    return unicos % largura, unicos // largura, 1.0 - transparencia
+
+
+def _cor_unica(cores):
+    """
+    Indica se `cores` é uma única cor (inteiro, pygame.Color ou sequência
+    RGB/RGBA, como aceitava set_at) e não uma cor por pixel. Só um array
+    NumPy ou uma sequência de cores alinhada com xs/ys é lido por pixel.
+    """
+    if isinstance(cores, (int, np.integer, pygame.Color)):
+        return True
+    if isinstance(cores, np.ndarray):
+        return False
+    return len(cores) in (3, 4) and np.ndim(cores) == 1
+
+
+def _preparar_lote(largura, altura, xs, ys, cores, formato):
+    """
+    Aplica a máscara de limites a um lote de pixels.
+
+    Returns:
+        (xs, ys, valores): coordenadas inteiras dentro da superfície e
+        o valor empacotado (escalar ou array alinhado com xs/ys).
+    """
+    xs = np.asarray(xs)
+    ys = np.asarray(ys)
+    dentro = (xs >= 0) & (xs < largura) & (ys >= 0) & (ys < altura)
+    xs = xs[dentro].astype(np.intp)
+    ys = ys[dentro].astype(np.intp)
+
+    if _cor_unica(cores):
+        return xs, ys, np.uint32(mapear_cor(formato, cores))
+
+    cores = np.asarray(cores)
+    if cores.ndim == 1:
+        valores = cores.astype(np.uint32)
+    else:
+        valores = _empacotar_cores(formato, cores)
+    return xs, ys, valores[dentro]
+
+
+# ─── Cores Empacotadas ───
+def mapear_cor(superficie, cor):
+    """
+    Converte uma cor para o inteiro empacotado no formato da superfície.
+
+    Todas as funções de escrita deste módulo aceitam o inteiro no lugar
+    da tupla. Mapear a cor uma vez antes de um laço de set_pixel evita
+    que cada pixel repita a conversão RGB → formato (e a alocação da
+    tupla).
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer de destino
+        cor: tupla (R, G, B), pygame.Color ou inteiro (já empacotado)
+
+    Returns:
+        int sem sinal (32 bits) com a cor no formato de pixel da
+        superfície, o mesmo valor gravado no array de pixels.
+
+    Exemplo:
+        branco = mapear_cor(tela, (255, 255, 255))
+        for x in range(100):
+            set_pixel(tela, x, 10, branco)
+    """
+    if isinstance(cor, (int, np.integer)):
+        return int(cor) & 0xFFFFFFFF
+    if isinstance(superficie, FrameBuffer):
+        return superficie.mapear_cor(cor)
+    # map_rgb devolve inteiro com sinal em formatos com alfa
+    return superficie.map_rgb(cor) & 0xFFFFFFFF
+
+
+def mapear_cores(superficie, cores):
+    """
+    Versão em lote de mapear_cor: converte várias cores de uma vez.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer de destino
+        cores: array (N, 3) ou (N, 4) em RGB
+
+    Returns:
+        array uint32 (N,) com as cores no formato de pixel da superfície,
+        aceito por set_pixels e fill_span_gradient.
+    """
+    formato = superficie.formato if isinstance(superficie, FrameBuffer) else superficie
+    return _empacotar_cores(formato, cores)
+
+
+# Paletas já mapeadas, por formato de pixel
+_paletas = {}
+
+
+def mapear_paleta(superficie, paleta):
+    """
+    Mapeia um dicionário de cores para inteiros empacotados, com cache.
+
+    O resultado é guardado por formato de pixel (profundidade, máscaras
+    e deslocamentos), então cada paleta é convertida uma única vez para
+    cada formato de tela.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer que define o formato
+        paleta: dict nome → cor (R, G, B)
+
+    Returns:
+        dict nome → inteiro empacotado (sem sinal, como mapear_cor).
+    """
+    formato = superficie.formato if isinstance(superficie, FrameBuffer) else superficie
+    chave = (
+        formato.get_bitsize(), formato.get_masks(), formato.get_shifts(),
+        formato.get_losses(), tuple(paleta.items()),
+    )
+    try:
+        return _paletas[chave]
+    except KeyError:
+        mapeada = {nome: formato.map_rgb(cor) & 0xFFFFFFFF for nome, cor in paleta.items()}
+        _paletas[chave] = mapeada
+        return mapeada
+
+
+def gradiente_lut(superficie, cor_inicio, cor_fim, comprimento, direcao='vertical'):
+    """
+    Tabela (LUT) de cores empacotadas de um gradiente linear, com cache.
+
+    lut[i] é a cor interpolar_cor(cor_inicio, cor_fim, i / (comprimento - 1))
+    já no formato de pixel da superfície. As tabelas ficam em um cache
+    LRU indexado por (formato, paradas, comprimento, direcao):
+    um gradiente redesenhado a cada quadro não interpola nem converte
+    nenhuma cor, só indexa a tabela por linha ou por coluna.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer que define o formato
+        cor_inicio, cor_fim: tuplas (R, G, B) dos extremos
+        comprimento: número de linhas (vertical) ou colunas (horizontal)
+        direcao: 'vertical' → array (comprimento, 1), uma cor por linha;
+            'horizontal' → array (1, comprimento), uma cor por coluna.
+            Os dois formatos podem ser atribuídos direto a um retângulo
+            de pixels (broadcast do NumPy).
+
+    Returns:
+        array uint32 somente leitura (compartilhado pelo cache)
+
+    Exemplo:
+        lut = gradiente_lut(fb, (0, 0, 80), (0, 120, 255), 800)
+        fb.pixels[:, :] = lut  # fundo inteiro em degradê vertical
+    """
+    return gradiente_lut_paradas(superficie, ((0.0, cor_inicio), (1.0, cor_fim)), comprimento, direcao)
+
+
+def gradiente_lut_paradas(superficie, paradas, comprimento, direcao='vertical'):
+    """
+    Como gradiente_lut, mas com várias paradas de cor.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer que define o formato
+        paradas: sequência de (posicao, (R, G, B)) com posições de 0 a 1
+            (ver engine.math.auxiliary.interpolar_paradas)
+        comprimento: número de linhas ou colunas (t = i / (comprimento - 1))
+        direcao: 'vertical' ou 'horizontal' (ver gradiente_lut)
+
+    Exemplo:
+        # Corpo do peixe: azul → branco → azul, uma cor por linha
+        lut = gradiente_lut_paradas(fb, ((0, azul), (0.5, branco), (1, azul)), 13)
+    """
+    formato = superficie.formato if isinstance(superficie, FrameBuffer) else superficie
+    chave_formato = (formato.get_losses(), formato.get_shifts(), formato.get_masks()[3])
+    paradas = tuple((float(posicao), tuple(cor)) for posicao, cor in paradas)
+    return _gradiente_lut(chave_formato, paradas, int(comprimento), direcao)
+
+
+@lru_cache(maxsize=128)
+def _gradiente_lut(chave_formato, paradas, comprimento, direcao):
+    """Monta a LUT de `gradiente_lut_paradas` (uma vez por chave)."""
+    valores = _empacotar_rgb(rampa_paradas(paradas, comprimento), *chave_formato)
+    forma = (comprimento, 1) if direcao == 'vertical' else (1, comprimento)
+    lut = valores.reshape(forma)
+    lut.setflags(write=False)
+    return lut
+
+
 def getPixel(superficie, x, y):
     """
     Retorna a cor de um pixel específico na superfície.
 
     Args:
-        superficie: pygame.Surface de onde ler
+        superficie: pygame.Surface ou FrameBuffer de onde ler
         x, y: coordenadas do pixel
 
     Returns:
         Tupla da cor (R, G, B) ou (R, G, B, A) se dentro dos limites,
         None caso esteja fora da superfície.
     """
+    if isinstance(superficie, FrameBuffer):
+        return superficie.getPixel(x, y)
     if 0 <= x < superficie.get_width() and 0 <= y < superficie.get_height():
         return superficie.get_at((x, y))
     return None
@@ -46,26 +871,50 @@ def clear(superficie):
     """
     Limpa toda a superfície preenchendo-a com preto (0, 0, 0).
 
+    A limpeza é uma única operação sobre o buffer inteiro (estilo
+    memset), sem percorrer os pixels em Python.
+
     Args:
-        superficie: pygame.Surface a ser limpa
+        superficie: pygame.Surface ou FrameBuffer a ser limpo
     """
-    for y in range(superficie.get_height()):
-        for x in range(superficie.get_width()):
-            superficie.set_at((x, y), (0, 0, 0))
+    clear_color(superficie, (0, 0, 0))
 
 
 def clear_color(superficie, cor):
     """
-    Preenche toda a superfície com uma cor específica usando set_at.
+    Preenche toda a superfície com uma cor em uma única operação.
 
     Args:
-        superficie: pygame.Surface a ser preenchida
+        superficie: pygame.Surface ou FrameBuffer a ser preenchido
         cor: tupla (R, G, B) ou (R, G, B, A) com a cor desejada
-    
+
+    Observações:
+        - A cor é mapeada uma vez e o buffer inteiro é preenchido em uma
+          única operação (ndarray.fill no FrameBuffer, Surface.fill em
+          superfícies).
+    """
+    if isinstance(superficie, FrameBuffer):
+        superficie.clear(cor)
+    else:
+        superficie.fill(cor)
+
+
+def clear_rect(superficie, x, y, largura, altura, cor=(0, 0, 0)):
+    """
+    Preenche apenas um retângulo da superfície (limpeza parcial).
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer
+        x, y: canto superior esquerdo do retângulo
+        largura, altura: dimensões do retângulo
+        cor: tupla (R, G, B) ou inteiro empacotado (preto por padrão)
+
     Observações:
-        - Funciona de forma similar a `Surface.fill`, mas escreve pixel a pixel.
-        - Útil para testes de renderização manual ou efeitos de desenho pixel a pixel.
+        - O retângulo é recortado contra a superfície; partes de fora
+          são ignoradas.
+        - Usado, por exemplo, para o fundo do minimapa.
     """
-    for y in range(superficie.get_height()):
-        for x in range(superficie.get_width()):
-            superficie.set_at((x, y), cor)
\ No newline at end of file
+    if isinstance(superficie, FrameBuffer):
+        superficie.clear_rect(x, y, largura, altura, cor)
+    else:
+        superficie.fill(cor, (x, y, largura, altura))
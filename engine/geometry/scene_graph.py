@@ -0,0 +1,171 @@
+# ═══════════════════════════════════════════════════════
+# GRAFO DE CENA - HIERARQUIA DE TRANSFORMAÇÕES
+# ═══════════════════════════════════════════════════════
+# Nós com transformação local (translação, rotação e
+# escala) organizados em árvore: a matriz de mundo de um
+# nó é a do pai composta com a dele.
+# (Requisito d - Transformações Geométricas)
+#
+# As matrizes ficam em cache. Alterar um nó marca ele e
+# todos os descendentes como sujos; a matriz de mundo só
+# é recalculada quando alguém a lê e ela está suja. No
+# gameplay a câmera é a raiz: mover a câmera atualiza a
+# posição na tela de todas as entidades com uma única
+# matriz composta, sem subtrair o deslocamento à mão em
+# cada desenho.
+# ═══════════════════════════════════════════════════════
+
+from engine.geometry.transform import (
+    compor_matrizes, escala, rotacao, transformar_pontos, translacao,
+)
+
+
+class NoCena:
+    """
+    Nó do grafo de cena.
+
+    A transformação local é T(x, y) · R(angulo) · S(escala): o nó é
+    escalado e girado em torno da própria origem e depois posicionado
+    em (x, y) no sistema de coordenadas do pai.
+
+    Args:
+        nome: identificação do nó (só para depuração)
+        x, y: posição no sistema do pai
+        angulo: rotação em radianos
+        escala: fator de escala uniforme
+        pai: nó pai opcional (o nó é adicionado aos filhos dele)
+
+    Exemplo:
+        camera = NoCena("camera")
+        jangada = NoCena("jangada", 1500, 1500, pai=camera)
+        camera.mover_para(-1000, -1100)
+        jangada.posicao()  # (500.0, 400.0) na tela
+    """
+
+    def __init__(self, nome="", x=0, y=0, angulo=0.0, escala=1.0, pai=None):
+        self.nome = nome
+        self._x = x
+        self._y = y
+        self._angulo = angulo
+        self._escala = escala
+        self.pai = None
+        self.filhos = []
+        self._local = None  # None = precisa recalcular
+        self._mundo = None
+        self._sujo = True  # matriz de mundo desatualizada
+        if pai is not None:
+            pai.adicionar(self)
+
+    # ─── Hierarquia ───
+    def adicionar(self, filho):
+        """Torna `filho` um filho deste nó (removendo-o do pai anterior)."""
+        if filho.pai is not None:
+            filho.pai.remover(filho)
+        filho.pai = self
+        self.filhos.append(filho)
+        filho._marcar_sujo()
+        return filho
+
+    def remover(self, filho):
+        """Desliga `filho` deste nó; ele passa a ser uma raiz."""
+        self.filhos.remove(filho)
+        filho.pai = None
+        filho._marcar_sujo()
+
+    # ─── Transformação Local ───
+    @property
+    def x(self):
+        return self._x
+
+    @property
+    def y(self):
+        return self._y
+
+    @property
+    def angulo(self):
+        return self._angulo
+
+    @property
+    def escala(self):
+        return self._escala
+
+    def mover_para(self, x, y):
+        """Define a posição no sistema do pai (não suja nada se não mudou)."""
+        if x != self._x or y != self._y:
+            self._x = x
+            self._y = y
+            self._alterado()
+
+    def girar_para(self, angulo):
+        """Define a rotação em radianos (não suja nada se não mudou)."""
+        if angulo != self._angulo:
+            self._angulo = angulo
+            self._alterado()
+
+    def escalar_para(self, fator):
+        """Define a escala uniforme (não suja nada se não mudou)."""
+        if fator != self._escala:
+            self._escala = fator
+            self._alterado()
+
+    def _alterado(self):
+        self._local = None
+        self._marcar_sujo()
+
+    def _marcar_sujo(self):
+        """
+        Marca este nó e todos os descendentes para recalcular a matriz
+        de mundo. Se o nó já está sujo, os descendentes também estão.
+        """
+        if self._sujo:
+            return
+        self._sujo = True
+        for filho in self.filhos:
+            filho._marcar_sujo()
+
+    # ─── Matrizes ───
+    @property
+    def local(self):
+        """Matriz local 3x3 (array), recalculada só depois de uma alteração."""
+        if self._local is None:
+            if self._angulo == 0 and self._escala == 1:
+                self._local = compor_matrizes(translacao(self._x, self._y))
+            else:
+                self._local = compor_matrizes(
+                    translacao(self._x, self._y),
+                    rotacao(self._angulo),
+                    escala(self._escala, self._escala),
+                )
+        return self._local
+
+    @property
+    def mundo(self):
+        """
+        Matriz de mundo 3x3 (array): pai.mundo · local.
+
+        Recalculada só se o nó ou algum ancestral mudou desde a última
+        leitura; caso contrário devolve a matriz em cache.
+        """
+        if self._sujo:
+            if self.pai is None:
+                self._mundo = self.local
+            else:
+                self._mundo = self.pai.mundo @ self.local
+            self._sujo = False
+        return self._mundo
+
+    # ─── Consulta ───
+    def posicao(self):
+        """Posição (x, y) da origem do nó no sistema da raiz."""
+        m = self.mundo
+        return float(m[0, 2]), float(m[1, 2])
+
+    def transformar(self, pontos, arredondar=False):
+        """
+        Leva pontos do sistema do nó para o da raiz (uma multiplicação
+        para o lote inteiro, ver transformar_pontos).
+        """
+        return transformar_pontos(self.mundo, pontos, arredondar)
+
+    def __repr__(self):
+        return f"NoCena({self.nome!r}, x={self._x}, y={self._y}, angulo={self._angulo}, escala={self._escala})"
@@ -10,10 +10,18 @@
 # - Rotação: gira objetos em torno de um pivô
 #
 # Utiliza matrizes homogêneas 3x3 para compor transformações.
+#
+# O caminho em lote usa NumPy: matrizes como arrays 3x3
+# float64 e conjuntos de pontos como arrays (N, 2), com uma
+# única multiplicação de matrizes por lote. As funções com
+# listas (multiplica_matrizes, aplica_transformacao) são
+# envoltórios finos sobre ele.
 # ═══════════════════════════════════════════════════════
 
 import math
 
+import numpy as np
+
 # ─── Matrizes de Transformação 2D (Homogêneas 3x3) ───
 def identidade():
     """Matriz identidade 3x3 (nenhuma transformação)."""
@@ -73,15 +81,70 @@ def rotacao(theta):
         [ 0,  0, 1]
     ]
 
+# ─── Lotes de Pontos (NumPy) ───
+def como_matriz(m):
+    """Converte uma matriz 3x3 (listas ou array) para array float64."""
+    return np.asarray(m, dtype=np.float64)
+
+
+def compor_matrizes(*matrizes):
+    """
+    Compõe várias matrizes 3x3: compor_matrizes(a, b, c) = a @ (b @ c).
+
+    A última matriz é a primeira transformação aplicada aos pontos,
+    como em multiplica_matrizes(a, multiplica_matrizes(b, c)).
+
+    Returns:
+        array float64 3x3
+    """
+    resultado = como_matriz(matrizes[-1])
+    for m in reversed(matrizes[:-1]):
+        resultado = como_matriz(m) @ resultado
+    return resultado
+
+
+def transformar_pontos(m, pontos, arredondar=False):
+    """
+    Aplica uma matriz 3x3 a um conjunto de pontos de uma só vez.
+
+    Os pontos são tratados como coordenadas homogêneas (x, y, 1):
+    a parte linear é uma única multiplicação de matrizes para o lote
+    inteiro e a translação é somada por broadcast.
+
+    Args:
+        m: matriz 3x3 (listas ou array)
+        pontos: array (N, 2) ou sequência de tuplas (x, y)
+        arredondar: se True, arredonda para o inteiro mais próximo
+            (metade para o par, como round) e devolve inteiros
+
+    Returns:
+        array (N, 2) float64, ou intp se arredondar
+
+    Exemplo:
+        m = compor_matrizes(translacao(100, 50), rotacao(math.pi / 4))
+        vertices = transformar_pontos(m, vertices, arredondar=True)
+    """
+    m = como_matriz(m)
+    pontos = np.asarray(pontos, dtype=np.float64).reshape(-1, 2)
+    novos = pontos @ m[:2, :2].T + m[:2, 2]
+    if arredondar:
+        return np.rint(novos).astype(np.intp)
+    return novos
+
+
+def matriz_rotacao_em_torno_de(cx, cy, theta):
+    """Matriz (array 3x3) que rotaciona theta radianos em torno do pivô (cx, cy)."""
+    return compor_matrizes(translacao(cx, cy), rotacao(theta), translacao(-cx, -cy))
+
+
 # ─── Operações com Matrizes ───
 def multiplica_matrizes(a, b):
-    """Multiplica duas matrizes 3x3 para compor transformações."""
-    r = [[0]*3 for _ in range(3)]
-    for i in range(3):
-        for j in range(3):
-            for k in range(3):
-                r[i][j] += a[i][k] * b[k][j]
-    return r
+    """
+    Multiplica duas matrizes 3x3 para compor transformações.
+
+    Envoltório de compor_matrizes que devolve listas.
+    """
+    return compor_matrizes(a, b).tolist()
 
 def cria_transformacao():
     """Inicializa uma transformação identidade."""
@@ -96,15 +159,12 @@ def aplica_transformacao(m, pontos):
         pontos: lista de tuplas (x, y)
     
     Returns:
-        lista de pontos transformados
-    """
-    novos = []
-    for x, y in pontos:
-        v = [x, y, 1]
-        x_novo = m[0][0]*v[0] + m[0][1]*v[1] + m[0][2]
-        y_novo = m[1][0]*v[0] + m[1][1]*v[1] + m[1][2]
-        novos.append((round(x_novo), round(y_novo)))
-    return novos
+        lista de tuplas (x, y) inteiras (arredondadas)
+
+    Envoltório de transformar_pontos; para milhares de vértices por
+    quadro, use transformar_pontos direto e mantenha o array.
+    """
+    return list(map(tuple, transformar_pontos(m, pontos, arredondar=True).tolist()))
 
 
 # ─── Rotação em Torno de um Pivô ───
@@ -129,11 +189,7 @@ def rotacionar_pontos_em_torno_de(pontos, cx, cy, theta):
     Returns:
         lista de pontos rotacionados
     """
-    t_neg = translacao(-cx, -cy)
-    r = rotacao(theta)
-    t_pos = translacao(cx, cy)
-    m = multiplica_matrizes(t_pos, multiplica_matrizes(r, t_neg))
-    return aplica_transformacao(m, pontos)
+    return aplica_transformacao(matriz_rotacao_em_torno_de(cx, cy, theta), pontos)
 
 # =====================================================
 # Polígono em coordenadas absolutas
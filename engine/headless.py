@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# ═══════════════════════════════════════════════════════
+# HEADLESS - RENDERIZAÇÃO SEM JANELA
+# ═══════════════════════════════════════════════════════
+# Backend fora da tela para benchmarks e integração contínua.
+#
+# Usa os drivers "dummy" do SDL (sem janela e sem áudio),
+# desenha em um FrameBuffer em memória e grava os quadros
+# em PPM (P6, sem dependências) ou PNG (pygame.image.save).
+#
+# Deve ser iniciado antes de qualquer outro uso do pygame,
+# pois os drivers do SDL são lidos na inicialização.
+# ═══════════════════════════════════════════════════════
+
+import os
+import time
+
+import pygame
+
+from engine.framebuffer import FrameBuffer
+
+
+# ─── Inicialização ───
+def iniciar(largura, altura):
+    """
+    Prepara o pygame sem janela e cria o framebuffer de desenho.
+
+    Define SDL_VIDEODRIVER e SDL_AUDIODRIVER como "dummy" (sem
+    sobrescrever valores já definidos) e cria um modo de vídeo
+    fictício, necessário para Surface.convert() ao carregar texturas.
+
+    Args:
+        largura, altura: dimensões do quadro em pixels
+
+    Returns:
+        FrameBuffer no formato de pixel da tela fictícia.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.display.init()
+    tela = pygame.display.set_mode((largura, altura))
+    return FrameBuffer(largura, altura, tela)
+
+
+# ─── Conversão e Gravação ───
+def para_rgb(superficie):
+    """
+    Retorna os pixels como array NumPy (altura, largura, 3) em RGB.
+
+    Args:
+        superficie: FrameBuffer ou pygame.Surface
+    """
+    if isinstance(superficie, FrameBuffer):
+        copia = pygame.Surface(superficie.get_size(), 0, superficie.formato)
+        # Cópia direta: present() encerraria o quadro do rastreamento de regiões sujas
+        pygame.surfarray.blit_array(copia, superficie.pixels.T)
+        superficie = copia
+    return pygame.surfarray.array3d(superficie).transpose(1, 0, 2)
+
+
+def salvar_ppm(superficie, caminho):
+    """Grava o quadro em PPM binário (P6)."""
+    rgb = para_rgb(superficie)
+    altura, largura = rgb.shape[:2]
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(b"P6\n%d %d\n255\n" % (largura, altura))
+        arquivo.write(rgb.tobytes())
+
+
+def salvar_png(superficie, caminho):
+    """Grava o quadro em PNG (via pygame.image.save)."""
+    rgb = para_rgb(superficie)
+    pygame.image.save(pygame.surfarray.make_surface(rgb.transpose(1, 0, 2)), caminho)
+
+
+def salvar_quadro(superficie, caminho):
+    """
+    Grava o quadro escolhendo o formato pela extensão (.ppm ou .png).
+
+    Raises:
+        ValueError: se a extensão não for suportada.
+    """
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao == ".ppm":
+        salvar_ppm(superficie, caminho)
+    elif extensao == ".png":
+        salvar_png(superficie, caminho)
+    else:
+        raise ValueError(f"Formato não suportado: {extensao} (use .ppm ou .png)")
+
+
+# ─── Medição ───
+def medir(desenhar, quadros):
+    """
+    Executa `desenhar(i)` para i = 0..quadros-1 e mede o tempo.
+
+    Args:
+        desenhar: função que desenha o quadro i
+        quadros: número de quadros
+
+    Returns:
+        dict com quadros, segundos, ms_por_quadro e quadros_por_segundo.
+    """
+    inicio = time.perf_counter()
+    for i in range(quadros):
+        desenhar(i)
+    segundos = time.perf_counter() - inicio
+    return {
+        "quadros": quadros,
+        "segundos": segundos,
+        "ms_por_quadro": segundos / quadros * 1000 if quadros else 0.0,
+        "quadros_por_segundo": quadros / segundos if segundos else 0.0,
+    }
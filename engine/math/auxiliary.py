@@ -5,8 +5,14 @@
 #
 # Inclui:
 # - Interpolação linear de cores (usado em gradientes)
+# - Interpolação vetorizada e com várias paradas de cor
+# - Rampas de cores pré-calculadas (com cache LRU)
 # ═══════════════════════════════════════════════════════════════
 
+from functools import lru_cache
+
+import numpy as np
+
 def interpolar_cor(cor1, cor2, t):
     """
     Interpolação linear entre duas cores RGB.
@@ -32,4 +38,122 @@ def interpolar_cor(cor1, cor2, t):
     r = int(r1 + (r2 - r1) * t)
     g = int(g1 + (g2 - g1) * t)
     b = int(b1 + (b2 - b1) * t)
-    return (r, g, b)
\ No newline at end of file
+    return (r, g, b)
+
+
+def interpolar_cores(cor1, cor2, t, superficie=None):
+    """
+    Versão vetorizada de interpolar_cor: interpola para vários t de uma vez.
+
+    Para t[i] em [0, 1], cada elemento do resultado é igual a
+    interpolar_cor(cor1, cor2, t[i]) (mesma fórmula e truncamento),
+    calculado com NumPy em uma chamada. Diferente de interpolar_cor, que
+    extrapola, t fora de [0, 1] é limitado ao intervalo: t < 0 dá cor1 e
+    t > 1 dá cor2.
+
+    Args:
+        cor1: tupla (R, G, B) em t = 0
+        cor2: tupla (R, G, B) em t = 1
+        t: array (ou sequência) de fatores de interpolação, de qualquer
+            forma; valores fora de [0, 1] são limitados ao intervalo
+        superficie: se informada (pygame.Surface ou FrameBuffer), devolve
+            as cores já empacotadas no formato de pixel dela
+
+    Returns:
+        array uint8 com forma t.shape + (3,) em RGB, ou uint32 com a
+        forma de t se `superficie` foi informada
+
+    Exemplo:
+        interpolar_cores((0, 0, 0), (255, 255, 255), [0, 0.5, 1])
+        # → [[0, 0, 0], [127, 127, 127], [255, 255, 255]]
+    """
+    return interpolar_paradas(((0.0, cor1), (1.0, cor2)), t, superficie)
+
+
+def interpolar_paradas(paradas, t, superficie=None):
+    """
+    Gradiente com várias paradas de cor, para vários t de uma vez.
+
+    Entre duas paradas consecutivas (p0, c0) e (p1, c1) a cor é
+    interpolar_cor(c0, c1, (t - p0) / (p1 - p0)). Valores de t fora das
+    paradas são limitados a elas e ficam com a cor da parada mais próxima
+    (interpolar_cor, ao contrário, extrapolaria).
+
+    Args:
+        paradas: sequência de (posicao, (R, G, B)) em ordem crescente de
+            posição, ex.: ((0, azul), (0.5, branco), (1, azul))
+        t: array (ou sequência) de posições, de qualquer forma
+        superficie: se informada, devolve as cores empacotadas (ver
+            interpolar_cores)
+
+    Returns:
+        array uint8 t.shape + (3,) em RGB, ou uint32 com a forma de t
+
+    Exemplo:
+        # Corpo do peixe: azul → branco → azul, uma cor por linha
+        t = np.arange(13) / 12
+        cores = interpolar_paradas(((0, azul), (0.5, branco), (1, azul)), t)
+    """
+    t = np.asarray(t, dtype=np.float64)
+    posicoes = np.array([p for p, _ in paradas], dtype=np.float64)
+    cores = np.array([c[:3] for _, c in paradas], dtype=np.float64)
+
+    # Trecho de cada t: paradas k e k + 1 com posicoes[k] <= t <= posicoes[k + 1]
+    t = np.clip(t, posicoes[0], posicoes[-1])
+    k = np.clip(np.searchsorted(posicoes, t, side='right') - 1, 0, len(posicoes) - 2)
+    inicio, fim = posicoes[k], posicoes[k + 1]
+    # Paradas na mesma posição: troca abrupta de cor (sem divisão por zero)
+    local = np.divide(t - inicio, fim - inicio, out=np.ones_like(t), where=fim > inicio)
+
+    c0, c1 = cores[k], cores[k + 1]
+    rgb = (c0 + (c1 - c0) * local[..., None]).astype(np.uint8)
+
+    if superficie is None:
+        return rgb
+    from engine.framebuffer import mapear_cores  # import local: framebuffer importa este módulo
+    return mapear_cores(superficie, rgb.reshape(-1, 3)).reshape(t.shape)
+
+
+@lru_cache(maxsize=256)
+def rampa_cores(cor_inicio, cor_fim, comprimento):
+    """
+    Calcula de uma vez as `comprimento` cores de um gradiente linear.
+
+    rampa[i] é igual a interpolar_cor(cor_inicio, cor_fim, i / (comprimento - 1))
+    (t = 0.5 se comprimento == 1), calculado com NumPy para todos os i.
+    O resultado fica em cache (LRU): o mesmo gradiente desenhado a cada
+    quadro é interpolado uma única vez.
+
+    Args:
+        cor_inicio: tupla (R, G, B) em i = 0
+        cor_fim: tupla (R, G, B) em i = comprimento - 1
+        comprimento: número de cores da rampa
+
+    Returns:
+        array uint8 (comprimento, 3) somente leitura (compartilhado pelo cache)
+
+    Exemplo:
+        rampa_cores((0, 0, 0), (255, 255, 255), 3)  # → [[0,0,0], [127,127,127], [255,255,255]]
+    """
+    return rampa_paradas(((0.0, cor_inicio), (1.0, cor_fim)), comprimento)
+
+
+@lru_cache(maxsize=256)
+def rampa_paradas(paradas, comprimento):
+    """
+    Como rampa_cores, mas com várias paradas de cor (interpolar_paradas).
+
+    Args:
+        paradas: tupla de (posicao, (R, G, B)) com posições de 0 a 1
+        comprimento: número de cores da rampa (t = i / (comprimento - 1))
+
+    Returns:
+        array uint8 (comprimento, 3) somente leitura (compartilhado pelo cache)
+    """
+    if comprimento == 1:
+        t = np.array([0.5])
+    else:
+        t = np.arange(comprimento) / (comprimento - 1)
+    rampa = interpolar_paradas(paradas, t)
+    rampa.setflags(write=False)
+    return rampa
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# ═══════════════════════════════════════════════════════
+# PERFIL DE QUADRO - TEMPO POR ETAPA
+# ═══════════════════════════════════════════════════════
+# Mede o tempo de cada etapa de um quadro (entrada,
+# colisões, desenho de cada entidade, apresentação) com
+# time.perf_counter e mantém médias móveis das últimas
+# N medições, para descobrir qual etapa estoura o
+# orçamento de 16 ms (60 FPS).
+#
+# O histórico quadro a quadro pode ser exportado em CSV
+# para análise posterior.
+# ═══════════════════════════════════════════════════════
+
+import csv
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Orçamento de um quadro a 60 FPS, em milissegundos
+ORCAMENTO_MS = 1000 / 60
+
+
+class FrameProfiler:
+    """
+    Cronômetro por etapa com médias móveis e histórico por quadro.
+
+    Args:
+        janela: número de quadros usados nas médias móveis e no gráfico
+        limite_historico: máximo de quadros guardados para o CSV
+            (os mais antigos são descartados)
+
+    Exemplo:
+        perfil = FrameProfiler()
+        perfil.inicio_quadro()
+        with perfil.etapa("peixe"):
+            draw_fish(fb, x, y)
+        perfil.fim_quadro()
+        perfil.medias()  # {"peixe": 0.42, ...} em ms
+    """
+
+    def __init__(self, janela=60, limite_historico=36000):
+        self.janela = janela
+        self.etapas = []  # nomes na ordem em que apareceram
+        self._amostras = {}  # nome -> deque com os últimos tempos (ms)
+        self.quadros = deque(maxlen=janela)  # tempo total dos últimos quadros (ms)
+        self.historico = deque(maxlen=limite_historico)  # (quadro, total_ms, {etapa: ms})
+        self._atual = {}
+        self._inicio = None
+        self._contador = 0
+
+    # ─── Medição ───
+    def inicio_quadro(self):
+        """Marca o início de um quadro."""
+        self._atual = {}
+        self._inicio = time.perf_counter()
+
+    @contextmanager
+    def etapa(self, nome):
+        """
+        Mede o bloco como a etapa `nome` do quadro atual.
+
+        Chamadas repetidas com o mesmo nome no mesmo quadro são somadas.
+        """
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - inicio) * 1000
+            self._atual[nome] = self._atual.get(nome, 0.0) + ms
+
+    def fim_quadro(self):
+        """
+        Fecha o quadro: registra o tempo total e o de cada etapa.
+
+        Returns:
+            tempo total do quadro em ms.
+        """
+        total = (time.perf_counter() - self._inicio) * 1000
+        for nome, ms in self._atual.items():
+            if nome not in self._amostras:
+                self.etapas.append(nome)
+                self._amostras[nome] = deque(maxlen=self.janela)
+            self._amostras[nome].append(ms)
+        self.quadros.append(total)
+        self.historico.append((self._contador, total, self._atual))
+        self._contador += 1
+        return total
+
+    # ─── Consulta ───
+    def medias(self):
+        """Média móvel (ms) de cada etapa, na ordem em que as etapas apareceram."""
+        return {nome: sum(self._amostras[nome]) / len(self._amostras[nome]) for nome in self.etapas}
+
+    def media_quadro(self):
+        """Média móvel (ms) do tempo total do quadro."""
+        return sum(self.quadros) / len(self.quadros) if self.quadros else 0.0
+
+    def exportar_csv(self, caminho):
+        """
+        Grava o histórico em CSV: uma linha por quadro, com o tempo total
+        e uma coluna por etapa (em ms; vazio se a etapa não rodou).
+
+        Returns:
+            número de quadros gravados.
+        """
+        with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(["quadro", "total_ms"] + self.etapas)
+            for quadro, total, etapas in self.historico:
+                escritor.writerow(
+                    [quadro, f"{total:.4f}"]
+                    + [f"{etapas[nome]:.4f}" if nome in etapas else "" for nome in self.etapas]
+                )
+        return len(self.historico)
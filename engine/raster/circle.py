@@ -6,9 +6,18 @@
 #
 # Utiliza o algoritmo do ponto médio (Midpoint Circle Algorithm)
 # baseado na simetria de 8 octantes do círculo.
+#
+# O traçado só depende do raio: o centro apenas desloca
+# os pixels. Os deslocamentos de cada raio ficam em um
+# cache LRU (moldes), e desenhar vira somar o centro ao
+# molde e escrever tudo com set_pixels.
 # ═══════════════════════════════════════════════════════
 
-from engine.framebuffer import set_pixel
+from functools import lru_cache
+
+import numpy as np
+
+from engine.framebuffer import set_pixel, set_pixels
 
 # ─── Plotagem de 8 Pontos Simétricos ───
 def get_circle_points(superficie, xc, yc, x, y, cor):
@@ -28,26 +37,27 @@ def get_circle_points(superficie, xc, yc, x, y, cor):
     set_pixel(superficie, xc - y, yc - x, cor)
 
 # ─── Algoritmo do Ponto Médio ───
-def draw_circle(superficie, xc, yc, raio, cor):
+def pontos_circulo(xc, yc, raio):
     """
-    Desenha uma circunferência usando o algoritmo do ponto médio.
-    
-    REQUISITO: (b) Primitivas de Rasterização - Circunferência
-    
-    Características:
-    - Usa apenas aritmética inteira
-    - Calcula apenas 1/8 do círculo e usa simetria
-    - Eficiente para círculos de qualquer tamanho
-    
-    Usado no jogo para: sol, olhos de personagens, ícones, etc.
+    Calcula os pixels da circunferência (ponto médio), sem desenhar.
+
+    Returns:
+        (xs, ys): listas com os pontos dos 8 octantes, na mesma ordem
+        em que get_circle_points os desenharia.
     """
+    xs = []
+    ys = []
+
     x = 0
     y = raio
     d = 1 - raio  # Variável de decisão
 
-    get_circle_points(superficie, xc, yc, x, y, cor)
+    while True:
+        xs.extend((xc + x, xc - x, xc + x, xc - x, xc + y, xc - y, xc + y, xc - y))
+        ys.extend((yc + y, yc + y, yc - y, yc - y, yc + x, yc + x, yc - x, yc - x))
 
-    while x < y:
+        if not x < y:
+            break
         x += 1
 
         # Atualiza variável de decisão
@@ -57,4 +67,41 @@ def draw_circle(superficie, xc, yc, raio, cor):
             y -= 1
             d += 2 * (x - y) + 1
 
-        get_circle_points(superficie, xc, yc, x, y, cor)
+    return xs, ys
+
+# ─── Moldes (Cache de Deslocamentos) ───
+@lru_cache(maxsize=256)
+def molde_circulo(raio):
+    """
+    Deslocamentos (dx, dy) dos pixels da circunferência em torno do centro.
+
+    Calculados uma vez por raio com pontos_circulo(0, 0, raio) e
+    guardados em um cache LRU (os 256 raios mais usados). Os arrays são
+    somente leitura, compartilhados entre todas as chamadas.
+
+    Returns:
+        (dx, dy): arrays com os deslocamentos, na ordem de pontos_circulo.
+    """
+    dx, dy = (np.array(v) for v in pontos_circulo(0, 0, raio))
+    dx.setflags(write=False)
+    dy.setflags(write=False)
+    return dx, dy
+
+def draw_circle(superficie, xc, yc, raio, cor):
+    """
+    Desenha uma circunferência usando o algoritmo do ponto médio.
+    
+    REQUISITO: (b) Primitivas de Rasterização - Circunferência
+    
+    Características:
+    - Usa apenas aritmética inteira
+    - Calcula apenas 1/8 do círculo e usa simetria
+    - Eficiente para círculos de qualquer tamanho
+    - Todos os pixels são escritos de uma vez com set_pixels
+    - O traçado de cada raio é calculado uma vez (molde_circulo) e
+      apenas transladado para o centro nas chamadas seguintes
+    
+    Usado no jogo para: sol, olhos de personagens, ícones, etc.
+    """
+    dx, dy = molde_circulo(raio)
+    set_pixels(superficie, dx + xc, dy + yc, cor)
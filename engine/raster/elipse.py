@@ -6,9 +6,17 @@
 #
 # Utiliza o algoritmo do ponto médio para elipses,
 # dividido em duas regiões para maior precisão.
+#
+# Como na circunferência, o traçado só depende de rx e
+# ry: os deslocamentos de cada par ficam em um cache LRU
+# (moldes) e desenhar é transladá-los para o centro.
 # ═══════════════════════════════════════════════════════
 
-from engine.framebuffer import set_pixel
+from functools import lru_cache
+
+import numpy as np
+
+from engine.framebuffer import set_pixel, set_pixels
 
 # ─── Plotagem de 4 Pontos Simétricos ───
 def get_elipse_points(superficie, xc, yc, x, y, cor):
@@ -24,25 +32,17 @@ def get_elipse_points(superficie, xc, yc, x, y, cor):
     set_pixel(superficie, xc - x, yc - y, cor)
 
 # ─── Algoritmo do Ponto Médio para Elipse ───
-def draw_elipse(superficie, xc, yc, rx, ry, cor):
+def pontos_elipse(xc, yc, rx, ry):
     """
-    Desenha uma elipse usando o algoritmo do ponto médio.
-    
-    REQUISITO: (b) Primitivas de Rasterização - Elipse
-    
-    Características:
-    - Divide o desenho em 2 regiões para precisão
-    - Usa apenas aritmética inteira
-    - Suporta elipses de qualquer proporção
-    
-    Args:
-        xc, yc: Centro da elipse
-        rx: Raio no eixo X
-        ry: Raio no eixo Y
-        cor: Cor da elipse
-    
-    Usado no jogo para: peixes, ondas, elementos decorativos.
+    Calcula os pixels da elipse (ponto médio), sem desenhar.
+
+    Returns:
+        (xs, ys): listas com os pontos dos 4 quadrantes, na mesma ordem
+        em que get_elipse_points os desenharia.
     """
+    xs = []
+    ys = []
+
     x = 0
     y = ry
 
@@ -56,7 +56,8 @@ def draw_elipse(superficie, xc, yc, rx, ry, cor):
     p1 = ry2 - (rx2 * ry) + (0.25 * rx2)
 
     while dx < dy:
-        get_elipse_points(superficie, xc, yc, x, y, cor)
+        xs.extend((xc + x, xc - x, xc + x, xc - x))
+        ys.extend((yc + y, yc + y, yc - y, yc - y))
 
         x += 1
         dx += 2 * ry2
@@ -72,7 +73,8 @@ def draw_elipse(superficie, xc, yc, rx, ry, cor):
     p2 = (ry2 * (x + 0.5) * (x + 0.5)) + (rx2 * (y - 1) * (y - 1)) - (rx2 * ry2)
 
     while y >= 0:
-        get_elipse_points(superficie, xc, yc, x, y, cor)
+        xs.extend((xc + x, xc - x, xc + x, xc - x))
+        ys.extend((yc + y, yc + y, yc - y, yc - y))
 
         y -= 1
         dy -= 2 * rx2
@@ -83,3 +85,48 @@ def draw_elipse(superficie, xc, yc, rx, ry, cor):
             x += 1
             dx += 2 * ry2
             p2 += rx2 - dy + dx
+
+    return xs, ys
+
+# ─── Moldes (Cache de Deslocamentos) ───
+@lru_cache(maxsize=256)
+def molde_elipse(rx, ry):
+    """
+    Deslocamentos (dx, dy) dos pixels da elipse em torno do centro.
+
+    Calculados uma vez por (rx, ry) com pontos_elipse(0, 0, rx, ry) e
+    guardados em um cache LRU (os 256 pares mais usados), como arrays
+    somente leitura.
+
+    Returns:
+        (dx, dy): arrays com os deslocamentos, na ordem de pontos_elipse.
+    """
+    dx, dy = (np.array(v) for v in pontos_elipse(0, 0, rx, ry))
+    dx.setflags(write=False)
+    dy.setflags(write=False)
+    return dx, dy
+
+def draw_elipse(superficie, xc, yc, rx, ry, cor):
+    """
+    Desenha uma elipse usando o algoritmo do ponto médio.
+    
+    REQUISITO: (b) Primitivas de Rasterização - Elipse
+    
+    Características:
+    - Divide o desenho em 2 regiões para precisão
+    - Usa apenas aritmética inteira
+    - Suporta elipses de qualquer proporção
+    - Todos os pixels são escritos de uma vez com set_pixels
+    - O traçado de cada (rx, ry) é calculado uma vez (molde_elipse) e
+      apenas transladado para o centro nas chamadas seguintes
+    
+    Args:
+        xc, yc: Centro da elipse
+        rx: Raio no eixo X
+        ry: Raio no eixo Y
+        cor: Cor da elipse
+    
+    Usado no jogo para: peixes, ondas, elementos decorativos.
+    """
+    dx, dy = molde_elipse(rx, ry)
+    set_pixels(superficie, dx + xc, dy + yc, cor)
@@ -7,15 +7,29 @@
 # Algoritmos implementados:
 # - DDA (Digital Differential Analyzer)
 # - Bresenham (mais eficiente, usado no projeto)
+# - Bresenham em lote: várias retas de uma vez (NumPy)
+# - Xiaolin Wu: retas com antialiasing (NumPy)
+#
+# As duas versões de Bresenham podem recortar a reta
+# contra a superfície antes de percorrê-la: o trecho
+# visível é calculado direto da forma fechada do passo
+# (ver _recorte_bresenham) e o laço começa no estado
+# exato do primeiro pixel visível, então o resultado é
+# o mesmo da reta inteira e o custo só depende do
+# trecho que aparece.
 # ═══════════════════════════════════════════════════════
 
-from engine.framebuffer import set_pixel
+import numpy as np
+
+from engine.framebuffer import blend_pixels, fill_column, fill_span, mapear_cor, set_pixel, set_pixels
 
 # ─── Algoritmo DDA ───
-def dda(superficie, x0, y0, x1, y1, cor):
+def pontos_dda(x0, y0, x1, y1):
     """
-    Algoritmo DDA para rasterização de linhas.
-    Usa aritmética de ponto flutuante.
+    Calcula os pixels da reta pelo algoritmo DDA, sem desenhar.
+
+    Returns:
+        (xs, ys): listas com as coordenadas dos pixels, na ordem do traçado.
     """
     dx = x1 - x0
     dy = y1 - y0
@@ -23,8 +37,7 @@ def dda(superficie, x0, y0, x1, y1, cor):
     passos = max(abs(dx), abs(dy))
 
     if passos == 0:
-        set_pixel(superficie, x0, y0, cor)
-        return
+        return [x0], [y0]
 
     x_inc = dx / passos
     y_inc = dy / passos
@@ -32,25 +45,77 @@ def dda(superficie, x0, y0, x1, y1, cor):
     x = x0
     y = y0
 
+    xs = []
+    ys = []
     for _ in range(passos + 1):
-        set_pixel(superficie, round(x), round(y), cor)
+        xs.append(round(x))
+        ys.append(round(y))
         x += x_inc
         y += y_inc
+    return xs, ys
+
+def dda(superficie, x0, y0, x1, y1, cor):
+    """
+    Algoritmo DDA para rasterização de linhas.
+    Usa aritmética de ponto flutuante.
+    """
+    cor = mapear_cor(superficie, cor)  # mapeada uma vez para o segmento inteiro
+    for x, y in zip(*pontos_dda(x0, y0, x1, y1)):
+        set_pixel(superficie, x, y, cor)
 
 # ─── Algoritmo de Bresenham ───
-def bresenham(superficie, x0, y0, x1, y1, cor):
+# Abaixo disso, um set_pixel por pixel sai mais barato que um set_pixels
+_MINIMO_LOTE = 32
+
+
+def _recorte_bresenham(a0, b0, dx, dy, passo, limite_a, limite_b):
     """
-    Algoritmo de Bresenham para rasterização de linhas.
-    
-    REQUISITO: (b) Primitivas de Rasterização - Linha
-    
-    Mais eficiente que DDA por usar apenas aritmética inteira.
-    Usado em todo o projeto para desenho de linhas e polígonos.
-    
-    Características:
-    - Apenas operações inteiras (sem ponto flutuante)
-    - Suporta linhas em todas as direções
-    - Trata casos especiais (linhas verticais/horizontais)
+    Intervalo [k_inicio, k_fim] dos passos visíveis de uma reta normalizada.
+
+    A reta já normalizada (eixo principal "a" crescente, 0 <= dy <= dx)
+    tem o pixel k em a = a0 + k e b = b0 + passo * c(k), com
+    c(k) = (2*dy*k + dx - 1) // (2*dx) (ver pontos_bresenham_lote).
+    Como a e c(k) são monótonos em k, as condições 0 <= a < limite_a e
+    0 <= b < limite_b viram limites inteiros para k, sem percorrer a reta.
+
+    Returns:
+        (k_inicio, k_fim); vazio se k_inicio > k_fim.
+    """
+    k_inicio = max(0, -a0)
+    k_fim = min(dx, limite_a - 1 - a0)
+    # Faixa de c que mantém b dentro de [0, limite_b - 1]
+    if passo > 0:
+        c_min, c_max = -b0, limite_b - 1 - b0
+    else:
+        c_min, c_max = b0 - (limite_b - 1), b0
+    if c_max < 0 or (dy == 0 and c_min > 0):
+        return 0, -1
+    if dy > 0:
+        if c_min > 0:
+            # menor k com c(k) >= c_min
+            k_inicio = max(k_inicio, -((dx - 1 - 2 * dx * c_min) // (2 * dy)))
+        # maior k com c(k) <= c_max
+        k_fim = min(k_fim, (2 * dx * (c_max + 1) - dx) // (2 * dy))
+    return k_inicio, k_fim
+
+
+def pontos_bresenham(x0, y0, x1, y1, limites=None):
+    """
+    Calcula os pixels da reta pelo algoritmo de Bresenham, sem desenhar.
+
+    Permite que o chamador junte os pixels de várias retas e os
+    escreva de uma vez com `set_pixels`.
+
+    Args:
+        x0, y0, x1, y1: extremos da reta
+        limites: (largura, altura) opcional. Com extremos inteiros, só o
+            trecho dentro de [0, largura) x [0, altura) é percorrido: o
+            laço começa no estado exato (x, y, d) do primeiro pixel
+            visível e para no último. Com extremos fracionários a reta
+            é calculada inteira.
+
+    Returns:
+        (xs, ys): listas com as coordenadas dos pixels, na ordem do traçado.
     """
     steep = abs(y1 - y0) > abs(x1 - x0)
     if steep:
@@ -77,11 +142,33 @@ def bresenham(superficie, x0, y0, x1, y1, cor):
     x = x0
     y = y0
 
+    if limites is not None:
+        largura, altura = limites
+        if steep:
+            largura, altura = altura, largura
+        # Extremos na tela: a reta inteira é visível, nada a recortar
+        if 0 <= x0 and x1 < largura and 0 <= min(y0, y1) and max(y0, y1) < altura:
+            limites = None
+    if limites is not None and x0 == int(x0) and y0 == int(y0) and x1 == int(x1) and y1 == int(y1):
+        k_inicio, k_fim = _recorte_bresenham(int(x0), int(y0), int(dx), int(dy), ystep, largura, altura)
+        if k_inicio > k_fim:
+            return [], []
+        # Estado do laço depois de k_inicio passos
+        c = (2 * dy * k_inicio + dx - 1) // (2 * dx) if dx else 0
+        x = x0 + k_inicio
+        y = y0 + ystep * c
+        d += incE * k_inicio - 2 * dx * c
+        x1 = x0 + k_fim
+
+    xs = []
+    ys = []
     while x <= x1:
         if steep:
-            set_pixel(superficie, y, x, cor)
+            xs.append(y)
+            ys.append(x)
         else:
-            set_pixel(superficie, x, y, cor)
+            xs.append(x)
+            ys.append(y)
 
         if d <= 0:
             d += incE
@@ -90,20 +177,321 @@ def bresenham(superficie, x0, y0, x1, y1, cor):
             y += ystep
 
         x += 1
+    return xs, ys
+
+def bresenham(superficie, x0, y0, x1, y1, cor):
+    """
+    Algoritmo de Bresenham para rasterização de linhas.
+    
+    REQUISITO: (b) Primitivas de Rasterização - Linha
+    
+    Mais eficiente que DDA por usar apenas aritmética inteira.
+    Usado em todo o projeto para desenho de linhas e polígonos.
+    
+    Características:
+    - Apenas operações inteiras (sem ponto flutuante)
+    - Suporta linhas em todas as direções
+    - Trata casos especiais (linhas verticais/horizontais)
+
+    Retas horizontais e verticais com extremos inteiros não passam pelo
+    laço de decisão: viram um único fill_span ou fill_column. As demais
+    são recortadas contra a superfície antes do laço (só o trecho
+    visível é percorrido) e, se longas, escritas com um único set_pixels.
+    """
+    if _reta_alinhada(superficie, x0, y0, x1, y1, cor):
+        return
+    cor = mapear_cor(superficie, cor)  # mapeada uma vez para o segmento inteiro
+    xs, ys = pontos_bresenham(x0, y0, x1, y1, superficie.get_size())
+    if len(xs) >= _MINIMO_LOTE:
+        set_pixels(superficie, xs, ys, cor)
+        return
+    for x, y in zip(xs, ys):
+        set_pixel(superficie, x, y, cor)
+
+def _reta_alinhada(superficie, x0, y0, x1, y1, cor):
+    """
+    Desenha a reta com uma única escrita se ela for horizontal ou vertical.
+
+    Nesses casos o Bresenham nunca dá passo no eixo secundário, então
+    os pixels são exatamente o intervalo entre os extremos. Só vale
+    para extremos inteiros (ou floats inteiros): com frações, o laço
+    trunca cada pixel e o intervalo poderia ganhar um pixel a mais.
+
+    Returns:
+        True se a reta foi desenhada, False se deve seguir pelo laço.
+    """
+    if y0 != y1 and x0 != x1:
+        return False
+    if x0 != int(x0) or y0 != int(y0) or x1 != int(x1) or y1 != int(y1):
+        return False
+    if y0 == y1:
+        fill_span(superficie, y0, min(x0, x1), max(x0, x1), cor)
+    else:
+        fill_column(superficie, x0, min(y0, y1), max(y0, y1), cor)
+    return True
+
+# ─── Bresenham em Lote (NumPy) ───
+def pontos_bresenham_lote(segmentos, limites=None):
+    """
+    Calcula os pixels de várias retas de Bresenham com operações de array.
+
+    Para cada reta, depois da mesma normalização de pontos_bresenham
+    (troca de eixos se for íngreme, x0 <= x1), o k-ésimo pixel tem
+    x = x0 + k e y = y0 + ystep * c(k), onde c(k) é quantas vezes o
+    laço escalar teria somado incNE até ali. O critério de decisão
+    (d > 0, com d = 2*dy - dx + 2*dy*k - 2*dx*c) tem forma fechada:
+
+        c(k) = (2*dy*k + dx - 1) // (2*dx)
+
+    então todos os pixels de todas as retas saem de uma vez, idênticos
+    aos de pontos_bresenham (mesma ordem de traçado, retas em sequência).
+
+    Args:
+        segmentos: array (N, 4) ou sequência de (x0, y0, x1, y1) inteiros
+        limites: (largura, altura) opcional; cada reta é recortada antes
+            de gerar os pixels e só os visíveis são devolvidos (mesmos
+            limites de _recorte_bresenham, calculados para o lote)
+
+    Returns:
+        (xs, ys, reta): arrays com as coordenadas dos pixels e o índice
+        da reta de cada pixel.
+    """
+    segmentos = np.asarray(segmentos, dtype=np.int64).reshape(-1, 4)
+    x0, y0, x1, y1 = segmentos.T
+
+    # Normalização: eixo principal "a" (x, ou y se íngreme) crescente
+    ingreme = np.abs(y1 - y0) > np.abs(x1 - x0)
+    a0, b0 = np.where(ingreme, y0, x0), np.where(ingreme, x0, y0)
+    a1, b1 = np.where(ingreme, y1, x1), np.where(ingreme, x1, y1)
+    troca = a0 > a1
+    a0, a1 = np.where(troca, a1, a0), np.where(troca, a0, a1)
+    b0, b1 = np.where(troca, b1, b0), np.where(troca, b0, b1)
+
+    dx = a1 - a0
+    dy = b1 - b0
+    passo = np.where(dy < 0, -1, 1)
+    dy = np.abs(dy)
+
+    # Um pixel por unidade do eixo principal, de k_inicio a k_fim
+    k_inicio = np.zeros_like(dx)
+    k_fim = dx
+    if limites is not None and len(segmentos) > 0 and not (
+        a0.min() >= 0 and b0.min() >= 0 and b1.min() >= 0
+        and a1.max() < min(limites) and max(b0.max(), b1.max()) < min(limites)
+    ):
+        k_inicio, k_fim = _recorte_bresenham_lote(a0, b0, dx, dy, passo, ingreme, limites)
+    quantidades = np.maximum(k_fim - k_inicio + 1, 0)
+    reta = np.repeat(np.arange(len(segmentos)), quantidades)
+    inicio = np.cumsum(quantidades) - quantidades
+    k = np.arange(reta.size) - inicio[reta] + k_inicio[reta]
+
+    dx_k = dx[reta]
+    c = (2 * dy[reta] * k + dx_k - 1) // np.maximum(2 * dx_k, 1)
+    np.maximum(c, 0, out=c)  # reta de um só pixel (dx = 0)
+
+    a = a0[reta] + k
+    b = b0[reta] + passo[reta] * c
+    ingreme_k = ingreme[reta]
+    xs = np.where(ingreme_k, b, a)
+    ys = np.where(ingreme_k, a, b)
+    return xs, ys, reta
+
+
+def _recorte_bresenham_lote(a0, b0, dx, dy, passo, ingreme, limites):
+    """Versão vetorizada de _recorte_bresenham: (k_inicio, k_fim) de cada reta."""
+    largura, altura = limites
+    limite_a = np.where(ingreme, altura, largura)
+    limite_b = np.where(ingreme, largura, altura)
+    k_inicio = np.maximum(-a0, 0)
+    k_fim = np.minimum(dx, limite_a - 1 - a0)
+
+    c_min = np.where(passo > 0, -b0, b0 - (limite_b - 1))
+    c_max = np.where(passo > 0, limite_b - 1 - b0, b0)
+    dy_2 = np.maximum(2 * dy, 1)  # dy = 0 é tratado à parte abaixo
+    k_inicio = np.where(c_min > 0, np.maximum(k_inicio, -((dx - 1 - 2 * dx * c_min) // dy_2)), k_inicio)
+    k_fim = np.where(dy > 0, np.minimum(k_fim, (2 * dx * (c_max + 1) - dx) // dy_2), k_fim)
+    # Fora da faixa de b: nenhum pixel (inclui retas com dy = 0 fora da tela)
+    k_fim = np.where((c_max < 0) | ((dy == 0) & (c_min > 0)), -1, k_fim)
+    return k_inicio, k_fim
+
+
+def bresenham_lote(superficie, segmentos, cor):
+    """
+    Desenha várias retas de Bresenham com uma única escrita em lote.
+
+    Equivale a chamar bresenham para cada segmento, em ordem (onde as
+    retas se cruzam prevalece a última), mas os pixels são calculados
+    por pontos_bresenham_lote e escritos com um único set_pixels. Cada
+    reta é recortada contra a superfície antes: só os pixels visíveis
+    são gerados.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer
+        segmentos: array (N, 4) ou sequência de (x0, y0, x1, y1) inteiros
+        cor: uma cor para todas as retas, ou um array com uma cor por
+            reta: (N, 3) em RGB ou (N,) já empacotado
+
+    Exemplo:
+        bresenham_lote(fb, [(0, 0, 100, 40), (0, 40, 100, 0)], (255, 255, 255))
+    """
+    xs, ys, reta = pontos_bresenham_lote(segmentos, superficie.get_size())
+    if isinstance(cor, np.ndarray):
+        cor = cor[reta]
+    set_pixels(superficie, xs, ys, cor)
+
+
+# ─── Xiaolin Wu (Antialiasing) ───
+def pontos_wu_lote(segmentos):
+    """
+    Calcula os pixels e as coberturas de várias retas de Xiaolin Wu.
+
+    Para cada coluna do eixo principal a reta passa entre dois pixels
+    do eixo secundário; cada um recebe a fração da reta que o cobre
+    (1 - parte fracionária de y e a parte fracionária de y). Os
+    extremos são arredondados para o pixel mais próximo e ponderados
+    pela fração horizontal que a reta ocupa neles (xgap), como no
+    algoritmo original. A interseção de cada coluna vem direto de
+    y = yend + gradiente * k, sem acumular no laço, então todas as
+    colunas de todas as retas são calculadas de uma vez.
+
+    Args:
+        segmentos: array (N, 4) ou sequência de (x0, y0, x1, y1); aceita
+            coordenadas fracionárias (vértices girados ou escalados)
+
+    Returns:
+        (xs, ys, cobertura): arrays com os pixels (inteiros) e a
+        cobertura de cada um, de 0 a 1.
+    """
+    segmentos = np.asarray(segmentos, dtype=np.float64).reshape(-1, 4)
+    x0, y0, x1, y1 = segmentos.T
+
+    # Normalização: eixo principal "a" crescente, como em Bresenham
+    ingreme = np.abs(y1 - y0) > np.abs(x1 - x0)
+    a0, b0 = np.where(ingreme, y0, x0), np.where(ingreme, x0, y0)
+    a1, b1 = np.where(ingreme, y1, x1), np.where(ingreme, x1, y1)
+    troca = a0 > a1
+    a0, a1 = np.where(troca, a1, a0), np.where(troca, a0, a1)
+    b0, b1 = np.where(troca, b1, b0), np.where(troca, b0, b1)
+
+    dx = a1 - a0
+    gradiente = np.divide(b1 - b0, dx, out=np.ones_like(dx), where=dx != 0)
+
+    # Extremos: pixel mais próximo, ponderado pela fração coberta
+    a_ini = np.floor(a0 + 0.5)
+    b_ini = b0 + gradiente * (a_ini - a0)
+    gap_ini = 1 - ((a0 + 0.5) - np.floor(a0 + 0.5))
+    a_fim = np.floor(a1 + 0.5)
+    b_fim = b1 + gradiente * (a_fim - a1)
+    gap_fim = (a1 + 0.5) - np.floor(a1 + 0.5)
+
+    # Colunas internas: a_ini + 1 ... a_fim - 1
+    quantidades = np.maximum(a_fim - a_ini - 1, 0).astype(np.int64)
+    reta = np.repeat(np.arange(len(segmentos)), quantidades)
+    inicio = np.cumsum(quantidades) - quantidades
+    k = np.arange(reta.size) - inicio[reta] + 1
+
+    a = np.concatenate([a_ini, a_fim, a_ini[reta] + k])
+    b = np.concatenate([b_ini, b_fim, b_ini[reta] + gradiente[reta] * k])
+    peso = np.concatenate([gap_ini, gap_fim, np.ones(reta.size)])
+    ingreme = np.concatenate([ingreme, ingreme, ingreme[reta]])
+
+    # Par de pixels de cada coluna: floor(b) e floor(b) + 1
+    b_int = np.floor(b)
+    fracao = b - b_int
+    a = np.tile(a, 2).astype(np.int64)
+    b = np.concatenate([b_int, b_int + 1]).astype(np.int64)
+    cobertura = np.concatenate([(1 - fracao) * peso, fracao * peso])
+    ingreme = np.tile(ingreme, 2)
+
+    xs = np.where(ingreme, b, a)
+    ys = np.where(ingreme, a, b)
+    return xs, ys, cobertura
+
+
+def wu_lote(superficie, segmentos, cor):
+    """
+    Desenha várias retas com antialiasing (Xiaolin Wu) em uma só mistura.
+
+    As coberturas de todas as retas são misturadas na superfície com um
+    único blend_pixels: os pixels atuais são lidos do array, misturados
+    com a cor e reescritos em lote. Onde as retas se encontram (vértices
+    de um polígono), as coberturas se acumulam.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer
+        segmentos: array (N, 4) ou sequência de (x0, y0, x1, y1)
+        cor: tupla (R, G, B) ou inteiro empacotado
+
+    Exemplo:
+        wu_lote(fb, [(0, 0, 100, 40), (0, 40, 100, 0)], (255, 255, 255))
+    """
+    xs, ys, cobertura = pontos_wu_lote(segmentos)
+    blend_pixels(superficie, xs, ys, cor, cobertura)
+
+
+def wu(superficie, x0, y0, x1, y1, cor):
+    """
+    Algoritmo de Xiaolin Wu para retas com antialiasing.
+
+    REQUISITO: (b) Primitivas de Rasterização - Linha
+
+    Em vez de acender um pixel por coluna, como dda e bresenham, acende
+    os dois pixels entre os quais a reta passa, com intensidades
+    proporcionais à distância até eles: a cor é misturada com o fundo
+    em vez de sobrescrevê-lo, e retas inclinadas perdem o serrilhado.
+    Mesmos parâmetros de bresenham; as coordenadas podem ser
+    fracionárias.
+    """
+    wu_lote(superficie, ((x0, y0, x1, y1),), cor)
+
 
 # ─── Desenho de Polígonos ───
-def desenhar_poligono(tela, pontos, cor):
+def desenhar_poligono(tela, pontos, cor, antialias=False):
     """
     Desenha o contorno de um polígono conectando seus vértices.
     
     Usado para criar formas complexas no jogo (jangada, obstáculos, etc).
-    Utiliza o algoritmo de Bresenham para cada aresta.
+    Utiliza o algoritmo de Bresenham para cada aresta e escreve os
+    pixels de todas as arestas de uma vez com `set_pixels`.
+
+    Com vértices inteiros, as arestas horizontais e verticais (bordas de
+    botões e caixas) são escritas como um intervalo cada e as demais
+    são rasterizadas juntas por bresenham_lote; vértices fracionários
+    seguem o laço escalar, que os trata em ponto flutuante. Como o
+    contorno tem uma só cor, a ordem das escritas não muda o resultado.
+
+    Com antialias=True as arestas são desenhadas com Xiaolin Wu
+    (wu_lote), misturadas com o que já está na superfície. Não serve
+    para entidades em cache de sprites (a mistura ficaria com o fundo
+    do sprite).
     """
     n = len(pontos)
     if n < 3:
         return
 
+    if antialias:
+        vertices = np.asarray(pontos, dtype=np.float64)
+        wu_lote(tela, np.hstack([vertices, np.roll(vertices, -1, axis=0)]), cor)
+        return
+
+    vertices = np.asarray(pontos, dtype=np.float64)
+    if np.array_equal(vertices, np.floor(vertices)):
+        arestas = np.hstack([vertices, np.roll(vertices, -1, axis=0)]).astype(np.int64)
+        alinhadas = (arestas[:, 0] == arestas[:, 2]) | (arestas[:, 1] == arestas[:, 3])
+        if alinhadas.any():
+            valor = mapear_cor(tela, cor)
+            for x0, y0, x1, y1 in arestas[alinhadas].tolist():
+                _reta_alinhada(tela, x0, y0, x1, y1, valor)
+        if not alinhadas.all():
+            bresenham_lote(tela, arestas[~alinhadas], cor)
+        return
+
+    xs = []
+    ys = []
     for i in range(n):
         x0, y0 = pontos[i]
         x1, y1 = pontos[(i + 1) % n]
-        bresenham(tela, x0, y0, x1, y1, cor)
\ No newline at end of file
+        ax, ay = pontos_bresenham(x0, y0, x1, y1)
+        xs.extend(ax)
+        ys.extend(ay)
+    set_pixels(tela, xs, ys, cor)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+# ═══════════════════════════════════════════════════════
+# SPRITES PRÉ-RASTERIZADOS
+# ═══════════════════════════════════════════════════════
+# Peixe, obstáculos e jangada têm sempre a mesma forma:
+# só a posição muda de um quadro para outro. Em vez de
+# recalcular elipses, senos e gradientes a cada quadro,
+# a entidade é desenhada uma única vez, com as mesmas
+# primitivas de set_pixel, em um FrameBuffer fora da
+# tela, junto com a máscara dos pixels que ela escreveu.
+# Depois disso, desenhá-la em qualquer posição é uma
+# única cópia mascarada (np.copyto com where=).
+#
+# Os sprites ficam em um cache LRU indexado pelo formato
+# de pixel, pela função de desenho e pelos argumentos
+# dela (cor, tamanho...): o menos usado é descartado
+# quando o limite de entradas é atingido.
+#
+# O scanline arredonda as interseções com round() (metade
+# para o par), que só é invariante a translações pares:
+# cada sprite é rasterizado com a mesma paridade de x e y
+# da posição de destino, para que o carimbo seja idêntico
+# ao desenho direto.
+# ═══════════════════════════════════════════════════════
+
+from collections import OrderedDict
+
+import numpy as np
+
+from engine.framebuffer import FrameBuffer, set_pixels, travar
+
+# Fundos usados para descobrir a máscara: um pixel foi escrito pela
+# entidade se difere do fundo em pelo menos uma das duas renderizações
+# (assim até pixels pretos, valor 0, entram na máscara).
+_FUNDOS = (0x00000000, 0xFFFFFFFF)
+
+
+# ─── Sprite ───
+class Sprite:
+    """
+    Entidade já rasterizada: pixels empacotados e máscara.
+
+    Atributos:
+        pixels: array uint32 (altura, largura) no formato do destino
+        mascara: array bool (altura, largura), True onde há pixel
+        dx, dy: deslocamento do canto superior esquerdo em relação ao
+            ponto de referência da entidade (o x, y passado ao desenho)
+        largura, altura: dimensões do sprite (já recortado à máscara)
+    """
+
+    def __init__(self, pixels, mascara, dx, dy):
+        self.pixels = pixels
+        self.mascara = mascara
+        self.dx = dx
+        self.dy = dy
+        self.altura, self.largura = pixels.shape
+
+    @property
+    def bytes(self):
+        """Memória ocupada pelos pixels e pela máscara."""
+        return self.pixels.nbytes + self.mascara.nbytes
+
+
+def rasterizar_sprite(superficie, desenhar, raio, *argumentos, paridade=(0, 0)):
+    """
+    Desenha uma entidade uma vez fora da tela e devolve o Sprite.
+
+    A função de desenho é chamada como desenhar(fb, cx, cy, *argumentos)
+    em um FrameBuffer quadrado com pelo menos `raio` pixels em volta de
+    (cx, cy), duas vezes, com fundos diferentes, para separar os pixels
+    escritos do fundo. O resultado é recortado à caixa envolvente da
+    máscara.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer que define o formato
+        desenhar: função desenhar(superficie, x, y, *argumentos)
+        raio: distância máxima, em pixels, de qualquer pixel da entidade
+            ao ponto (x, y); o que passar disso é cortado
+        argumentos: demais argumentos da função (cor, tamanho...)
+        paridade: (x % 2, y % 2) das posições onde o sprite será
+            carimbado; cx e cy têm essa mesma paridade
+    """
+    formato = superficie.formato if isinstance(superficie, FrameBuffer) else superficie
+    base = raio + (raio & 1)  # par, >= raio
+    cx, cy = base + paridade[0], base + paridade[1]
+    lado = 2 * base + 2
+    camadas = []
+    for fundo in _FUNDOS:
+        fb = FrameBuffer(lado, lado, formato)
+        fb.pixels.fill(fundo)
+        desenhar(fb, cx, cy, *argumentos)
+        camadas.append(fb.pixels)
+    mascara = (camadas[0] != _FUNDOS[0]) | (camadas[1] != _FUNDOS[1])
+
+    linhas = np.flatnonzero(mascara.any(axis=1))
+    colunas = np.flatnonzero(mascara.any(axis=0))
+    if len(linhas) == 0:
+        vazio = np.zeros((0, 0), dtype=np.uint32)
+        return Sprite(vazio, vazio.astype(bool), 0, 0)
+    y0, y1 = linhas[0], linhas[-1] + 1
+    x0, x1 = colunas[0], colunas[-1] + 1
+    pixels = np.ascontiguousarray(camadas[0][y0:y1, x0:x1])
+    mascara = np.ascontiguousarray(mascara[y0:y1, x0:x1])
+    pixels.setflags(write=False)
+    mascara.setflags(write=False)
+    return Sprite(pixels, mascara, int(x0) - cx, int(y0) - cy)
+
+
+def carimbar(superficie, sprite, x, y):
+    """
+    Copia o sprite para a superfície com o ponto de referência em (x, y).
+
+    O retângulo do sprite é recortado uma vez contra a superfície e
+    copiado com np.copyto(..., where=mascara): os pixels fora da
+    máscara mantêm o que já estava desenhado.
+
+    Args:
+        superficie: pygame.Surface ou FrameBuffer onde desenhar
+        sprite: Sprite (ver rasterizar_sprite)
+        x, y: posição do ponto de referência da entidade
+    """
+    x0 = int(x) + sprite.dx
+    y0 = int(y) + sprite.dy
+    with travar(superficie) as alvo:
+        largura, altura = alvo.get_width(), alvo.get_height()
+        xa, ya = max(x0, 0), max(y0, 0)
+        xb = min(x0 + sprite.largura, largura)
+        yb = min(y0 + sprite.altura, altura)
+        if xa >= xb or ya >= yb:
+            return
+
+        if not isinstance(alvo, FrameBuffer):
+            # Formatos sem visão direta dos pixels: escrita em lote
+            ys, xs = np.nonzero(sprite.mascara)
+            set_pixels(alvo, xs + x0, ys + y0, sprite.pixels[ys, xs])
+            return
+
+        recorte = (slice(ya - y0, yb - y0), slice(xa - x0, xb - x0))
+        np.copyto(alvo.pixels[ya:yb, xa:xb], sprite.pixels[recorte], where=sprite.mascara[recorte])
+        alvo.marcar_sujo(xa, ya, xb, yb)
+
+
+# ─── Cache ───
+class CacheSprites:
+    """
+    Cache LRU de sprites.
+
+    A chave é (formato de pixel, função de desenho, raio, argumentos,
+    paridade da posição): peixes de cores diferentes ou obstáculos de
+    tamanhos diferentes são sprites diferentes. Ao passar de `limite`
+    entradas ou de `limite_bytes` de memória, os sprites usados há mais
+    tempo são descartados.
+
+    Args:
+        limite: número máximo de sprites guardados
+        limite_bytes: memória máxima (pixels + máscaras) ou None
+
+    Exemplo:
+        sprites = CacheSprites()
+        sprites.desenhar(fb, draw_fish, x, y, color.FISH_GOLD, raio=20)
+    """
+
+    def __init__(self, limite=64, limite_bytes=None):
+        self.limite = limite
+        self.limite_bytes = limite_bytes
+        self._sprites = OrderedDict()
+        self.bytes = 0  # memória dos sprites guardados
+        self.acertos = 0
+        self.faltas = 0
+        self.descartes = 0
+
+    def obter(self, superficie, desenhar, raio, *argumentos, paridade=(0, 0)):
+        """Retorna o Sprite da entidade, rasterizando-o só na primeira vez."""
+        formato = superficie.formato if isinstance(superficie, FrameBuffer) else superficie
+        chave = (
+            formato.get_bitsize(), formato.get_masks(), formato.get_shifts(),
+            formato.get_losses(), desenhar, raio, argumentos, paridade,
+        )
+        try:
+            sprite = self._sprites[chave]
+        except KeyError:
+            self.faltas += 1
+            sprite = rasterizar_sprite(formato, desenhar, raio, *argumentos, paridade=paridade)
+            self._sprites[chave] = sprite
+            self.bytes += sprite.bytes
+            self._descartar()
+            return sprite
+        self.acertos += 1
+        self._sprites.move_to_end(chave)
+        return sprite
+
+    def desenhar(self, superficie, desenhar, x, y, *argumentos, raio):
+        """
+        Desenha a entidade em (x, y) carimbando o sprite em cache.
+
+        Equivale a desenhar(superficie, x, y, *argumentos) para x e y
+        inteiros, desde que a entidade caiba em `raio`.
+        """
+        x, y = int(x), int(y)
+        sprite = self.obter(superficie, desenhar, raio, *argumentos, paridade=(x & 1, y & 1))
+        carimbar(superficie, sprite, x, y)
+
+    def _descartar(self):
+        """Remove os sprites menos usados até respeitar os limites (o mais novo fica)."""
+        while len(self._sprites) > 1 and (
+            len(self._sprites) > self.limite
+            or (self.limite_bytes is not None and self.bytes > self.limite_bytes)
+        ):
+            _, sprite = self._sprites.popitem(last=False)
+            self.bytes -= sprite.bytes
+            self.descartes += 1
+
+    def estatisticas(self):
+        """Resumo do cache: sprites, bytes, acertos, faltas e descartes."""
+        return {
+            "sprites": len(self._sprites), "bytes": self.bytes,
+            "acertos": self.acertos, "faltas": self.faltas, "descartes": self.descartes,
+        }
+
+    def limpar(self):
+        """Descarta todos os sprites (ex.: depois de trocar o modo de vídeo)."""
+        self._sprites.clear()
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._sprites)
+
+
+# Cache compartilhado pelas entidades do jogo
+sprites = CacheSprites()
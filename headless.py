@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Renderização headless das cenas do jogo (sem janela e sem áudio).
+
+Desenha quadros do gameplay, da introdução, do menu e dos slides da
+história em um FrameBuffer em memória, mede o tempo por quadro e,
+opcionalmente, grava o último quadro de cada cena em PPM ou PNG.
+Serve para medir desempenho em máquinas de build sem monitor nem
+placa de som.
+
+Uso:
+    python headless.py
+    python headless.py --cenas gameplay menu --quadros 300
+    python headless.py --saida quadros --formato png
+"""
+
+import argparse
+import math
+import os
+import random
+
+import pygame
+
+import assets.colors as color
+import app.scenes.auxiliary_functions as auxiliar
+import app.scenes.gameplay as gameplay
+import app.scenes.history as history
+import app.scenes.intro as intro
+import app.scenes.menu as menu
+import app.entities.raft as raft
+import engine.headless as headless
+from engine.sprite import sprites
+
+LARGURA, ALTURA = 1000, 800
+TEXTURAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "textures")
+CENAS = ("gameplay", "intro", "menu", "historia")
+
+
+# ─── Cenas ───
+def preparar_gameplay(quadro):
+    """
+    Retorna a função que desenha o quadro i de uma partida simulada:
+    a jangada percorre uma elipse no mundo e gira 360° a cada 120 quadros.
+    """
+    world = (3000, 3000)
+    cores = color.empacotadas(quadro)
+    fish_x, fish_y_base = 1700, 1400
+    obstaculos = gameplay.gerar_obstaculos(fish_x, fish_y_base, *world)
+    cena = gameplay.criar_cena(obstaculos)
+
+    def desenhar(i):
+        raft_x = 1500 + int(400 * math.cos(i * 0.02))
+        raft_y = 1500 + int(300 * math.sin(i * 0.02))
+        viewport = gameplay.calcular_viewport(raft_x, raft_y, LARGURA, ALTURA, *world)
+        fish_animation_offset = i * 0.15
+        fish_y = fish_y_base + math.sin(fish_animation_offset) * 8
+        fase = i % 120
+        raft_angle = fase / 60 * 2 * math.pi if fase < 60 else 0.0
+        hud_scale = 3 if fase < 60 else 2
+        gameplay.draw_frame(
+            quadro, cores,
+            viewport, world,
+            raft_x, raft_y, raft_angle,
+            fish_x, fish_y_base, fish_y, fish_animation_offset,
+            obstaculos, 2, 3, hud_scale,
+            cena=cena
+        )
+
+    return desenhar
+
+
+def preparar_intro(quadro):
+    """Retorna a função que desenha o quadro i da introdução (com a subida do mar no fim)."""
+    textura_ceu = pygame.image.load(os.path.join(TEXTURAS, "ceu.png")).convert()
+    textura_areia = pygame.image.load(os.path.join(TEXTURAS, "areia.png")).convert()
+    cx = LARGURA // 2 - 200
+    cy = ALTURA // 2 + 60
+
+    def desenhar(i):
+        dx = min(-330 + 33 * i, 0)
+        dy = max(120 - 2 * i, 0)
+        raft_dx = int(6 * math.sin(i))
+        mar_offset = min((i % 60) * 4, ALTURA // 2) if i % 120 >= 60 else None
+        intro.draw_intro_frame(
+            quadro, LARGURA, ALTURA, textura_ceu, textura_areia,
+            raft_dx, cx, cy, dx, dy, mar_offset
+        )
+
+    return desenhar
+
+
+def preparar_menu(quadro):
+    """Retorna a função que desenha o menu principal."""
+    def desenhar(i):
+        menu.draw_menu_frame(quadro)
+
+    return desenhar
+
+
+def preparar_historia(quadro):
+    """Retorna a função que desenha os slides da história em sequência."""
+    def desenhar(i):
+        history.draw_slide(quadro, i % len(history.slides))
+
+    return desenhar
+
+
+PREPARAR = {
+    "gameplay": preparar_gameplay,
+    "intro": preparar_intro,
+    "menu": preparar_menu,
+    "historia": preparar_historia,
+}
+
+
+# ─── Execução ───
+def main():
+    parser = argparse.ArgumentParser(description="Renderiza as cenas do jogo sem janela.")
+    parser.add_argument("--cenas", nargs="+", choices=CENAS, default=list(CENAS),
+                        help="cenas a renderizar (padrão: todas)")
+    parser.add_argument("--quadros", type=int, default=60, help="quadros por cena (padrão: 60)")
+    parser.add_argument("--saida", help="pasta onde gravar o último quadro de cada cena")
+    parser.add_argument("--formato", choices=("ppm", "png"), default="ppm",
+                        help="formato das imagens gravadas (padrão: ppm)")
+    args = parser.parse_args()
+
+    quadro = headless.iniciar(LARGURA, ALTURA)
+    if args.saida:
+        os.makedirs(args.saida, exist_ok=True)
+
+    print(f"{'cena':<10} {'quadros':>8} {'ms/quadro':>10} {'quadros/s':>10}")
+    for cena in args.cenas:
+        # Sementes fixas: as mesmas estrelas e obstáculos a cada execução
+        auxiliar._seed = 123456789
+        random.seed(42)
+
+        desenhar = PREPARAR[cena](quadro)
+        resultado = headless.medir(desenhar, args.quadros)
+        print(f"{cena:<10} {resultado['quadros']:>8} "
+              f"{resultado['ms_por_quadro']:>10.2f} {resultado['quadros_por_segundo']:>10.1f}")
+
+        if args.saida:
+            headless.salvar_quadro(quadro, os.path.join(args.saida, f"{cena}.{args.formato}"))
+
+    # Memória dos sprites pré-rasterizados (peixe, obstáculos, jangada girada)
+    print(f"\n{'cache':<10} {'sprites':>8} {'KB':>10} {'faltas':>8} {'descartes':>10}")
+    for nome, cache in (("sprites", sprites), ("jangada", raft.quadros_jangada)):
+        dados = cache.estatisticas()
+        print(f"{nome:<10} {dados['sprites']:>8} {dados['bytes'] / 1024:>10.1f} "
+              f"{dados['faltas']:>8} {dados['descartes']:>10}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()